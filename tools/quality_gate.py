@@ -11,10 +11,13 @@ import argparse
 import ast
 import fnmatch
 import json
+import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
 from typing import Iterable
 
@@ -97,6 +100,17 @@ SECRET_PATTERNS = (
     ),
 )
 
+# Checks run by QualityGate.run, in report order. check_syntax is listed
+# as its three parts so they can run in parallel too.
+CHECKS = (
+    "check_tracked_ignored_files",
+    "check_secret_patterns",
+    "check_yaml_syntax",
+    "check_shell_syntax",
+    "check_python_syntax",
+    "check_node_package_locks",
+)
+
 PLACEHOLDER_VALUE_PARTS = (
     "base64-encoded",
     "example",
@@ -184,12 +198,27 @@ def _looks_like_placeholder_or_reference(match: re.Match[str]) -> bool:
     return any(part in normalized for part in PLACEHOLDER_VALUE_PARTS)
 
 
-class QualityGate:
-    """Run fast repository quality checks."""
+def _run_check(gate: "QualityGate", check: str) -> list[Finding]:
+    return getattr(gate, check)()
 
-    def __init__(self, repo_root: Path | str, project_path: Path | str | None = None) -> None:
+
+class QualityGate:
+    """Run fast repository quality checks.
+
+    With ``jobs`` other than 1 the checks run concurrently in worker
+    processes (0 means one per CPU); findings are still reported in the
+    serial order.
+    """
+
+    def __init__(
+        self,
+        repo_root: Path | str,
+        project_path: Path | str | None = None,
+        jobs: int = 1,
+    ) -> None:
         self.repo_root = Path(repo_root).resolve()
         self.project_path = self._normalize_project_path(project_path)
+        self.jobs = jobs if jobs > 0 else os.cpu_count() or 1
 
     def _normalize_project_path(self, project_path: Path | str | None) -> Path | None:
         if project_path is None:
@@ -203,12 +232,12 @@ class QualityGate:
         return relative_path
 
     def run(self) -> list[Finding]:
-        findings: list[Finding] = []
-        findings.extend(self.check_tracked_ignored_files())
-        findings.extend(self.check_secret_patterns())
-        findings.extend(self.check_syntax())
-        findings.extend(self.check_node_package_locks())
-        return findings
+        if self.jobs == 1:
+            results = [_run_check(self, check) for check in CHECKS]
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.jobs, len(CHECKS))) as pool:
+                results = list(pool.map(_run_check, repeat(self), CHECKS))
+        return [finding for result in results for finding in result]
 
     def git_files(self, *patterns: str) -> list[Path]:
         cmd = ["git", "ls-files", *patterns]
@@ -417,13 +446,20 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Optional project path to validate instead of the whole repository.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run up to N checks in parallel (0 = one per CPU). Output is identical for any value.",
+    )
     return parser
 
 
 def main(argv: list[str] | None = None) -> int:
     args = build_parser().parse_args(argv)
     try:
-        findings = QualityGate(args.repo_root, project_path=args.project).run()
+        findings = QualityGate(args.repo_root, project_path=args.project, jobs=args.jobs).run()
     except ValueError as exc:
         print(f"Quality gate failed: {exc}")
         return 1
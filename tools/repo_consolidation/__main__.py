@@ -1,6 +1,8 @@
 """Allow running the package directly: python -m repo_consolidation."""
 
+import sys
+
 from tools.repo_consolidation.cli import main
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
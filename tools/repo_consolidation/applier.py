@@ -1,23 +1,36 @@
 """Replacement application engine for the repo consolidation pipeline.
 
-Applies ``Replacement`` objects to files on disk, supporting dry-run mode,
-multiple replacements per file (applied in reverse line order to preserve
-line numbers), and the ``replace``, ``delete_file``, and ``flag_for_review``
-actions.
+Applies ``Replacement`` objects (whole lines) or ``FileEdits`` (character
+spans) to files on disk, supporting dry-run mode, multiple edits per
+file, and the ``replace``, ``delete_file``, and ``flag_for_review``
+actions.  Each file is patched in a single pass: edits are resolved to
+character spans, overlapping edits are reported as conflicts, and the
+result is written through a temporary file and an atomic rename.
 """
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import os
+import stat
+import tempfile
 from collections import defaultdict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, TypeVar
 
-from .models import Replacement
+from .models import FileEdits, Replacement
+
+if TYPE_CHECKING:
+    from .manifest import RepoManifest
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 @dataclass
 class ApplySummary:
@@ -29,6 +42,10 @@ class ApplySummary:
         files_flagged: Number of files flagged for manual review.
         replacements_applied: Total line-level replacements applied.
         errors: List of error messages for operations that failed.
+        modified_paths: Relative paths of the files counted in
+            ``files_modified``, so validation can re-check only them.
+        deleted_paths: Relative paths of the files counted in
+            ``files_deleted``.
     """
 
     files_modified: int = 0
@@ -36,6 +53,18 @@ class ApplySummary:
     files_flagged: int = 0
     replacements_applied: int = 0
     errors: list[str] = field(default_factory=list)
+    modified_paths: list[str] = field(default_factory=list)
+    deleted_paths: list[str] = field(default_factory=list)
+
+    def merge(self, other: ApplySummary) -> None:
+        """Add the counts and errors of *other* into this summary."""
+        self.files_modified += other.files_modified
+        self.files_deleted += other.files_deleted
+        self.files_flagged += other.files_flagged
+        self.replacements_applied += other.replacements_applied
+        self.errors.extend(other.errors)
+        self.modified_paths.extend(other.modified_paths)
+        self.deleted_paths.extend(other.deleted_paths)
 
 
 def apply_replacements(
@@ -43,39 +72,165 @@ def apply_replacements(
     repo_root: str,
     *,
     dry_run: bool = False,
+    jobs: int = 1,
+    fsync: bool = False,
+    manifest: RepoManifest | None = None,
 ) -> ApplySummary:
     """Apply a list of replacements to files on disk.
 
-    Replacements are grouped by file path, then sorted in reverse line-number
-    order so that earlier line numbers are not shifted by later edits.
+    Replacements are grouped by file path and each file is patched in
+    one pass (see :func:`_patch`).
 
     Args:
         replacements: The replacement objects to apply.
         repo_root: Absolute or relative path to the repository root.
         dry_run: If ``True``, log proposed changes without writing to disk.
+        jobs: Number of threads applying files concurrently (``0`` or
+            negative = the :class:`~concurrent.futures.ThreadPoolExecutor`
+            default).
+            The summary is identical for any value.
+        fsync: If ``True``, flush each written file to disk before it is
+            renamed into place, then each touched directory once.
+        manifest: Optional run manifest whose entries for the modified
+            and deleted files are refreshed afterwards, so later stages
+            see their new size and content.
 
     Returns:
         An :class:`ApplySummary` describing what was (or would be) changed.
     """
-    summary = ApplySummary()
     root = Path(repo_root)
 
     grouped: dict[str, list[Replacement]] = defaultdict(list)
     for r in replacements:
         grouped[r.file_path].append(r)
 
-    for file_path, file_replacements in grouped.items():
-        _apply_file_replacements(file_replacements, file_path, root, dry_run, summary)
+    def apply_file(item: tuple[str, list[Replacement]]) -> ApplySummary:
+        file_path, file_replacements = item
+        file_summary = ApplySummary()
+        _apply_file_replacements(
+            file_replacements, file_path, root, dry_run, file_summary, fsync,
+        )
+        return file_summary
+
+    summary = _apply_concurrently(apply_file, list(grouped.items()), jobs)
+    if not dry_run:
+        if fsync:
+            _fsync_dirs(root, grouped)
+        if manifest is not None:
+            manifest.refresh(summary.modified_paths + summary.deleted_paths)
+    return summary
+
+
+def apply_file_edits(
+    file_edits: Iterable[FileEdits],
+    repo_root: str,
+    *,
+    dry_run: bool = False,
+    jobs: int = 1,
+    fsync: bool = False,
+    manifest: RepoManifest | None = None,
+) -> ApplySummary:
+    """Apply span-based edit sets to files on disk.
+
+    Like :func:`apply_replacements`, but each span only rewrites the
+    characters it covers, and is checked against the text it expects to
+    replace: a span whose ``old_text`` no longer matches the file is
+    reported as a stale edit instead of being applied.
 
+    Args:
+        file_edits: One :class:`FileEdits` per file, e.g. from
+            :func:`tools.repo_consolidation.fixers.fix_file`.
+        repo_root: Absolute or relative path to the repository root.
+        dry_run: If ``True``, log proposed changes without writing to disk.
+        jobs: See :func:`apply_replacements`.
+        fsync: See :func:`apply_replacements`.
+        manifest: See :func:`apply_replacements`.
+
+    Returns:
+        An :class:`ApplySummary` counting one replacement per edited line.
+    """
+    root = Path(repo_root)
+    file_edits = list(file_edits)
+
+    def apply_file(edits: FileEdits) -> ApplySummary:
+        file_summary = ApplySummary()
+        if edits.actions:
+            _apply_file_replacements(
+                edits.actions, edits.file_path, root, dry_run, file_summary, fsync,
+            )
+            if any(r.action == "delete_file" for r in edits.actions):
+                return file_summary
+        if edits.lines:
+            _patch_file(
+                _changes_from_edits(edits), edits.file_path, root, dry_run,
+                file_summary, fsync,
+            )
+        return file_summary
+
+    summary = _apply_concurrently(apply_file, file_edits, jobs)
+    if not dry_run:
+        if fsync:
+            _fsync_dirs(root, (edits.file_path for edits in file_edits))
+        if manifest is not None:
+            manifest.refresh(summary.modified_paths + summary.deleted_paths)
     return summary
 
 
+def resolve_apply_jobs(jobs: int | None) -> int:
+    """Normalise an ``--apply-jobs`` value: ``None``/``0``/negative → thread-pool default."""
+    if jobs is None or jobs <= 0:
+        # The ThreadPoolExecutor default for I/O-bound work.
+        return min(32, (os.cpu_count() or 1) + 4)
+    return jobs
+
+
+def _apply_concurrently(
+    apply_file: Callable[[_T], ApplySummary],
+    items: list[_T],
+    jobs: int,
+) -> ApplySummary:
+    """Run *apply_file* over *items* on up to *jobs* threads.
+
+    Each call fills its own :class:`ApplySummary`; they are merged in
+    input order, so counts and the order of ``errors`` do not depend on
+    scheduling.
+    """
+    summary = ApplySummary()
+    jobs = resolve_apply_jobs(jobs)
+    if jobs == 1 or len(items) <= 1:
+        for item in items:
+            summary.merge(apply_file(item))
+        return summary
+    with ThreadPoolExecutor(
+        max_workers=jobs, thread_name_prefix="repo-consolidation-apply",
+    ) as pool:
+        for file_summary in pool.map(apply_file, items):
+            summary.merge(file_summary)
+    return summary
+
+
+def _fsync_dirs(root: Path, file_paths: Iterable[str]) -> None:
+    """Flush the directory entries of every directory in *file_paths*, once each."""
+    for directory in sorted({(root / p).parent for p in file_paths}):
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            continue  # directory removed, or not openable on this platform
+        try:
+            os.fsync(fd)
+        except OSError as exc:
+            logger.debug("fsync of %s failed: %s", directory, exc)
+        finally:
+            os.close(fd)
+
+
 def _apply_file_replacements(
     file_replacements: list[Replacement],
     file_path: str,
     root: Path,
     dry_run: bool,
     summary: ApplySummary,
+    fsync: bool = False,
 ) -> None:
     """Process all replacements for a single file."""
     # Separate by action type
@@ -100,7 +255,7 @@ def _apply_file_replacements(
 
     # Handle line-level replacements
     if replace_actions:
-        _handle_replacements(replace_actions, file_path, root, dry_run, summary)
+        _handle_replacements(replace_actions, file_path, root, dry_run, summary, fsync)
 
 
 def _handle_delete(
@@ -128,6 +283,201 @@ def _handle_delete(
             summary.errors.append(msg)
             return
     summary.files_deleted += 1
+    summary.deleted_paths.append(file_path)
+
+
+class _Change(NamedTuple):
+    """One edit to a line, in columns of that line.
+
+    ``end`` is ``None`` for "to the end of the line's content", which is
+    how a whole-line :class:`Replacement` is expressed.  ``expected`` is
+    the text the span must currently hold, or ``None`` to skip the check.
+    """
+
+    line_number: int
+    start: int
+    end: int | None
+    new_text: str
+    comment: str | None
+    old_text: str
+    expected: str | None
+
+
+def _changes_from_replacements(replacements: list[Replacement]) -> list[_Change]:
+    changes = []
+    for r in replacements:
+        new_text = r.new_text[:-1] if r.new_text.endswith("\n") else r.new_text
+        changes.append(_Change(r.line_number, 0, None, new_text, r.comment, r.old_text, None))
+    return changes
+
+
+def _changes_from_edits(edits: FileEdits) -> list[_Change]:
+    spans = {span.line_number: span for span in edits.spans}
+    changes = []
+    for line_number in sorted(edits.lines):
+        comment = edits.comments.get(line_number)
+        span = spans.get(line_number)
+        if span is None:
+            changes.append(_Change(line_number, 0, 0, "", comment, "", ""))
+        else:
+            changes.append(_Change(
+                line_number, span.start, span.end, span.new_text, comment,
+                span.old_text, span.old_text,
+            ))
+    return changes
+
+
+def _patch(
+    text: str,
+    changes: list[_Change],
+    file_path: str,
+    summary: ApplySummary,
+) -> tuple[str, list[_Change]]:
+    """Apply *changes* to *text* in one pass over the file.
+
+    Each change is resolved to an absolute character span.  Changes are
+    then sorted by position; one that overlaps an already accepted
+    change is reported as a conflict in ``summary.errors`` and dropped,
+    unless it is an exact duplicate of it.  The new text is assembled
+    from the untouched stretches and the accepted edits — comments are
+    inserted as zero-width edits at the start of their line — so the
+    cost is linear in the file size plus the number of edits.
+
+    Returns:
+        The patched text and the accepted changes, in line order.
+    """
+    lines = text.splitlines(keepends=True)
+    line_starts: list[int] = []
+    offset = 0
+    for line in lines:
+        line_starts.append(offset)
+        offset += len(line)
+
+    resolved: list[tuple[int, int, int, _Change]] = []
+    for seq, change in enumerate(changes):
+        idx = change.line_number - 1  # convert 1-based to 0-based
+        if idx < 0 or idx >= len(lines):
+            msg = (
+                f"Line {change.line_number} out of range in {file_path} "
+                f"(file has {len(lines)} lines)"
+            )
+            logger.error(msg)
+            summary.errors.append(msg)
+            continue
+        line = lines[idx]
+        content = line.splitlines()[0] if line else ""
+        end = len(content) if change.end is None else change.end
+        if end > len(content) or (
+            change.expected is not None and content[change.start:end] != change.expected
+        ):
+            msg = (
+                f"Stale edit in {file_path} line {change.line_number}: "
+                f"expected {change.expected!r} at columns {change.start}-{end}"
+            )
+            logger.error(msg)
+            summary.errors.append(msg)
+            continue
+        base = line_starts[idx]
+        resolved.append((base + change.start, base + end, seq, change))
+
+    resolved.sort()
+    accepted: list[tuple[int, int, int, _Change]] = []
+    duplicates: list[_Change] = []
+    reach = 0
+    for item in resolved:
+        start, end, _seq, change = item
+        if accepted and start < reach:
+            prev_start, prev_end, _, prev = accepted[-1]
+            if (start, end, change.new_text) == (prev_start, prev_end, prev.new_text):
+                # Exact duplicate: counted as applied, written once.
+                duplicates.append(change)
+                continue
+            msg = (
+                f"Conflicting edits in {file_path} line {change.line_number}: "
+                f"{change.new_text!r} overlaps {prev.new_text!r}"
+            )
+            logger.error(msg)
+            summary.errors.append(msg)
+            continue
+        accepted.append(item)
+        reach = max(reach, end)
+
+    # Assemble: comments go before any edit starting at the same offset.
+    edits: list[tuple[int, int, int, int, str]] = []
+    for start, end, seq, change in accepted:
+        if change.comment:
+            line = lines[change.line_number - 1]
+            terminator = line[len(line.splitlines()[0]):] or "\n"
+            line_start = line_starts[change.line_number - 1]
+            edits.append((line_start, 0, seq, line_start, change.comment + terminator))
+        edits.append((start, 1, seq, end, change.new_text))
+    edits.sort()
+
+    parts: list[str] = []
+    pos = 0
+    for start, _kind, _seq, end, new_text in edits:
+        parts.append(text[pos:start])
+        parts.append(new_text)
+        pos = end
+    parts.append(text[pos:])
+
+    applied = [item[3] for item in accepted] + duplicates
+    applied.sort(key=lambda change: change.line_number)
+    return "".join(parts), applied
+
+
+def _log_dry_run(file_path: str, text: str, applied: list[_Change]) -> None:
+    """Log each line *applied* would change, as the whole line before and after.
+
+    An inserted comment is logged as its own line, ahead of the line it
+    annotates.
+    """
+    lines = text.splitlines()
+    by_line: dict[int, dict[tuple[int, int | None, str], _Change]] = defaultdict(dict)
+    for change in applied:
+        # Exact duplicates were written once; log them once too.
+        by_line[change.line_number].setdefault(
+            (change.start, change.end, change.new_text), change,
+        )
+    for line_number, changes in by_line.items():
+        old_line = new_line = lines[line_number - 1]
+        for change in sorted(changes.values(), key=lambda c: c.start, reverse=True):
+            end = len(new_line) if change.end is None else change.end
+            new_line = new_line[:change.start] + change.new_text + new_line[end:]
+        for change in changes.values():
+            if change.comment:
+                logger.info(
+                    "DRY-RUN: %s line %d: insert %r", file_path, line_number, change.comment,
+                )
+        if new_line != old_line:
+            logger.info(
+                "DRY-RUN: %s line %d: %r -> %r", file_path, line_number, old_line, new_line,
+            )
+
+
+def _write_atomic(path: Path, text: str, *, fsync: bool = False) -> None:
+    """Replace *path* with *text* via a temporary file and a rename.
+
+    Readers see either the old or the new content, never a partial
+    write, and the file keeps its permission bits.  A symlink is
+    written through: the rename replaces its target, so the link
+    itself stays in place.  With *fsync* the data is on disk before
+    the rename makes it visible.
+    """
+    path = path.resolve()
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as fh:
+            fh.write(text)
+            if fsync:
+                fh.flush()
+                os.fsync(fh.fileno())
+        os.chmod(tmp, stat.S_IMODE(path.stat().st_mode))
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
 
 
 def _handle_replacements(
@@ -136,65 +486,54 @@ def _handle_replacements(
     root: Path,
     dry_run: bool,
     summary: ApplySummary,
+    fsync: bool = False,
 ) -> None:
     """Apply line-level replacements to a single file."""
+    _patch_file(
+        _changes_from_replacements(replace_actions), file_path, root, dry_run,
+        summary, fsync,
+    )
+
+
+def _patch_file(
+    changes: list[_Change],
+    file_path: str,
+    root: Path,
+    dry_run: bool,
+    summary: ApplySummary,
+    fsync: bool = False,
+) -> None:
+    """Apply *changes* to a single file and write it atomically."""
     abs_path = root / file_path
 
     try:
-        lines = abs_path.read_text(encoding="utf-8").splitlines(keepends=True)
+        with open(abs_path, encoding="utf-8", newline="") as fh:
+            text = fh.read()
     except FileNotFoundError:
         msg = f"File not found for replacement: {file_path}"
         logger.error(msg)
         summary.errors.append(msg)
         return
-    except OSError as exc:
+    except (OSError, UnicodeDecodeError) as exc:
         msg = f"Failed to read {file_path}: {exc}"
         logger.error(msg)
         summary.errors.append(msg)
         return
 
-    # Sort by line_number descending so earlier indices stay valid
-    sorted_replacements = sorted(replace_actions, key=lambda r: r.line_number, reverse=True)
+    new_text, applied = _patch(text, changes, file_path, summary)
 
-    applied_count = 0
-    for r in sorted_replacements:
-        idx = r.line_number - 1  # convert 1-based to 0-based
-        if idx < 0 or idx >= len(lines):
-            msg = (
-                f"Line {r.line_number} out of range in {file_path} "
-                f"(file has {len(lines)} lines)"
-            )
-            logger.error(msg)
-            summary.errors.append(msg)
-            continue
-
-        if dry_run:
-            logger.info(
-                "DRY-RUN: %s line %d: %r -> %r",
-                file_path,
-                r.line_number,
-                r.old_text.rstrip("\n"),
-                r.new_text.rstrip("\n"),
-            )
-        else:
-            # Replace the line content
-            lines[idx] = r.new_text if r.new_text.endswith("\n") else r.new_text + "\n"
-
-            # Insert comment above the modified line if specified
-            if r.comment:
-                comment_line = r.comment if r.comment.endswith("\n") else r.comment + "\n"
-                lines.insert(idx, comment_line)
-
-        applied_count += 1
+    if dry_run:
+        _log_dry_run(file_path, text, applied)
 
-    if applied_count > 0:
+    if applied:
         if not dry_run:
             try:
-                abs_path.write_text("".join(lines), encoding="utf-8")
+                _write_atomic(abs_path, new_text, fsync=fsync)
             except OSError as exc:
                 msg = f"Failed to write {file_path}: {exc}"
                 logger.error(msg)
                 summary.errors.append(msg)
                 return
         summary.files_modified += 1
-        summary.replacements_applied += applied_count
+        summary.modified_paths.append(file_path)
+        summary.replacements_applied += len(applied)
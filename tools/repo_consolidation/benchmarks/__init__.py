@@ -0,0 +1,11 @@
+"""Benchmarks for the repo consolidation remediation pipeline.
+
+Each module is runnable on its own, e.g.
+``python -m tools.repo_consolidation.benchmarks.prefilter``.
+:mod:`~tools.repo_consolidation.benchmarks.pipeline` times the whole
+pipeline on repositories built by
+:mod:`~tools.repo_consolidation.benchmarks.synthetic` and compares the
+results against stored JSON baselines;
+:mod:`~tools.repo_consolidation.benchmarks.memory` compares the memory
+held by the finding representations.
+"""
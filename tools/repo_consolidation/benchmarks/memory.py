@@ -0,0 +1,113 @@
+"""Memory benchmark for the finding representations.
+
+Generates a synthetic repository, scans it, and measures the memory
+retained by its findings held three ways: as plain (unslotted)
+dataclasses like the original ``Finding`` model, as the slotted,
+interning :class:`~tools.repo_consolidation.models.Finding`, and in a
+:class:`~tools.repo_consolidation.columnar.FindingTable`.  Each is
+rebuilt from the findings' JSON form, as findings arrive from the scan
+cache, ``--format jsonl`` output or worker processes, so no strings are
+shared with the scan that produced them.
+
+Usage:
+    python -m tools.repo_consolidation.benchmarks.memory [--files N] [--seed N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from tools.repo_consolidation.benchmarks.synthetic import SyntheticSpec, generate_repo
+from tools.repo_consolidation.columnar import FindingTable
+from tools.repo_consolidation.models import Finding
+from tools.repo_consolidation.scanner import scan_repo
+
+#: Representations measured, in report order.
+REPRESENTATIONS = ("dataclass", "slotted", "table")
+
+
+@dataclass
+class _PlainFinding:
+    """The original ``Finding`` layout: a ``__dict__`` per instance, no interning."""
+
+    file_path: str
+    line_number: int
+    matched_text: str
+    issue_type: str
+    old_repo_name: str
+    context: str
+    file_type: str
+
+
+def _retained(build: Callable[[], object]) -> int:
+    """Return the bytes still allocated once *build*'s result is the only survivor."""
+    # Build once unmeasured, so one-off growth of interpreter-wide tables
+    # (such as the interned-string dict) is not charged to *build*.
+    build()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        held = build()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del held
+    return after - before
+
+
+def measure_memory(root: str | Path, findings: list[Finding]) -> dict[str, int]:
+    """Return the bytes retained by *findings* in each of :data:`REPRESENTATIONS`.
+
+    *findings* must come from files under *root* that are still on disk.
+    """
+    payload = json.dumps([f.to_dict() for f in findings])
+    builders: dict[str, Callable[[], object]] = {
+        "dataclass": lambda: [_PlainFinding(**d) for d in json.loads(payload)],
+        "slotted": lambda: [Finding.from_dict(d) for d in json.loads(payload)],
+        "table": lambda: FindingTable.from_findings(
+            root, (Finding.from_dict(d) for d in json.loads(payload)),
+        ),
+    }
+    return {name: _retained(builders[name]) for name in REPRESENTATIONS}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=2000, help="Files to generate.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="repo-consolidation-mem-") as tmp:
+        repo = generate_repo(tmp, SyntheticSpec(files=args.files, seed=args.seed))
+        findings = scan_repo(repo.root, backend="walk")
+        if not findings:
+            print("ERROR: the generated repository has no findings", file=sys.stderr)
+            return 1
+        if FindingTable.from_findings(repo.root, findings).to_findings() != findings:
+            print("ERROR: FindingTable did not round-trip the findings", file=sys.stderr)
+            return 1
+        sizes = measure_memory(repo.root, findings)
+
+    baseline = sizes["dataclass"]
+    print(f"files: {repo.files}  findings: {len(findings)}")
+    for name in REPRESENTATIONS:
+        size = sizes[name]
+        print(
+            f"  {name:<10}: {size / 1_000_000:8.2f} MB  "
+            f"{size / len(findings):7.1f} B/finding  {baseline / size:5.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
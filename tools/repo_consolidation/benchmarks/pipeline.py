@@ -0,0 +1,280 @@
+"""End-to-end pipeline benchmark on synthetic repositories.
+
+``run`` generates a repository from a :class:`SyntheticSpec`, times the
+scan, fix, apply and validate stages (best of ``--repeat`` fresh
+copies), and writes the result as a JSON baseline.  ``compare`` diffs a
+new result against a baseline and exits non-zero when a stage slowed
+down by more than ``--threshold`` or the finding counts changed.
+
+Usage:
+    python -m tools.repo_consolidation.benchmarks.pipeline run [--files N]
+        [--min-lines N] [--max-lines N] [--density TYPE=PER_1K ...]
+        [--go-fraction F] [--link-fraction F] [--duplicate-fraction F]
+        [--seed N] [--repeat N] [--jobs N] [--output PATH]
+    python -m tools.repo_consolidation.benchmarks.pipeline compare BASELINE RESULT
+        [--threshold F]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+from tools.repo_consolidation.applier import apply_file_edits
+from tools.repo_consolidation.benchmarks.synthetic import (
+    ISSUE_TYPES,
+    SyntheticSpec,
+    generate_repo,
+)
+from tools.repo_consolidation.cli import _build_fixer_map, _group_by_file
+from tools.repo_consolidation.fixers import fix_file
+from tools.repo_consolidation.manifest import RepoManifest
+from tools.repo_consolidation.models import FileEdits
+from tools.repo_consolidation.scanner import scan_repo
+from tools.repo_consolidation.validator import validate_fixes
+
+#: Bumped when the result layout changes incompatibly.
+SCHEMA_VERSION = 1
+
+STAGES = ("scan", "fix", "apply", "validate")
+
+
+def _run_once(spec: SyntheticSpec, jobs: int) -> tuple[dict[str, float], dict[str, object]]:
+    """Generate a fresh repo, run every stage once, return timings and counts."""
+    with tempfile.TemporaryDirectory(prefix="repo-consolidation-bench-") as tmp:
+        repo = generate_repo(tmp, spec)
+        root = str(repo.root)
+        timings: dict[str, float] = {}
+
+        start = time.perf_counter()
+        manifest = RepoManifest.build(root, backend="walk")
+        findings = scan_repo(root, jobs=jobs, manifest=manifest)
+        timings["scan"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fixer_map = _build_fixer_map(root)
+        file_edits: list[FileEdits] = [
+            fix_file(file_findings, fixer_map)
+            for file_findings in _group_by_file(findings).values()
+        ]
+        timings["fix"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        summary = apply_file_edits(file_edits, root, manifest=manifest)
+        timings["apply"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        validation = validate_fixes(
+            root,
+            jobs=jobs,
+            initial_findings=findings,
+            touched=summary.modified_paths + summary.deleted_paths,
+            manifest=manifest,
+        )
+        timings["validate"] = time.perf_counter() - start
+
+        counts: dict[str, object] = {
+            "files": repo.files,
+            "bytes": repo.bytes,
+            "planted": repo.planted,
+            "findings": len(findings),
+            "replacements": sum(len(e.lines) + len(e.actions) for e in file_edits),
+            "replacements_applied": summary.replacements_applied,
+            "apply_errors": len(summary.errors),
+            "remaining_issues": len(validation.remaining_issues),
+        }
+    return timings, counts
+
+
+def run_benchmark(
+    spec: SyntheticSpec,
+    *,
+    repeat: int = 3,
+    jobs: int = 1,
+) -> dict[str, object]:
+    """Benchmark the pipeline on *repeat* fresh repositories built from *spec*.
+
+    Returns:
+        A JSON-serialisable result with the spec, environment, counts of
+        the first run and ``best``/``median``/``runs`` seconds per stage.
+
+    Raises:
+        RuntimeError: If two runs of the same spec disagree on counts,
+            which would make their timings incomparable.
+    """
+    runs: dict[str, list[float]] = {stage: [] for stage in STAGES}
+    counts: dict[str, object] | None = None
+    for _ in range(max(repeat, 1)):
+        timings, run_counts = _run_once(spec, jobs)
+        if counts is not None and run_counts != counts:
+            raise RuntimeError(f"non-deterministic workload: {counts} != {run_counts}")
+        counts = run_counts
+        for stage in STAGES:
+            runs[stage].append(timings[stage])
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "spec": asdict(spec),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "jobs": jobs,
+        "repeat": repeat,
+        "counts": counts,
+        "stages": {
+            stage: {
+                "best": round(min(values), 6),
+                "median": round(statistics.median(values), 6),
+                "runs": [round(v, 6) for v in values],
+            }
+            for stage, values in runs.items()
+        },
+    }
+
+
+def compare_results(
+    baseline: dict[str, object],
+    result: dict[str, object],
+    *,
+    threshold: float = 0.10,
+) -> tuple[list[str], bool]:
+    """Compare *result* against *baseline*.
+
+    Stages are compared on their best time.  A stage regresses when it
+    is more than *threshold* (a fraction) slower than the baseline.
+
+    Returns:
+        The report lines and ``True`` if there was a regression or the
+        two runs did not produce the same counts.
+    """
+    lines: list[str] = []
+    failed = False
+    if baseline.get("spec") != result.get("spec"):
+        lines.append("WARNING: specs differ; timings are not directly comparable")
+    if baseline.get("counts") != result.get("counts"):
+        lines.append("FAIL: counts differ")
+        for key in sorted(set(baseline.get("counts") or {}) | set(result.get("counts") or {})):
+            old = (baseline.get("counts") or {}).get(key)
+            new = (result.get("counts") or {}).get(key)
+            if old != new:
+                lines.append(f"  {key}: {old} -> {new}")
+        failed = True
+
+    lines.append(f"{'stage':<10} {'baseline':>10} {'result':>10} {'change':>9}")
+    base_stages = baseline.get("stages") or {}
+    new_stages = result.get("stages") or {}
+    for stage in STAGES:
+        if stage not in base_stages or stage not in new_stages:
+            lines.append(f"{stage:<10} {'-':>10} {'-':>10} {'n/a':>9}")
+            continue
+        old = base_stages[stage]["best"]
+        new = new_stages[stage]["best"]
+        change = (new - old) / old if old else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            failed = True
+        lines.append(f"{stage:<10} {old:>9.4f}s {new:>9.4f}s {change:>+8.1%}{flag}")
+    return lines, failed
+
+
+def _parse_density(values: list[str]) -> dict[str, float]:
+    density = SyntheticSpec().hits_per_1k_lines
+    for value in values:
+        issue_type, sep, rate = value.partition("=")
+        if not sep or issue_type not in ISSUE_TYPES:
+            raise argparse.ArgumentTypeError(
+                f"--density expects TYPE=PER_1K with TYPE in {', '.join(ISSUE_TYPES)}: {value!r}"
+            )
+        density[issue_type] = float(rate)
+    return density
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    defaults = SyntheticSpec()
+    run = sub.add_parser("run", help="Benchmark a synthetic repository and write a JSON result.")
+    run.add_argument("--files", type=int, default=defaults.files)
+    run.add_argument("--min-lines", type=int, default=defaults.min_lines)
+    run.add_argument("--max-lines", type=int, default=defaults.max_lines)
+    run.add_argument(
+        "--density",
+        action="append",
+        default=[],
+        metavar="TYPE=PER_1K",
+        help="Planted hits per 1000 lines for an issue type (repeatable).",
+    )
+    run.add_argument("--go-fraction", type=float, default=defaults.go_module_fraction)
+    run.add_argument("--link-fraction", type=float, default=defaults.markdown_link_fraction)
+    run.add_argument("--duplicate-fraction", type=float, default=defaults.duplicate_fraction)
+    run.add_argument("--seed", type=int, default=defaults.seed)
+    run.add_argument("--repeat", type=int, default=3, help="Fresh repositories to time (best is compared).")
+    run.add_argument("--jobs", type=int, default=1, help="Scan worker processes.")
+    run.add_argument("--output", metavar="PATH", help="Write the JSON result here (default: stdout).")
+
+    compare = sub.add_parser("compare", help="Diff a result against a baseline.")
+    compare.add_argument("baseline")
+    compare.add_argument("result")
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Allowed slowdown per stage as a fraction (default: 0.10).",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        try:
+            baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+            result = json.loads(Path(args.result).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            print(f"ERROR: {exc}", file=sys.stderr)
+            return 2
+        lines, failed = compare_results(baseline, result, threshold=args.threshold)
+        print("\n".join(lines))
+        return 1 if failed else 0
+
+    try:
+        density = _parse_density(args.density)
+    except argparse.ArgumentTypeError as exc:
+        parser.error(str(exc))
+    spec = SyntheticSpec(
+        files=args.files,
+        min_lines=args.min_lines,
+        max_lines=args.max_lines,
+        hits_per_1k_lines=density,
+        go_module_fraction=args.go_fraction,
+        markdown_link_fraction=args.link_fraction,
+        duplicate_fraction=args.duplicate_fraction,
+        seed=args.seed,
+    )
+    result = run_benchmark(spec, repeat=args.repeat, jobs=args.jobs)
+    text = json.dumps(result, indent=2) + "\n"
+    if args.output:
+        Path(args.output).write_text(text, encoding="utf-8")
+        for stage, timing in result["stages"].items():
+            print(f"{stage:<10} {timing['best']:>9.4f}s")
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
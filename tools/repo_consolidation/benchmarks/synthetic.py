@@ -0,0 +1,230 @@
+"""Synthetic repository generator for pipeline benchmarks.
+
+Builds a throwaway tree that looks like the consolidated repo — project
+folders of markdown, YAML, shell, Jenkinsfiles, Dockerfiles and Go
+modules — with a controlled density of each issue type the scanner
+detects.  Generation is deterministic for a given :class:`SyntheticSpec`
+(including its ``seed``), so two benchmark runs with the same spec
+measure the same workload.
+"""
+
+from __future__ import annotations
+
+import random
+import string
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from tools.repo_consolidation.url_map import URL_MAP
+
+#: Issue types the generator can plant, matching ``SCAN_PATTERNS`` keys.
+ISSUE_TYPES = ("old_url", "credential", "hardcoded_account_id", "stale_docker_image")
+
+_TEXT_KINDS = ("README.md", "notes.md", "deploy.yaml", "setup.sh", "Jenkinsfile", "Dockerfile")
+
+_FILLER_WORDS = (
+    "deploy", "cluster", "pipeline", "terraform", "module", "service",
+    "ingress", "replica", "artifact", "bucket", "policy", "runner",
+    "stage", "release", "monitor", "alert", "subnet", "gateway",
+)
+
+
+def _default_density() -> dict[str, float]:
+    return {
+        "old_url": 5.0,
+        "credential": 0.2,
+        "hardcoded_account_id": 1.0,
+        "stale_docker_image": 0.5,
+    }
+
+
+@dataclass
+class SyntheticSpec:
+    """Shape of a generated repository.
+
+    Attributes:
+        files: Number of text files to generate (``go.mod`` files
+            included, consolidated target directories excluded).
+        min_lines: Minimum lines per file.
+        max_lines: Maximum lines per file.
+        hits_per_1k_lines: Expected planted findings per 1000 lines,
+            keyed by issue type (see :data:`ISSUE_TYPES`).
+        go_module_fraction: Fraction of project folders that are Go
+            modules (``go.mod`` plus ``.go`` sources importing old
+            module paths).
+        markdown_link_fraction: Fraction of ``old_url`` hits in markdown
+            files written as ``[text](url)`` links rather than bare URLs.
+        duplicate_fraction: Fraction of files that are byte-identical
+            copies of an earlier file, as vendored docs are in the real
+            repo.
+        files_per_project: Files per project folder.
+        seed: Seed for the pseudo-random generator.
+    """
+
+    files: int = 500
+    min_lines: int = 20
+    max_lines: int = 400
+    hits_per_1k_lines: dict[str, float] = field(default_factory=_default_density)
+    go_module_fraction: float = 0.1
+    markdown_link_fraction: float = 0.7
+    duplicate_fraction: float = 0.1
+    files_per_project: int = 25
+    seed: int = 0
+
+
+@dataclass
+class GeneratedRepo:
+    """What :func:`generate_repo` wrote.
+
+    Attributes:
+        root: Root directory of the generated tree.
+        files: Number of files written.
+        bytes: Total size of the files written.
+        planted: Lines planted per issue type (a planted line may yield
+            more than one finding, e.g. a URL plus a docker reference).
+    """
+
+    root: Path
+    files: int = 0
+    bytes: int = 0
+    planted: dict[str, int] = field(default_factory=lambda: dict.fromkeys(ISSUE_TYPES, 0))
+
+
+class _Generator:
+    def __init__(self, spec: SyntheticSpec, root: Path) -> None:
+        unknown = set(spec.hits_per_1k_lines) - set(ISSUE_TYPES)
+        if unknown:
+            raise ValueError(f"unknown issue type(s) in hits_per_1k_lines: {sorted(unknown)}")
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.repos = sorted(URL_MAP)
+        self.result = GeneratedRepo(root=root)
+
+    def _write(self, path: Path, content: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = content.encode("utf-8")
+        path.write_bytes(data)
+        self.result.files += 1
+        self.result.bytes += len(data)
+
+    def _filler(self, comment: str) -> str:
+        words = self.rng.choices(_FILLER_WORDS, k=self.rng.randint(4, 12))
+        return f"{comment}{' '.join(words)}"
+
+    def _hit(self, issue_type: str, kind: str, comment: str) -> str:
+        rng = self.rng
+        repo = rng.choice(self.repos)
+        if issue_type == "old_url":
+            url = f"https://github.com/DevCloudNinjas/{repo}"
+            if kind.endswith(".md"):
+                if rng.random() < self.spec.markdown_link_fraction:
+                    return f"See [{repo}]({url}/blob/main/README.md) for details."
+                return f"Upstream: {url}/tree/main/docs"
+            if rng.random() < 0.3:
+                return f"{comment}git clone {url}.git"
+            return f"{comment}source: {url}"
+        if issue_type == "credential":
+            token = "".join(rng.choices(string.ascii_letters + string.digits, k=36))
+            return f'export GITHUB_TOKEN="ghp_{token}"'
+        if issue_type == "hardcoded_account_id":
+            account = "".join(rng.choices(string.digits, k=12))
+            return f"image: {account}.dkr.ecr.us-east-1.amazonaws.com/app:latest"
+        return f'dockerImage = docker.build("devcloudninjas" + "/{repo.lower()}")'
+
+    def _body(self, kind: str, comment: str) -> list[str]:
+        lines: list[str] = []
+        densities = self.spec.hits_per_1k_lines
+        for _ in range(self.rng.randint(self.spec.min_lines, self.spec.max_lines)):
+            for issue_type, density in densities.items():
+                if self.rng.random() * 1000 < density:
+                    lines.append(self._hit(issue_type, kind, comment))
+                    self.result.planted[issue_type] += 1
+                    break
+            else:
+                lines.append(self._filler(comment))
+        return lines
+
+    def _text_file(self, kind: str) -> str:
+        comment = "" if kind.endswith(".md") else "# "
+        if kind == "Jenkinsfile":
+            comment = "// "
+        header = {"Dockerfile": "FROM alpine:3.19", "Jenkinsfile": "pipeline {"}.get(kind)
+        lines = ([header] if header else []) + self._body(kind, comment)
+        if kind == "Jenkinsfile":
+            lines.append("}")
+        return "\n".join(lines) + "\n"
+
+    def _go_module(self, project: Path, count: int) -> Iterator[tuple[Path, str]]:
+        repo = self.rng.choice(self.repos)
+        module = f"github.com/DevCloudNinjas/{repo}"
+        self.result.planted["old_url"] += 1
+        yield project / "go.mod", f"module {module}\n\ngo 1.21\n"
+        for i in range(count - 1):
+            body = "\n".join(f"// {line}" for line in self._body(".go", ""))
+            self.result.planted["old_url"] += 1
+            yield (
+                project / f"pkg{i}" / "main.go",
+                f"package pkg{i}\n\nimport (\n\t\"fmt\"\n\n\t\"{module}/internal/util\"\n)\n\n"
+                f"{body}\n\nfunc Run() {{ fmt.Println(util.Name) }}\n",
+            )
+
+    def generate(self) -> GeneratedRepo:
+        spec, rng, root = self.spec, self.rng, self.result.root
+        # Consolidated targets exist, as in the real tree, so fixers take
+        # the verified-path branch.
+        for target in set(URL_MAP.values()):
+            (root / target).mkdir(parents=True, exist_ok=True)
+
+        # Every file written so far with the hits it planted, so copies
+        # count toward the planted totals too.
+        written: list[tuple[str, str, dict[str, int]]] = []
+
+        def emit(path: Path, content: str, before: dict[str, int]) -> None:
+            self._write(path, content)
+            written.append((path.name, content, {
+                t: planted[t] - before[t] for t in ISSUE_TYPES
+            }))
+
+        planted = self.result.planted
+        remaining = spec.files
+        project_no = 0
+        while remaining > 0:
+            project_no += 1
+            project = root / f"bench-{project_no:03d}"
+            count = min(spec.files_per_project, remaining)
+            remaining -= count
+            if count > 1 and rng.random() < spec.go_module_fraction:
+                module_files = self._go_module(project, count)
+                while True:
+                    before = dict(planted)
+                    try:
+                        path, content = next(module_files)
+                    except StopIteration:
+                        break
+                    emit(path, content, before)
+                continue
+            for i in range(count):
+                if written and rng.random() < spec.duplicate_fraction:
+                    name, content, hits = rng.choice(written)
+                    self._write(project / f"copy{i}" / name, content)
+                    for issue_type, n in hits.items():
+                        planted[issue_type] += n
+                    continue
+                kind = rng.choice(_TEXT_KINDS)
+                before = dict(planted)
+                emit(project / f"part{i}" / kind, self._text_file(kind), before)
+        return self.result
+
+
+def generate_repo(root: str | Path, spec: SyntheticSpec | None = None) -> GeneratedRepo:
+    """Write a synthetic repository described by *spec* under *root*.
+
+    *root* is created if needed and should be empty.
+
+    Raises:
+        ValueError: If *spec* names an unknown issue type.
+    """
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    return _Generator(spec or SyntheticSpec(), root).generate()
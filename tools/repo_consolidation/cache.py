@@ -0,0 +1,248 @@
+"""Persistent incremental scan cache for the repo consolidation pipeline.
+
+Stores each file's findings on disk keyed by relative path, size, mtime
+and SHA-256 content hash, so repeat scans only re-read and re-scan files
+that actually changed.  The whole cache is tagged with a *version* key
+derived from the active pattern set (see
+:func:`tools.repo_consolidation.scanner.scan_version_key`); a different
+key discards every entry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+from tools.repo_consolidation.models import Finding
+
+logger = logging.getLogger(__name__)
+
+#: Default cache location, relative to the repository root.
+DEFAULT_CACHE_DIR = Path(".cache") / "repo_consolidation"
+
+_CACHE_FILENAME = "scan-cache.json"
+
+# Entries whose mtime is this close to the moment they were recorded are
+# "racily clean": a same-size rewrite within the filesystem's timestamp
+# granularity would be invisible to stat(), so they are re-hashed on use.
+_RACY_WINDOW_NS = 2_000_000_000
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_digest(path: str | Path) -> str:
+    """Return the hex SHA-256 of *path*'s contents."""
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(_HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _encode_findings(findings: list[Finding]) -> list[list[object]]:
+    """Compact per-file finding rows (path and file type live on the entry)."""
+    return [
+        [f.line_number, f.matched_text, f.issue_type, f.old_repo_name, f.context]
+        for f in findings
+    ]
+
+
+def _decode_findings(
+    rows: list[list[object]],
+    rel_path: str,
+    file_type: str,
+) -> list[Finding]:
+    return [
+        Finding(
+            file_path=rel_path,
+            line_number=line_number,
+            matched_text=matched_text,
+            issue_type=issue_type,
+            old_repo_name=old_repo_name,
+            context=context,
+            file_type=file_type,
+        )
+        for line_number, matched_text, issue_type, old_repo_name, context in rows
+    ]
+
+
+class ScanCache:
+    """On-disk map of ``relative path → (size, mtime, hash, findings)``.
+
+    Typical use::
+
+        cache = ScanCache(repo_root / DEFAULT_CACHE_DIR)
+        cache.open(version)
+        findings = cache.lookup(rel_path, abs_path)
+        if findings is None:
+            findings = scan(...)
+            cache.store(rel_path, abs_path, findings)
+        cache.save()
+
+    Attributes:
+        cache_dir: Directory holding the cache file.
+        hits: Lookups answered from the cache since :meth:`open`.
+        misses: Lookups that required a re-scan since :meth:`open`.
+    """
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self._version: str | None = None
+        self._entries: dict[str, dict[str, object]] = {}
+        self._seen: set[str] = set()
+        self._dirty = False
+
+    @property
+    def path(self) -> Path:
+        """Location of the cache file."""
+        return self.cache_dir / _CACHE_FILENAME
+
+    def open(self, version: str) -> None:
+        """Load the cache for *version*, discarding it if the key differs.
+
+        Re-opening with the version already loaded keeps the in-memory
+        entries, so a scan followed by a validation re-scan in the same
+        process only reads the file once.
+        """
+        self.hits = 0
+        self.misses = 0
+        self._seen = set()
+        if self._version == version:
+            return
+        self._version = version
+        self._entries = {}
+        self._dirty = False
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable scan cache %s: %s", self.path, exc)
+            return
+        if not isinstance(data, dict) or data.get("version") != version:
+            logger.info("Scan cache version changed — rebuilding %s", self.path)
+            self._dirty = True
+            return
+        self._entries = data.get("entries", {})
+
+    def lookup(
+        self,
+        rel_path: str,
+        abs_path: Path,
+        file_type: str,
+    ) -> list[Finding] | None:
+        """Return cached findings for *rel_path*, or ``None`` on a miss.
+
+        A matching size and mtime is trusted unless the entry is racily
+        clean; otherwise the file is hashed and the findings are reused
+        when the content hash still matches.
+        """
+        self._seen.add(rel_path)
+        entry = self._entries.get(rel_path)
+        if entry is None:
+            self.misses += 1
+            return None
+        try:
+            st = abs_path.stat()
+        except OSError:
+            self.misses += 1
+            return None
+
+        if (
+            entry["size"] == st.st_size
+            and entry["mtime_ns"] == st.st_mtime_ns
+            and not entry.get("racy")
+        ):
+            self.hits += 1
+            return _decode_findings(entry["findings"], rel_path, file_type)
+
+        try:
+            digest = file_digest(abs_path)
+        except OSError:
+            self.misses += 1
+            return None
+        if digest != entry["sha256"]:
+            self.misses += 1
+            return None
+
+        # Content unchanged (e.g. touched or checked out again) — refresh
+        # the stat fields so the next lookup is stat-only.
+        self._record(rel_path, st, digest, entry["findings"])
+        self.hits += 1
+        return _decode_findings(entry["findings"], rel_path, file_type)
+
+    def store(
+        self,
+        rel_path: str,
+        abs_path: Path,
+        findings: list[Finding],
+        *,
+        digest: str | None = None,
+    ) -> None:
+        """Record the findings of a fresh scan of *rel_path*.
+
+        Pass *digest* when the content hash is already known to avoid
+        reading the file again.
+        """
+        self._seen.add(rel_path)
+        try:
+            st = abs_path.stat()
+            if digest is None:
+                digest = file_digest(abs_path)
+        except OSError as exc:
+            logger.debug("Not caching %s: %s", rel_path, exc)
+            self._entries.pop(rel_path, None)
+            return
+        self._record(rel_path, st, digest, _encode_findings(findings))
+
+    def _record(
+        self,
+        rel_path: str,
+        st: os.stat_result,
+        digest: str,
+        rows: list[list[object]],
+    ) -> None:
+        entry: dict[str, object] = {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "sha256": digest,
+            "findings": rows,
+        }
+        if time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS:
+            entry["racy"] = True
+        self._entries[rel_path] = entry
+        self._dirty = True
+
+    def save(self, *, prune: bool = True) -> None:
+        """Write the cache to disk atomically.
+
+        With *prune* (the default), entries for paths not looked up since
+        :meth:`open` — deleted or no-longer-discovered files — are dropped.
+        """
+        if prune:
+            stale = set(self._entries) - self._seen
+            for rel_path in stale:
+                del self._entries[rel_path]
+            self._dirty = self._dirty or bool(stale)
+        if not self._dirty:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".tmp{os.getpid()}")
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(
+                    {"version": self._version, "entries": self._entries},
+                    fh,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError as exc:
+            logger.warning("Could not write scan cache %s: %s", self.path, exc)
@@ -1,27 +1,90 @@
 """CLI entry point for the repo consolidation remediation pipeline.
 
 Usage:
-    python -m tools.repo_consolidation <repo_root> [--dry-run] [--report-output PATH] [--verbose]
+    python -m tools.repo_consolidation <repo_root> [--dry-run] [--report-output PATH]
+        [--jobs N] [--apply-jobs N] [--fsync] [--full-validate]
+        [--pipeline] [--queue-size N]
+        [--no-cache] [--cache-dir PATH]
+        [--discovery {auto,git,walk}] [--changed-since REF]
+        [--no-dedup] [--url-map PATH] [--format {text,jsonl}]
+        [--report-format {text,jsonl,sarif,junit}] [--profile DIR] [--verbose]
+    python -m tools.repo_consolidation plan <repo_root> [--output PLAN]
+        [scan options] [--url-map PATH] [--verbose]
+    python -m tools.repo_consolidation apply [PLAN] [--repo-root DIR] [--dry-run]
+        [--apply-jobs N] [--fsync] [--validate] [--verbose]
+    python -m tools.repo_consolidation watch <repo_root> [--discovery {auto,git,walk}]
+        [--backend {auto,inotify,poll}] [--interval SECONDS] [--socket PATH] [--verbose]
+
+``plan`` scans and fixes in memory, writes the result to a plan file
+and prints the proposed edits for review; ``apply`` then executes the
+plan without scanning again (see :mod:`tools.repo_consolidation.plan`).
+``watch`` scans once, then re-scans only the files that change and
+prints their updated findings until interrupted (see
+:mod:`tools.repo_consolidation.watch`).
 """
 
 from __future__ import annotations
 
 import argparse
+import json
 import logging
 import sys
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import asdict
 from pathlib import Path
+from typing import TextIO
 
-from tools.repo_consolidation.applier import apply_replacements
+from tools.repo_consolidation.applier import ApplySummary, apply_file_edits, resolve_apply_jobs
+from tools.repo_consolidation.cache import DEFAULT_CACHE_DIR, ScanCache
 from tools.repo_consolidation.fixers import (
+    BatchFixer,
     fix_account_id,
     fix_credential,
     fix_docker_image,
-    fix_old_url,
+    fix_file,
+    fix_old_urls,
+    per_finding,
+)
+from tools.repo_consolidation.links import check_links
+from tools.repo_consolidation.manifest import PathIndex, RepoManifest
+from tools.repo_consolidation.models import (
+    FileEdits,
+    Finding,
+    Replacement,
+    ScanStats,
+    ValidationReport,
+)
+from tools.repo_consolidation.pipelined import DEFAULT_QUEUE_SIZE, run_pipelined
+from tools.repo_consolidation.plan import (
+    DEFAULT_PLAN_PATH,
+    apply_plan,
+    format_planned_file,
+    load_plan,
+    make_plan,
+    write_plan,
 )
-from tools.repo_consolidation.models import Replacement
-from tools.repo_consolidation.report import generate_report
-from tools.repo_consolidation.scanner import scan_repo
+from tools.repo_consolidation.profiling import Profiler
+from tools.repo_consolidation.report import REPORT_FORMATS, generate_report, write_report
+from tools.repo_consolidation.scanner import (
+    DISCOVERY_BACKENDS,
+    SCAN_PATTERNS,
+    iter_findings,
+    scan_repo,
+)
+from tools.repo_consolidation.url_map import load_url_map, use_url_map
 from tools.repo_consolidation.validator import validate_fixes
+from tools.repo_consolidation.watch import (
+    DEFAULT_POLL_INTERVAL,
+    WATCH_BACKENDS,
+    FindingsServer,
+    WatchState,
+    format_update,
+    open_watcher,
+)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -51,13 +114,285 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="File path to write the remediation report to.",
     )
+    _add_scan_arguments(parser)
+    _add_url_map_argument(parser)
+    _add_apply_arguments(parser)
+    parser.add_argument(
+        "--full-validate",
+        action="store_true",
+        default=False,
+        help=(
+            "Re-scan every file after fixing instead of only the files the "
+            "apply stage modified or deleted. (jsonl output always re-scans "
+            "everything, answering untouched files from the scan cache.)"
+        ),
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        default=False,
+        help=(
+            "Overlap the scan, fix and apply stages: each file is fixed and "
+            "written as soon as it has been scanned, with at most --queue-size "
+            "files buffered between stages. Findings, fixes and remaining "
+            "issues are identical; as with --format jsonl (which always "
+            "interleaves the stages), duplicates of an already-fixed file are "
+            "scanned rather than copied."
+        ),
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=DEFAULT_QUEUE_SIZE,
+        metavar="N",
+        help=f"Files buffered between stages with --pipeline (default: {DEFAULT_QUEUE_SIZE}).",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("text", "jsonl"),
+        default="text",
+        help=(
+            "Output format. 'jsonl' streams finding, replacement, remaining, "
+            "broken_link and summary records as they are produced (to --report-output "
+            "if given, else stdout) instead of printing the text report."
+        ),
+    )
+    parser.add_argument(
+        "--report-format",
+        choices=REPORT_FORMATS,
+        default="text",
+        help=(
+            "Format of the final report with --format text: 'jsonl' (finding, "
+            "remaining, broken_link and summary records), 'sarif' (SARIF 2.1.0 "
+            "for code-scanning upload) or 'junit' (JUnit XML).  Machine-readable "
+            "reports are streamed to --report-output if given, else stdout, in "
+            "place of the text report."
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        default=None,
+        help=(
+            "Record stage, pattern, file and fixer timings and write them "
+            "to DIR/profile.json and a Chrome trace DIR/trace.json."
+        ),
+    )
+    _add_verbose_argument(parser)
+    return parser
+
+
+def build_plan_parser() -> argparse.ArgumentParser:
+    """Build and return the argument parser of the ``plan`` subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="repo-consolidation plan",
+        description=(
+            "Scan a repository and generate fixes without applying them. The "
+            "findings, fixes and a hash of every affected file are written to "
+            "a plan file for 'repo-consolidation apply'."
+        ),
+    )
+    parser.add_argument(
+        "repo_root",
+        type=str,
+        help="Path to the root of the consolidated repository to scan.",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        default=DEFAULT_PLAN_PATH,
+        metavar="PLAN",
+        help=f"Plan file to write; gzip-compressed if it ends in .gz (default: {DEFAULT_PLAN_PATH}).",
+    )
+    _add_scan_arguments(parser)
+    _add_url_map_argument(parser)
+    _add_verbose_argument(parser)
+    return parser
+
+
+def build_apply_parser() -> argparse.ArgumentParser:
+    """Build and return the argument parser of the ``apply`` subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="repo-consolidation apply",
+        description=(
+            "Apply a plan written by 'repo-consolidation plan' without "
+            "scanning again. Files changed since the plan was made are refused."
+        ),
+    )
+    parser.add_argument(
+        "plan",
+        nargs="?",
+        default=DEFAULT_PLAN_PATH,
+        help=f"Plan file to apply (default: {DEFAULT_PLAN_PATH}).",
+    )
+    parser.add_argument(
+        "--repo-root",
+        default=None,
+        help="Repository to apply the plan to (default: the one it was made for).",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        default=False,
+        help="Check the plan against the tree and log proposed changes without writing.",
+    )
+    _add_apply_arguments(parser)
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        default=False,
+        help=(
+            "Afterwards, re-scan the files the plan modified and check relative "
+            "links, then print the remediation report."
+        ),
+    )
+    _add_verbose_argument(parser)
+    return parser
+
+
+def build_watch_parser() -> argparse.ArgumentParser:
+    """Build and return the argument parser of the ``watch`` subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="repo-consolidation watch",
+        description=(
+            "Scan a repository once, then keep its findings in memory and "
+            "print the updated findings of every file that changes. Nothing "
+            "is fixed. Stop with Ctrl-C."
+        ),
+    )
+    parser.add_argument(
+        "repo_root",
+        type=str,
+        help="Path to the root of the consolidated repository to watch.",
+    )
+    parser.add_argument(
+        "--discovery",
+        choices=DISCOVERY_BACKENDS,
+        default="auto",
+        help="File discovery backend for the initial scan (see the main command).",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=WATCH_BACKENDS,
+        default="auto",
+        help=(
+            "Change detection: 'inotify' (Linux), 'poll' compares modification "
+            "times, 'auto' (default) uses inotify when available."
+        ),
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        metavar="SECONDS",
+        help=f"Seconds between polls with the poll backend (default: {DEFAULT_POLL_INTERVAL}).",
+    )
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help=(
+            "Also serve the current findings on a Unix socket at PATH: send a "
+            'line with {} or {"path": FILE}, read JSON Lines back.'
+        ),
+    )
+    _add_verbose_argument(parser)
+    return parser
+
+
+def _add_scan_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options controlling discovery and scanning."""
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Number of worker processes for the scan and validation stages "
+            "(0 = one per CPU). Output is identical for any value."
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Disable the persistent incremental scan cache.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help=(
+            "Directory for the scan cache "
+            f"(default: <repo_root>/{DEFAULT_CACHE_DIR.as_posix()})."
+        ),
+    )
+    parser.add_argument(
+        "--discovery",
+        choices=DISCOVERY_BACKENDS,
+        default="auto",
+        help=(
+            "File discovery backend: 'git' lists files from the git index, "
+            "'walk' walks the tree, 'auto' (default) uses git when available."
+        ),
+    )
+    parser.add_argument(
+        "--changed-since",
+        type=str,
+        default=None,
+        metavar="REF",
+        help="Only scan files changed since git REF (plus untracked files).",
+    )
+    parser.add_argument(
+        "--no-dedup",
+        action="store_true",
+        help="Scan every file even when its content is identical to another file's.",
+    )
+
+
+def _add_url_map_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--url-map",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help=(
+            "Load the old repo → consolidated path map from a JSON or CSV file "
+            "instead of the built-in one. Sources may name a repo subpath "
+            "(Repo/docs) to route it separately."
+        ),
+    )
+
+
+def _add_apply_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options controlling how fixed files are written."""
+    parser.add_argument(
+        "--apply-jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Number of threads writing fixed files concurrently "
+            "(0 or negative = Python's default thread count). Helps on network-mounted "
+            "checkouts; the summary is identical for any value."
+        ),
+    )
+    parser.add_argument(
+        "--fsync",
+        action="store_true",
+        default=False,
+        help="Flush each fixed file, then its directory, to disk before finishing.",
+    )
+
+
+def _add_verbose_argument(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--verbose",
         action="store_true",
         default=False,
         help="Enable detailed logging output.",
     )
-    return parser
 
 
 def configure_logging(verbose: bool) -> None:
@@ -70,14 +405,223 @@ def configure_logging(verbose: bool) -> None:
     )
 
 
+def _build_fixer_map(
+    repo_root_str: str,
+    profiler: Profiler | None = None,
+    path_index: PathIndex | None = None,
+) -> dict[str, BatchFixer]:
+    """Return the issue type → batch fixer mapping used by every output mode.
+
+    With a *profiler*, every fixer call is timed as one call per issue
+    type and line.  With a *path_index* of the whole repository, the
+    old-URL fixer looks its targets up there before asking the disk.
+    """
+    fixers: dict[str, BatchFixer] = {
+        "old_url": lambda findings: fix_old_urls(
+            findings, repo_root=repo_root_str, path_index=path_index,
+        ),
+        "credential": per_finding(fix_credential),
+        "hardcoded_account_id": per_finding(fix_account_id),
+        "stale_docker_image": per_finding(fix_docker_image),
+    }
+    if profiler is None:
+        return fixers
+    return {
+        issue_type: _timed_fixer(issue_type, fixer, profiler)
+        for issue_type, fixer in fixers.items()
+    }
+
+
+def _full_path_index(args: argparse.Namespace, manifest: RepoManifest) -> PathIndex | None:
+    """Return the path index of a complete *manifest*, or ``None`` to check the disk.
+
+    A --changed-since manifest holds only the changed files, so
+    existence checks against it would miss the rest of the tree.
+    """
+    if args.changed_since is not None or not manifest.complete:
+        return None
+    return manifest.path_index()
+
+
+def _timed_fixer(issue_type: str, fixer: BatchFixer, profiler: Profiler) -> BatchFixer:
+    """Wrap *fixer* so each call is recorded with :meth:`Profiler.fixer_called`."""
+
+    def timed(findings: list[Finding]) -> Replacement | None:
+        started = time.perf_counter()
+        try:
+            return fixer(findings)
+        finally:
+            profiler.fixer_called(
+                issue_type,
+                findings[0].file_path,
+                findings[0].line_number,
+                started,
+                time.perf_counter() - started,
+            )
+
+    return timed
+
+
+def _stage(profiler: Profiler | None, name: str) -> AbstractContextManager[None]:
+    """Return a context timing stage *name* when profiling, else a no-op."""
+    return profiler.stage(name) if profiler is not None else nullcontext()
+
+
+def _group_by_file(findings: list[Finding]) -> dict[str, list[Finding]]:
+    """Group *findings* by file path, keeping first-seen file order."""
+    grouped: dict[str, list[Finding]] = {}
+    for finding in findings:
+        grouped.setdefault(finding.file_path, []).append(finding)
+    return grouped
+
+
+def _write_record(out: TextIO, record_type: str, payload: dict[str, object]) -> None:
+    """Write one JSON Lines record and flush so consumers see it immediately."""
+    out.write(json.dumps({"type": record_type, **payload}, ensure_ascii=False))
+    out.write("\n")
+    out.flush()
+
+
+def _run_jsonl(
+    args: argparse.Namespace,
+    repo_root_str: str,
+    cache: ScanCache | None,
+    out: TextIO,
+    stats: ScanStats,
+    profiler: Profiler | None,
+    logger: logging.Logger,
+) -> int:
+    """Run the pipeline as a stream of JSON Lines records on *out*.
+
+    Emits ``finding`` records as the scan produces them.  As soon as the
+    scanner moves on to the next file, the previous file's findings are
+    fixed as one batch and its ``replacement`` records emitted and
+    applied.  Then streams ``remaining`` records from the validation
+    re-scan, writes a ``broken_link`` record per broken relative link,
+    and ends with one ``summary`` record.  Findings are not accumulated
+    beyond the current file and the scanner's capped deduplication
+    store; what still grows with the repository is the per-file
+    manifest and the deduplicator's size/digest index, which hold
+    metadata only.
+
+    Scanning, fixing and applying interleave, so a profile of this mode
+    has one ``remediate`` stage followed by ``validate``.
+    """
+    discovery = {"backend": args.discovery, "changed_since": args.changed_since}
+    # Filled in as the scan discovers files; the validation re-scan then
+    # reads its file list from it instead of walking the tree again.
+    manifest = RepoManifest(repo_root_str)
+    fixer_map = _build_fixer_map(repo_root_str, profiler)
+    summary = ApplySummary()
+    counts: Counter[str] = Counter()
+
+    # With --apply-jobs, files are written on a thread pool while the
+    # scan goes on; at most max_in_flight files are queued, and their
+    # summaries are merged in file order.
+    apply_jobs = resolve_apply_jobs(args.apply_jobs)
+    pool = (
+        ThreadPoolExecutor(apply_jobs, thread_name_prefix="repo-consolidation-apply")
+        if apply_jobs != 1 else None
+    )
+    max_in_flight = 2 * apply_jobs
+    in_flight: deque[Future[ApplySummary]] = deque()
+
+    def flush_file(file_findings: list[Finding]) -> None:
+        if not file_findings:
+            return
+        edits = fix_file(file_findings, fixer_map)
+        for replacement in edits.to_replacements():
+            _write_record(out, "replacement", replacement.to_dict())
+        apply_args = ([edits], repo_root_str)
+        apply_kwargs = {"dry_run": args.dry_run, "fsync": args.fsync, "manifest": manifest}
+        if pool is None:
+            summary.merge(apply_file_edits(*apply_args, **apply_kwargs))
+            return
+        in_flight.append(pool.submit(apply_file_edits, *apply_args, **apply_kwargs))
+        while len(in_flight) > max_in_flight:
+            summary.merge(in_flight.popleft().result())
+
+    with _stage(profiler, "remediate"), pool or nullcontext():
+        current_file: str | None = None
+        pending: list[Finding] = []
+        try:
+            for finding in iter_findings(
+                repo_root_str,
+                jobs=args.jobs,
+                cache=cache,
+                dedup=not args.no_dedup,
+                stats=stats,
+                profiler=profiler,
+                manifest=manifest,
+                **discovery,
+            ):
+                if finding.file_path != current_file:
+                    flush_file(pending)
+                    current_file, pending = finding.file_path, []
+                counts[finding.issue_type] += 1
+                _write_record(out, "finding", finding.to_dict())
+                pending.append(finding)
+            flush_file(pending)
+        except ValueError as exc:
+            logger.error("Cannot discover files: %s", exc)
+            return 1
+        finally:
+            while in_flight:
+                summary.merge(in_flight.popleft().result())
+
+    for err in summary.errors:
+        logger.error("Apply error: %s", err)
+
+    with _stage(profiler, "validate"):
+        remaining = 0
+        for finding in iter_findings(
+            repo_root_str,
+            SCAN_PATTERNS,
+            jobs=args.jobs,
+            cache=cache,
+            dedup=not args.no_dedup,
+            manifest=manifest,
+            **discovery,
+        ):
+            remaining += 1
+            _write_record(out, "remaining", finding.to_dict())
+        link_check = check_links(
+            repo_root_str, jobs=args.jobs, manifest=manifest, **discovery,
+        )
+        for link in link_check.broken:
+            _write_record(out, "broken_link", link.to_dict())
+
+    _write_record(out, "summary", {
+        "dry_run": args.dry_run,
+        "findings": sum(counts.values()),
+        "findings_by_type": dict(sorted(counts.items())),
+        "scan_stats": asdict(stats),
+        "files_modified": summary.files_modified,
+        "files_deleted": summary.files_deleted,
+        "files_flagged": summary.files_flagged,
+        "replacements_applied": summary.replacements_applied,
+        "errors": summary.errors,
+        "remaining_issues": remaining,
+        "links_validated": link_check.links_resolved,
+        "broken_relative_paths": len(link_check.broken),
+    })
+    return 1 if summary.errors or remaining else 0
+
+
 def main(argv: list[str] | None = None) -> int:
     """Parse arguments and run the remediation pipeline.
 
     Stages: scan → classify → fix → apply → validate → report.
     Returns 0 on success, 1 on errors.
     """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in _SUBCOMMANDS:
+        return _SUBCOMMANDS[argv[0]](argv[1:])
+
     parser = build_parser()
     args = parser.parse_args(argv)
+    if args.format == "jsonl" and args.report_format != "text":
+        parser.error("--report-format applies to --format text only")
 
     configure_logging(args.verbose)
     logger = logging.getLogger(__name__)
@@ -89,74 +633,87 @@ def main(argv: list[str] | None = None) -> int:
 
     logger.info("Repo root: %s", repo_root)
     logger.info("Dry-run: %s", args.dry_run)
+    logger.info("Jobs: %d", args.jobs)
+    if args.changed_since:
+        logger.info("Changed since: %s", args.changed_since)
     if args.report_output:
         logger.info("Report output: %s", args.report_output)
 
     repo_root_str = str(repo_root)
+    if not _use_url_map(args, logger):
+        return 1
+    cache = _open_cache(args, repo_root, logger)
 
-    # --- Stage 1: Scan -------------------------------------------------------
-    logger.info("Stage 1: Scanning repository...")
+    profiler = Profiler() if args.profile else None
+    scan_stats = ScanStats()
     try:
-        findings = scan_repo(repo_root_str)
-    except Exception:
-        logger.exception("Fatal error during scan stage")
-        return 1
+        return _run_pipeline(args, repo_root_str, cache, scan_stats, profiler, logger)
+    finally:
+        if profiler is not None:
+            try:
+                profiler.write(args.profile, scan_stats)
+            except OSError:
+                logger.exception("Failed to write profile to %s", args.profile)
 
-    logger.info("Scan complete — %d finding(s) detected.", len(findings))
 
-    # --- Stage 2: Classify (already done by scanner via issue_type) -----------
-    # Findings are pre-classified by the scanner into issue_type categories.
+def _use_url_map(args: argparse.Namespace, logger: logging.Logger) -> bool:
+    """Activate the map named by --url-map, if any; return ``False`` if it cannot be loaded."""
+    if not args.url_map:
+        return True
+    try:
+        index = load_url_map(args.url_map)
+    except (OSError, ValueError) as exc:
+        logger.error("Cannot load URL map %s: %s", args.url_map, exc)
+        return False
+    use_url_map(index)
+    logger.info("URL map: %s (%d repo(s))", args.url_map, len(index))
+    return True
 
-    # --- Stage 3: Fix — produce Replacement objects --------------------------
-    logger.info("Stage 3: Generating fixes...")
-    replacements: list[Replacement] = []
-    fixer_map = {
-        "old_url": lambda f: fix_old_url(f, repo_root=repo_root_str),
-        "credential": fix_credential,
-        "hardcoded_account_id": fix_account_id,
-        "stale_docker_image": fix_docker_image,
-    }
 
-    for finding in findings:
-        fixer = fixer_map.get(finding.issue_type)
-        if fixer is None:
-            logger.warning(
-                "No fixer for issue type %r in %s:%d — skipping",
-                finding.issue_type,
-                finding.file_path,
-                finding.line_number,
+def _open_cache(
+    args: argparse.Namespace,
+    repo_root: Path,
+    logger: logging.Logger,
+) -> ScanCache | None:
+    """Return the scan cache selected by --no-cache/--cache-dir."""
+    if args.no_cache:
+        return None
+    cache_dir = Path(args.cache_dir) if args.cache_dir else repo_root / DEFAULT_CACHE_DIR
+    cache = ScanCache(cache_dir)
+    logger.info("Scan cache: %s", cache.path)
+    return cache
+
+
+def _run_pipeline(
+    args: argparse.Namespace,
+    repo_root_str: str,
+    cache: ScanCache | None,
+    scan_stats: ScanStats,
+    profiler: Profiler | None,
+    logger: logging.Logger,
+) -> int:
+    """Run the stages selected by *args*; see :func:`main`."""
+    if args.format == "jsonl":
+        if not args.report_output:
+            return _run_jsonl(
+                args, repo_root_str, cache, sys.stdout, scan_stats, profiler, logger,
             )
-            continue
         try:
-            replacement = fixer(finding)
-            if replacement is not None:
-                replacements.append(replacement)
-            else:
-                logger.debug(
-                    "Fixer returned None for %s:%d (%s) — unmapped or skipped",
-                    finding.file_path,
-                    finding.line_number,
-                    finding.issue_type,
+            report_path = Path(args.report_output)
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(report_path, "w", encoding="utf-8") as out:
+                return _run_jsonl(
+                    args, repo_root_str, cache, out, scan_stats, profiler, logger,
                 )
-        except Exception:
-            logger.exception(
-                "Error fixing %s:%d (%s) — skipping",
-                finding.file_path,
-                finding.line_number,
-                finding.issue_type,
-            )
-
-    logger.info("Generated %d replacement(s).", len(replacements))
+        except OSError:
+            logger.exception("Failed to write JSON Lines output to %s", args.report_output)
+            return 1
 
-    # --- Stage 4: Apply replacements -----------------------------------------
-    logger.info("Stage 4: Applying replacements (dry_run=%s)...", args.dry_run)
-    try:
-        apply_summary = apply_replacements(
-            replacements, repo_root_str, dry_run=args.dry_run,
-        )
-    except Exception:
-        logger.exception("Fatal error during apply stage")
+    remediate = _remediate_pipelined if args.pipeline else _remediate
+    remediated = remediate(args, repo_root_str, cache, scan_stats, profiler, logger)
+    if remediated is None:
         return 1
+    findings, apply_summary, manifest = remediated
 
     logger.info(
         "Apply complete — %d file(s) modified, %d file(s) deleted, "
@@ -171,24 +728,29 @@ def main(argv: list[str] | None = None) -> int:
             logger.error("Apply error: %s", err)
 
     # --- Stage 5: Validate ---------------------------------------------------
-    logger.info("Stage 5: Validating fixes...")
-    try:
-        validation = validate_fixes(repo_root_str)
-    except Exception:
-        logger.exception("Fatal error during validation stage")
-        return 1
-
-    # Populate summary counts from the apply stage.
-    _count_by_type: dict[str, int] = {}
-    for f in findings:
-        _count_by_type[f.issue_type] = _count_by_type.get(f.issue_type, 0) + 1
+    with _stage(profiler, "validate"):
+        logger.info("Stage 5: Validating fixes...")
+        incremental: dict[str, object] = {}
+        if not args.full_validate:
+            incremental = {
+                "initial_findings": findings,
+                "touched": apply_summary.modified_paths + apply_summary.deleted_paths,
+            }
+        try:
+            validation = validate_fixes(
+                repo_root_str,
+                jobs=args.jobs,
+                cache=cache,
+                backend=args.discovery,
+                changed_since=args.changed_since,
+                manifest=manifest,
+                **incremental,
+            )
+        except Exception:
+            logger.exception("Fatal error during validation stage")
+            return 1
 
-    validation.total_references_fixed = _count_by_type.get("old_url", 0)
-    validation.total_credentials_removed = _count_by_type.get("credential", 0)
-    validation.total_account_ids_parameterized = _count_by_type.get(
-        "hardcoded_account_id", 0,
-    )
-    validation.total_links_validated = apply_summary.replacements_applied
+    _fill_fix_counts(validation, findings)
 
     logger.info(
         "Validation complete — %d remaining issue(s).",
@@ -196,25 +758,372 @@ def main(argv: list[str] | None = None) -> int:
     )
 
     # --- Stage 6: Report -----------------------------------------------------
-    logger.info("Stage 6: Generating report...")
-    report_text = generate_report(findings, validation)
+    with _stage(profiler, "report"):
+        logger.info("Stage 6: Generating report...")
+        if args.report_format != "text":
+            _write_machine_report(args, findings, validation, scan_stats, logger)
+        else:
+            report_text = generate_report(findings, validation, scan_stats)
 
-    print(report_text)
+            print(report_text)
 
-    if args.report_output:
-        try:
-            report_path = Path(args.report_output)
-            report_path.parent.mkdir(parents=True, exist_ok=True)
-            report_path.write_text(report_text, encoding="utf-8")
-            logger.info("Report written to %s", args.report_output)
-        except OSError:
-            logger.exception("Failed to write report to %s", args.report_output)
+            if args.report_output:
+                try:
+                    report_path = Path(args.report_output)
+                    report_path.parent.mkdir(parents=True, exist_ok=True)
+                    report_path.write_text(report_text, encoding="utf-8")
+                    logger.info("Report written to %s", args.report_output)
+                except OSError:
+                    logger.exception("Failed to write report to %s", args.report_output)
 
     # Return 1 if there were apply errors or remaining issues.
     has_errors = bool(apply_summary.errors) or bool(validation.remaining_issues)
     return 1 if has_errors else 0
 
 
+def _remediate(
+    args: argparse.Namespace,
+    repo_root_str: str,
+    cache: ScanCache | None,
+    scan_stats: ScanStats,
+    profiler: Profiler | None,
+    logger: logging.Logger,
+) -> tuple[list[Finding], ApplySummary, RepoManifest] | None:
+    """Run the scan, fix and apply stages one after another.
+
+    Returns the findings, the apply summary and the run's manifest, or
+    ``None`` after logging a fatal error.
+    """
+    # --- Stage 1: Scan -------------------------------------------------------
+    with _stage(profiler, "scan"):
+        logger.info("Stage 1: Scanning repository...")
+        try:
+            manifest = RepoManifest.build(
+                repo_root_str, backend=args.discovery, changed_since=args.changed_since,
+            )
+            findings = scan_repo(
+                repo_root_str,
+                jobs=args.jobs,
+                cache=cache,
+                backend=args.discovery,
+                changed_since=args.changed_since,
+                dedup=not args.no_dedup,
+                stats=scan_stats,
+                profiler=profiler,
+                manifest=manifest,
+            )
+        except ValueError as exc:
+            logger.error("Cannot discover files: %s", exc)
+            return None
+        except Exception:
+            logger.exception("Fatal error during scan stage")
+            return None
+
+    _log_scan(findings, scan_stats, logger)
+
+    # --- Stage 2: Classify (already done by scanner via issue_type) -----------
+    # Findings are pre-classified by the scanner into issue_type categories.
+
+    # --- Stage 3: Fix — produce Replacement objects --------------------------
+    with _stage(profiler, "fix"):
+        logger.info("Stage 3: Generating fixes...")
+        fixer_map = _build_fixer_map(
+            repo_root_str, profiler, _full_path_index(args, manifest),
+        )
+        file_edits: list[FileEdits] = [
+            fix_file(file_findings, fixer_map)
+            for file_findings in _group_by_file(findings).values()
+        ]
+
+    logger.info(
+        "Generated %d replacement(s).",
+        sum(len(edits.lines) + len(edits.actions) for edits in file_edits),
+    )
+
+    # --- Stage 4: Apply replacements -----------------------------------------
+    with _stage(profiler, "apply"):
+        logger.info("Stage 4: Applying replacements (dry_run=%s)...", args.dry_run)
+        try:
+            apply_summary = apply_file_edits(
+                file_edits,
+                repo_root_str,
+                dry_run=args.dry_run,
+                jobs=args.apply_jobs,
+                fsync=args.fsync,
+                manifest=manifest,
+            )
+        except Exception:
+            logger.exception("Fatal error during apply stage")
+            return None
+    return findings, apply_summary, manifest
+
+
+def _remediate_pipelined(
+    args: argparse.Namespace,
+    repo_root_str: str,
+    cache: ScanCache | None,
+    scan_stats: ScanStats,
+    profiler: Profiler | None,
+    logger: logging.Logger,
+) -> tuple[list[Finding], ApplySummary, RepoManifest] | None:
+    """Like :func:`_remediate`, with the stages overlapped (see :mod:`.pipelined`)."""
+    with _stage(profiler, "remediate"):
+        logger.info(
+            "Stages 1-4: Scanning, fixing and applying (pipelined, dry_run=%s)...",
+            args.dry_run,
+        )
+        # Filled in as the scan discovers files, as in jsonl mode.
+        manifest = RepoManifest(repo_root_str)
+        findings = iter_findings(
+            repo_root_str,
+            jobs=args.jobs,
+            cache=cache,
+            backend=args.discovery,
+            changed_since=args.changed_since,
+            dedup=not args.no_dedup,
+            stats=scan_stats,
+            profiler=profiler,
+            manifest=manifest,
+        )
+        try:
+            result = run_pipelined(
+                findings,
+                _build_fixer_map(repo_root_str, profiler),
+                repo_root_str,
+                dry_run=args.dry_run,
+                fsync=args.fsync,
+                apply_workers=resolve_apply_jobs(args.apply_jobs),
+                queue_size=args.queue_size,
+                manifest=manifest,
+            )
+        except ValueError as exc:
+            logger.error("Cannot discover files: %s", exc)
+            return None
+        except Exception:
+            logger.exception("Fatal error during pipelined remediation")
+            return None
+
+    _log_scan(result.findings, scan_stats, logger)
+    logger.info("Generated %d replacement(s).", result.replacements)
+    return result.findings, result.summary, manifest
+
+
+def _log_scan(findings: list[Finding], scan_stats: ScanStats, logger: logging.Logger) -> None:
+    logger.info("Scan complete — %d finding(s) detected.", len(findings))
+    logger.info(
+        "Scanned %d file(s) (%d bytes), %d from cache; "
+        "skipped %d duplicate file(s) (%d bytes).",
+        scan_stats.files_scanned,
+        scan_stats.bytes_scanned,
+        scan_stats.files_cached,
+        scan_stats.files_deduplicated,
+        scan_stats.bytes_deduplicated,
+    )
+
+
+def _fill_fix_counts(validation: ValidationReport, findings: list[Finding]) -> None:
+    """Populate the fix summary counts of *validation* from the initial *findings*."""
+    count_by_type = Counter(f.issue_type for f in findings)
+    validation.total_references_fixed = count_by_type["old_url"]
+    validation.total_credentials_removed = count_by_type["credential"]
+    validation.total_account_ids_parameterized = count_by_type["hardcoded_account_id"]
+
+
+def _write_machine_report(
+    args: argparse.Namespace,
+    findings: list[Finding],
+    validation: ValidationReport,
+    scan_stats: ScanStats,
+    logger: logging.Logger,
+) -> None:
+    """Stream the report in ``args.report_format`` to --report-output or stdout."""
+    if not args.report_output:
+        write_report(sys.stdout, args.report_format, findings, validation, scan_stats)
+        return
+    try:
+        report_path = Path(args.report_output)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, "w", encoding="utf-8") as out:
+            write_report(out, args.report_format, findings, validation, scan_stats)
+        logger.info("%s report written to %s", args.report_format.upper(), args.report_output)
+    except OSError:
+        logger.exception("Failed to write report to %s", args.report_output)
+
+
+def _run_plan(argv: list[str]) -> int:
+    """Run the ``plan`` subcommand: scan, fix in memory, write the plan."""
+    args = build_plan_parser().parse_args(argv)
+    configure_logging(args.verbose)
+    logger = logging.getLogger(__name__)
+
+    repo_root = Path(args.repo_root).resolve()
+    if not repo_root.is_dir():
+        logger.error("Repo root does not exist or is not a directory: %s", repo_root)
+        return 1
+    repo_root_str = str(repo_root)
+    if not _use_url_map(args, logger):
+        return 1
+    cache = _open_cache(args, repo_root, logger)
+
+    try:
+        manifest = RepoManifest.build(
+            repo_root_str, backend=args.discovery, changed_since=args.changed_since,
+        )
+        findings = scan_repo(
+            repo_root_str,
+            jobs=args.jobs,
+            cache=cache,
+            backend=args.discovery,
+            changed_since=args.changed_since,
+            dedup=not args.no_dedup,
+            manifest=manifest,
+        )
+    except ValueError as exc:
+        logger.error("Cannot discover files: %s", exc)
+        return 1
+
+    fixer_map = _build_fixer_map(repo_root_str, path_index=_full_path_index(args, manifest))
+    file_edits = [
+        fix_file(file_findings, fixer_map)
+        for file_findings in _group_by_file(findings).values()
+    ]
+    try:
+        plan = make_plan(repo_root_str, findings, file_edits, manifest=manifest)
+        write_plan(args.output, plan)
+    except OSError:
+        logger.exception("Failed to write plan to %s", args.output)
+        return 1
+
+    for planned in plan.files:
+        print("\n".join(format_planned_file(planned)))
+    logger.info(
+        "Plan written to %s — %d finding(s) in %d file(s), %d file(s) to change.",
+        args.output,
+        len(findings),
+        len(plan.files),
+        sum(planned.has_changes for planned in plan.files),
+    )
+    return 0
+
+
+def _run_apply(argv: list[str]) -> int:
+    """Run the ``apply`` subcommand: execute a plan without scanning."""
+    args = build_apply_parser().parse_args(argv)
+    configure_logging(args.verbose)
+    logger = logging.getLogger(__name__)
+
+    try:
+        plan = load_plan(args.plan)
+    except (OSError, ValueError) as exc:
+        logger.error("Cannot load plan %s: %s", args.plan, exc)
+        return 1
+    repo_root_str = str(Path(args.repo_root or plan.repo_root).resolve())
+    if not Path(repo_root_str).is_dir():
+        logger.error("Repo root does not exist or is not a directory: %s", repo_root_str)
+        return 1
+
+    logger.info("Applying plan %s to %s (dry_run=%s)...", args.plan, repo_root_str, args.dry_run)
+    summary = apply_plan(
+        plan, repo_root_str, dry_run=args.dry_run, jobs=args.apply_jobs, fsync=args.fsync,
+    )
+    logger.info(
+        "Apply complete — %d file(s) modified, %d file(s) deleted, "
+        "%d file(s) flagged, %d replacement(s) applied.",
+        summary.files_modified,
+        summary.files_deleted,
+        summary.files_flagged,
+        summary.replacements_applied,
+    )
+    for err in summary.errors:
+        logger.error("Apply error: %s", err)
+
+    remaining = False
+    if args.validate:
+        findings = plan.findings
+        validation = validate_fixes(
+            repo_root_str,
+            initial_findings=findings,
+            touched=summary.modified_paths + summary.deleted_paths,
+        )
+        _fill_fix_counts(validation, findings)
+        print(generate_report(findings, validation))
+        remaining = bool(validation.remaining_issues)
+    return 1 if summary.errors or remaining else 0
+
+
+def _run_watch(argv: list[str]) -> int:
+    """Run the ``watch`` subcommand: scan once, then re-scan what changes."""
+    args = build_watch_parser().parse_args(argv)
+    configure_logging(args.verbose)
+    logger = logging.getLogger(__name__)
+
+    repo_root = Path(args.repo_root).resolve()
+    if not repo_root.is_dir():
+        logger.error("Repo root does not exist or is not a directory: %s", repo_root)
+        return 1
+
+    state = WatchState(repo_root, backend=args.discovery)
+    started = time.perf_counter()
+    # The watcher goes first, so files saved during the initial scan are
+    # reported by its first wait() instead of being missed.
+    try:
+        watcher = open_watcher(repo_root, args.backend, args.interval)
+    except (OSError, ValueError) as exc:
+        logger.error("Cannot watch %s: %s", repo_root, exc)
+        return 1
+    try:
+        findings = state.load()
+    except (OSError, ValueError) as exc:
+        watcher.close()
+        logger.error("Cannot watch %s: %s", repo_root, exc)
+        return 1
+    for rel_path in sorted(state.findings):
+        print("\n".join(format_update(rel_path, state.findings[rel_path])), flush=True)
+    logger.info(
+        "Watching %s (%s) — %d finding(s) in %d file(s), initial scan took %.2fs.",
+        repo_root,
+        type(watcher).__name__,
+        len(findings),
+        len(state.findings),
+        time.perf_counter() - started,
+    )
+
+    server: FindingsServer | None = None
+    try:
+        if args.socket:
+            try:
+                server = FindingsServer(args.socket, state)
+            except OSError as exc:
+                logger.error("Cannot listen on %s: %s", args.socket, exc)
+                return 1
+            threading.Thread(
+                target=server.serve_forever, name="repo-consolidation-socket", daemon=True,
+            ).start()
+            logger.info("Serving findings on %s", args.socket)
+        while True:
+            changed = watcher.wait()
+            started = time.perf_counter()
+            updates = state.update(changed)
+            for rel_path, file_findings in updates.items():
+                print("\n".join(format_update(rel_path, file_findings)), flush=True)
+            if updates:
+                logger.debug(
+                    "Re-scanned %d changed file(s) in %.1f ms.",
+                    len(updates),
+                    (time.perf_counter() - started) * 1000,
+                )
+    except KeyboardInterrupt:
+        logger.info("Stopped watching %s.", repo_root)
+        return 0
+    finally:
+        watcher.close()
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+
+_SUBCOMMANDS = {"plan": _run_plan, "apply": _run_apply, "watch": _run_watch}
+
 
 if __name__ == "__main__":
     sys.exit(main())
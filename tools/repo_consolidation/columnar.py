@@ -0,0 +1,209 @@
+"""Columnar storage for large sets of findings.
+
+A :class:`FindingTable` holds findings as parallel integer arrays
+instead of one :class:`~tools.repo_consolidation.models.Finding` object
+each.  Strings that repeat across findings (paths, matched text, issue
+types, repo names, file types) are stored once in a shared pool and
+referenced by index, and the ``context`` line is not stored at all: the
+table records the byte offset and length of the line in its file and
+reads it back when a finding is materialized.
+
+Rows are materialized as ordinary :class:`Finding` objects on access, so
+a table can stand in for a ``list[Finding]`` wherever findings are only
+iterated or indexed::
+
+    table = FindingTable.from_findings(repo_root, scan_repo(repo_root))
+    for finding in table:
+        ...
+
+Contexts are read back from disk, so the files must not change between
+adding findings and reading them; do not keep a table across the apply
+stage.  A context that cannot be located in its file (rewritten by a
+fixer, or from a file with ``\\r``-only line breaks) is kept inline.
+"""
+
+from __future__ import annotations
+
+import mmap
+from array import array
+from collections.abc import Iterable, Iterator
+from itertools import groupby
+from pathlib import Path
+from typing import BinaryIO
+
+from tools.repo_consolidation.models import Finding
+from tools.repo_consolidation.scanner import _has_exotic_line_breaks, _is_utf8, _open_buffer
+
+# Offset recorded for a context that is stored inline.
+_INLINE = -1
+
+
+class FindingTable:
+    """Findings under *repo_root*, stored column by column.
+
+    Attributes:
+        root: Resolved repository root the findings' paths are relative to.
+    """
+
+    def __init__(self, repo_root: str | Path) -> None:
+        self.root = Path(repo_root).resolve()
+        self._strings: list[str] = []
+        self._string_ids: dict[str, int] = {}
+        self._latin1: set[int] = set()
+        self._path = array("I")
+        self._line = array("I")
+        self._matched = array("I")
+        self._issue = array("I")
+        self._repo = array("I")
+        self._type = array("I")
+        self._offset = array("q")
+        self._length = array("I")
+        self._inline: dict[int, str] = {}
+
+    @classmethod
+    def from_findings(cls, repo_root: str | Path, findings: Iterable[Finding]) -> FindingTable:
+        """Return a table holding *findings*, in order."""
+        table = cls(repo_root)
+        table.extend(findings)
+        return table
+
+    def _intern(self, value: str) -> int:
+        index = self._string_ids.get(value)
+        if index is None:
+            index = self._string_ids[value] = len(self._strings)
+            self._strings.append(value)
+        return index
+
+    def extend(self, findings: Iterable[Finding]) -> None:
+        """Append *findings*, reading each file once to locate their contexts."""
+        for file_path, group in groupby(findings, key=lambda f: f.file_path):
+            self._extend_file(file_path, list(group))
+
+    def append(self, finding: Finding) -> None:
+        """Append a single finding."""
+        self._extend_file(finding.file_path, [finding])
+
+    def _extend_file(self, file_path: str, findings: list[Finding]) -> None:
+        path_id = self._intern(file_path)
+        spans = self._locate(file_path, findings)
+        for finding, (offset, length) in zip(findings, spans):
+            if offset == _INLINE:
+                self._inline[len(self._line)] = finding.context
+            self._path.append(path_id)
+            self._line.append(finding.line_number)
+            self._matched.append(self._intern(finding.matched_text))
+            self._issue.append(self._intern(finding.issue_type))
+            self._repo.append(self._intern(finding.old_repo_name))
+            self._type.append(self._intern(finding.file_type))
+            self._offset.append(offset)
+            self._length.append(length)
+
+    def _locate(self, file_path: str, findings: list[Finding]) -> list[tuple[int, int]]:
+        """Return the ``(offset, length)`` of each finding's context in *file_path*.
+
+        Contexts that do not match the line on disk get ``(_INLINE, 0)``.
+        """
+        inline = [(_INLINE, 0)] * len(findings)
+        buf = _open_buffer(self.root / file_path)
+        if buf is None:
+            return inline
+        try:
+            encoding = "utf-8" if _is_utf8(buf) else "latin-1"
+            if _has_exotic_line_breaks(buf, encoding):
+                return inline
+            if encoding == "latin-1":
+                self._latin1.add(self._string_ids[file_path])
+            spans: list[tuple[int, int]] = []
+            line_no, start = 1, 0
+            for finding in findings:
+                target = finding.line_number
+                if target < 1:
+                    spans.append((_INLINE, 0))
+                    continue
+                if target < line_no:
+                    line_no, start = 1, 0
+                while line_no < target and start != -1:
+                    start = buf.find(b"\n", start)
+                    if start != -1:
+                        start += 1
+                        line_no += 1
+                if start == -1:
+                    spans.append((_INLINE, 0))
+                    continue
+                end = buf.find(b"\n", start)
+                raw = buf[start:len(buf) if end == -1 else end]
+                if raw.endswith(b"\r"):
+                    raw = raw[:-1]
+                if raw.decode(encoding) == finding.context:
+                    spans.append((start, len(raw)))
+                else:
+                    spans.append((_INLINE, 0))
+            return spans
+        finally:
+            if isinstance(buf, mmap.mmap):
+                buf.close()
+
+    def __len__(self) -> int:
+        return len(self._line)
+
+    def __getitem__(self, index: int) -> Finding:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("FindingTable index out of range")
+        return self._row(index, self._read_context(index))
+
+    def __iter__(self) -> Iterator[Finding]:
+        # Rows of one file are normally contiguous, so each file is opened once.
+        path_id = -1
+        handle: BinaryIO | None = None
+        try:
+            for index in range(len(self)):
+                offset = self._offset[index]
+                if offset == _INLINE:
+                    context = self._inline[index]
+                else:
+                    if self._path[index] != path_id:
+                        if handle is not None:
+                            handle.close()
+                        path_id = self._path[index]
+                        handle = open(self.root / self._strings[path_id], "rb")
+                    context = self._decode(index, handle, offset)
+                yield self._row(index, context)
+        finally:
+            if handle is not None:
+                handle.close()
+
+    def context(self, index: int) -> str:
+        """Return the context line of the finding at *index* without building the row."""
+        if index < 0:
+            index += len(self)
+        return self._read_context(index)
+
+    def to_findings(self) -> list[Finding]:
+        """Materialize every row as a :class:`Finding`."""
+        return list(self)
+
+    def _read_context(self, index: int) -> str:
+        offset = self._offset[index]
+        if offset == _INLINE:
+            return self._inline[index]
+        with open(self.root / self._strings[self._path[index]], "rb") as handle:
+            return self._decode(index, handle, offset)
+
+    def _decode(self, index: int, handle: BinaryIO, offset: int) -> str:
+        handle.seek(offset)
+        raw = handle.read(self._length[index])
+        return raw.decode("latin-1" if self._path[index] in self._latin1 else "utf-8")
+
+    def _row(self, index: int, context: str) -> Finding:
+        strings = self._strings
+        return Finding(
+            file_path=strings[self._path[index]],
+            line_number=self._line[index],
+            matched_text=strings[self._matched[index]],
+            issue_type=strings[self._issue[index]],
+            old_repo_name=strings[self._repo[index]],
+            context=context,
+            file_type=strings[self._type[index]],
+        )
@@ -2,6 +2,8 @@
 
 Each fixer function takes a :class:`Finding` and returns a
 :class:`Replacement` describing how to remediate the issue in place.
+:func:`fix_file` runs the fixers over all findings of one file at once
+and merges fixes that land on the same line into a :class:`FileEdits`.
 
 This module currently contains the old-URL fixer.  Additional fixers
 (credentials, account IDs, Docker images) will be added in subsequent
@@ -15,10 +17,15 @@ from __future__ import annotations
 
 import logging
 import os
+import posixpath
 import re
+from collections.abc import Callable
+from dataclasses import replace
 from pathlib import PurePosixPath
 
-from tools.repo_consolidation.models import Finding, Replacement
+from tools.repo_consolidation.go_index import GoModuleIndex
+from tools.repo_consolidation.manifest import PathIndex
+from tools.repo_consolidation.models import FileEdits, Finding, Replacement
 from tools.repo_consolidation import url_map as umap
 
 logger = logging.getLogger(__name__)
@@ -91,16 +98,46 @@ def _is_json_metadata_field(context_line: str) -> bool:
     return False
 
 
-def _target_exists(repo_root: str, consolidated_path: str) -> bool:
-    """Check whether *consolidated_path* exists under *repo_root*."""
+def _target_exists(
+    repo_root: str,
+    consolidated_path: str,
+    path_index: PathIndex | None = None,
+) -> bool:
+    """Check whether *consolidated_path* exists under *repo_root*.
+
+    A hit in *path_index* is answered without touching the disk.  A miss
+    is confirmed on disk, since discovery does not record empty
+    directories or files it skips.
+    """
+    if path_index is not None and path_index.exists(consolidated_path):
+        return True
     full = os.path.join(repo_root, consolidated_path)
     return os.path.exists(full)
 
 
+def _classify_context(context_line: str, file_type: str) -> str:
+    """Return which replacement strategy applies to an old-URL line.
+
+    One of ``clone`` (git clone command), ``go`` (Go import path in a
+    ``.go`` or ``go.mod`` file), ``json`` (package.json-style metadata
+    field), ``markdown`` (``[text](url)`` link) or ``raw``.
+    """
+    if _GIT_CLONE_RE.search(context_line):
+        return "clone"
+    if _is_go_file(file_type):
+        return "go"
+    if file_type == ".json" and _is_json_metadata_field(context_line):
+        return "json"
+    if _MARKDOWN_LINK_RE.search(context_line):
+        return "markdown"
+    return "raw"
+
+
 def fix_old_url(
     finding: Finding,
     url_map_module: object | None = None,
     repo_root: str = ".",
+    path_index: PathIndex | None = None,
 ) -> Replacement | None:
     """Produce a :class:`Replacement` for an ``old_url`` finding.
 
@@ -110,11 +147,15 @@ def fix_old_url(
         A :class:`Finding` with ``issue_type == "old_url"``.
     url_map_module:
         The URL-map module (defaults to :mod:`tools.repo_consolidation.url_map`).
-        Accepts any object exposing ``lookup``, ``resolve_new_path``,
-        ``compute_relative_path``, ``CONSOLIDATED_CLONE_URL``, and
-        ``CONSOLIDATED_TREE_URL``.
+        Accepts any object exposing ``lookup``, ``route``,
+        ``resolve_new_path``, ``compute_relative_path``,
+        ``CONSOLIDATED_CLONE_URL``, and ``CONSOLIDATED_TREE_URL``.
     repo_root:
         Path to the repository root, used for target-existence checks.
+    path_index:
+        Optional :class:`~tools.repo_consolidation.manifest.PathIndex`
+        of the whole repository; target-existence checks then only go
+        to the filesystem for targets missing from it.
 
     Returns
     -------
@@ -122,99 +163,138 @@ def fix_old_url(
         A replacement descriptor, or *None* when the old repo name is
         not in the URL map (unmapped finding).
     """
-    if url_map_module is None:
-        url_map_module = umap
-
-    old_repo_name = finding.old_repo_name
-    if not old_repo_name:
-        logger.warning("Finding has no old_repo_name: %s", finding)
-        return None
-
-    # 1. Look up the consolidated path.
-    consolidated_path = url_map_module.lookup(old_repo_name)
-    if consolidated_path is None:
-        logger.info("Unmapped repo name %r — skipping fix", old_repo_name)
-        return None
-
-    context_line = finding.context
-    matched_text = finding.matched_text
-    source_file = finding.file_path
-    file_type = finding.file_type
+    return fix_old_urls([finding], url_map_module, repo_root, path_index)
 
-    # Determine the full old URL from the context line for subpath extraction.
-    # The matched_text from the scanner is just the domain/org/repo portion;
-    # the actual URL in the line may include a longer path.
-    full_old_url = _find_full_url(context_line, old_repo_name)
 
-    # Extract any subpath beyond the repo name (e.g. /blob/main/docs/setup.md).
-    raw_subpath = _extract_subpath(full_old_url, old_repo_name)
-    clean_subpath = _strip_github_prefix(raw_subpath)
+def fix_old_urls(
+    findings: list[Finding],
+    url_map_module: object | None = None,
+    repo_root: str = ".",
+    path_index: PathIndex | None = None,
+) -> Replacement | None:
+    """Produce one :class:`Replacement` for all ``old_url`` findings on a line.
 
-    # Build the target path within the consolidated repo.
-    if clean_subpath:
-        target_in_repo = f"{consolidated_path}/{clean_subpath}"
-    else:
-        target_in_repo = consolidated_path
+    The line is classified once; each finding's URL is then rewritten in
+    turn on the progressively updated line, so several old URLs on one
+    line all end up fixed.  Findings after the first whose repo no longer
+    appears on the updated line (an earlier rewrite already covered it)
+    are skipped.
 
-    # Determine whether the target exists on disk.
-    target_exists = _target_exists(repo_root, target_in_repo)
-    # Also check without subpath if the full target doesn't exist.
-    if not target_exists and clean_subpath:
-        target_exists = _target_exists(repo_root, consolidated_path)
-        # Fall back to just the consolidated path if subpath target missing.
-        if target_exists:
-            target_in_repo = consolidated_path
+    Parameters
+    ----------
+    findings:
+        ``old_url`` findings sharing one file and line number.
+    url_map_module:
+        See :func:`fix_old_url`.
+    repo_root:
+        Path to the repository root, used for target-existence checks.
+    path_index:
+        See :func:`fix_old_url`.
 
-    unverified = not target_exists
+    Returns
+    -------
+    Replacement | None
+        The merged replacement, or *None* when no finding maps to a
+        consolidated path.
+    """
+    if url_map_module is None:
+        url_map_module = umap
+    if not findings:
+        return None
 
-    # --- Context-aware replacement logic ---
+    first = findings[0]
+    context_line = first.context
+    kind = _classify_context(context_line, first.file_type)
 
     new_text = context_line
-    comment: str | None = None
+    comments: list[str] = []
+    fixed = False
 
-    # Case 1: Git clone URL
-    if _GIT_CLONE_RE.search(context_line):
-        new_text = _replace_clone_url(context_line, full_old_url, url_map_module)
-        comment = None
+    for finding in findings:
+        old_repo_name = finding.old_repo_name
+        if not old_repo_name:
+            logger.warning("Finding has no old_repo_name: %s", finding)
+            continue
 
-    # Case 2: Go import path (in .go or go.mod files)
-    elif _is_go_file(file_type):
-        new_text = _replace_go_import(
-            context_line, old_repo_name, consolidated_path, clean_subpath,
-        )
+        # 1. Look up the consolidated path.
+        consolidated_path = url_map_module.lookup(old_repo_name)
+        if consolidated_path is None:
+            logger.info("Unmapped repo name %r — skipping fix", old_repo_name)
+            continue
+
+        if fixed and not umap.url_matcher_for(old_repo_name).finditer(new_text, old_repo_name):
+            continue
+
+        # Determine the full old URL from the line for subpath extraction.
+        # The matched_text from the scanner is just the domain/org/repo
+        # portion; the actual URL in the line may include a longer path.
+        full_old_url = _find_full_url(new_text, old_repo_name)
+
+        # Extract any subpath beyond the repo name (e.g. /blob/main/docs/setup.md).
+        raw_subpath = _extract_subpath(full_old_url, old_repo_name)
+        clean_subpath = _strip_github_prefix(raw_subpath)
+
+        # Build the target path within the consolidated repo, following
+        # any subpath route of the map.
+        target_in_repo = url_map_module.route(old_repo_name, clean_subpath) or consolidated_path
+
+        # Determine whether the target exists on disk.
+        target_exists = _target_exists(repo_root, target_in_repo, path_index)
+        # Also check without subpath if the full target doesn't exist.
+        if not target_exists and clean_subpath:
+            target_exists = _target_exists(repo_root, consolidated_path, path_index)
+            # Fall back to just the consolidated path if subpath target missing.
+            if target_exists:
+                target_in_repo = consolidated_path
+
+        # --- Context-aware replacement logic ---
+
+        # Case 1: Git clone URL
+        if kind == "clone":
+            new_text = _replace_clone_url(new_text, full_old_url, url_map_module)
+
+        # Case 2: Go import path (in .go or go.mod files)
+        elif kind == "go":
+            new_text = _replace_go_import(
+                new_text, old_repo_name, consolidated_path, clean_subpath,
+            )
 
-    # Case 3: JSON metadata fields (package.json repository/bugs/homepage)
-    elif file_type == ".json" and _is_json_metadata_field(context_line):
-        new_text = _replace_json_metadata(
-            context_line, full_old_url, consolidated_path, url_map_module,
-        )
+        # Case 3: JSON metadata fields (package.json repository/bugs/homepage)
+        elif kind == "json":
+            new_text = _replace_json_metadata(
+                new_text, full_old_url, consolidated_path, url_map_module,
+            )
 
-    # Case 4: Markdown link [text](url)
-    elif _MARKDOWN_LINK_RE.search(context_line):
-        new_text = _replace_markdown_link(
-            context_line, old_repo_name, source_file, target_in_repo,
-            url_map_module,
-        )
+        # Case 4: Markdown link [text](url)
+        elif kind == "markdown":
+            new_text = _replace_markdown_link(
+                new_text, old_repo_name, finding.file_path, target_in_repo,
+                url_map_module,
+            )
 
-    # Case 5: Default — raw URL in comments, docs, strings, etc.
-    else:
-        new_text = _replace_raw_url(
-            context_line, full_old_url, old_repo_name, source_file,
-            target_in_repo, url_map_module,
-        )
+        # Case 5: Default — raw URL in comments, docs, strings, etc.
+        else:
+            new_text = _replace_raw_url(
+                new_text, full_old_url, old_repo_name, finding.file_path,
+                target_in_repo, url_map_module,
+            )
 
-    if unverified:
-        comment = f"# NOTE: target path '{target_in_repo}' could not be verified on disk"
+        if not target_exists:
+            comment = f"# NOTE: target path '{target_in_repo}' could not be verified on disk"
+            if comment not in comments:
+                comments.append(comment)
+        fixed = True
 
-    action = "replace"
+    if not fixed:
+        return None
 
     return Replacement(
-        file_path=finding.file_path,
-        line_number=finding.line_number,
+        file_path=first.file_path,
+        line_number=first.line_number,
         old_text=context_line,
         new_text=new_text,
-        comment=comment,
-        action=action,
+        comment="\n".join(comments) or None,
+        action="replace",
     )
 
 
@@ -224,31 +304,17 @@ def fix_old_url(
 
 
 def _find_full_url(context_line: str, repo_name: str) -> str:
-    """Extract the longest URL containing *repo_name* from *context_line*.
+    """Extract the URL for *repo_name* from *context_line*.
 
+    An ``https://`` URL is preferred over a bare ``github.com/...`` one.
     Falls back to reconstructing a minimal URL if no match is found.
     """
-    # Try to grab a full https://github.com/... URL from the line.
-    url_re = re.compile(
-        r"https?://github\.com/(DevCloudNinjas|devcloudninjas)/"
-        + re.escape(repo_name)
-        + r"[^\s\)\"'>\]]*",
-        re.IGNORECASE,
-    )
-    m = url_re.search(context_line)
-    if m:
-        return m.group(0).rstrip("/")
-
-    # Also try without protocol (bare github.com/...)
-    bare_re = re.compile(
-        r"github\.com/(DevCloudNinjas|devcloudninjas)/"
-        + re.escape(repo_name)
-        + r"[^\s\)\"'>\]]*",
-        re.IGNORECASE,
-    )
-    m = bare_re.search(context_line)
-    if m:
-        return m.group(0).rstrip("/")
+    matches = umap.url_matcher_for(repo_name).finditer(context_line, repo_name)
+    for m in matches:
+        if m.has_scheme:
+            return m.url.rstrip("/")
+    if matches:
+        return matches[0].url.rstrip("/")
 
     return f"github.com/DevCloudNinjas/{repo_name}"
 
@@ -281,19 +347,17 @@ def _replace_go_import(
     # Build the new import path.
     new_import_base = f"github.com/DevCloudNinjas/DevOps-Projects/{consolidated_path}"
 
-    # Match the old import path in the line.
-    pattern = re.compile(
-        r"github\.com/(DevCloudNinjas|devcloudninjas)/"
-        + re.escape(old_repo_name)
-        + r"(/[^\s\"']*)?",
-        re.IGNORECASE,
-    )
-
-    def _repl(m: re.Match[str]) -> str:
-        suffix = m.group(2) or ""
-        return new_import_base + suffix
-
-    return pattern.sub(_repl, context_line)
+    # Rewrite each old import path (host, repo and any /sub/package
+    # suffix), keeping everything else on the line as is.
+    parts: list[str] = []
+    pos = 0
+    for m in umap.url_matcher_for(old_repo_name).finditer(context_line, old_repo_name):
+        suffix = m.rest if m.rest.startswith("/") else ""
+        parts.append(context_line[pos:m.host_start])
+        parts.append(new_import_base + suffix)
+        pos = m.repo_end + len(suffix)
+    parts.append(context_line[pos:])
+    return "".join(parts)
 
 
 def _replace_json_metadata(
@@ -316,34 +380,29 @@ def _replace_markdown_link(
     url_map_module: object,
 ) -> str:
     """Replace old URLs inside markdown link syntax with relative paths."""
+    matcher = umap.url_matcher_for(old_repo_name)
+    wanted = old_repo_name.lower()
+
     def _repl(m: re.Match[str]) -> str:
         link_text = m.group(1)
         old_url = m.group(2)
 
-        # Extract subpath from this specific URL.
-        raw_sub = _extract_subpath(old_url, old_repo_name)
-        clean_sub = _strip_github_prefix(raw_sub)
+        # Only links to this repo are rewritten.
+        url_match = matcher.match(old_url)
+        if url_match is None or url_match.repo.lower() != wanted:
+            return m.group(0)
 
-        consolidated_path = url_map_module.lookup(old_repo_name)
-        if consolidated_path is None:
-            return m.group(0)  # leave unchanged
+        # Subpath from this specific URL.
+        clean_sub = _strip_github_prefix(old_url[url_match.repo_end:].lstrip("/"))
 
-        if clean_sub:
-            target = f"{consolidated_path}/{clean_sub}"
-        else:
-            target = consolidated_path
+        target = url_map_module.route(old_repo_name, clean_sub)
+        if target is None:
+            return m.group(0)  # leave unchanged
 
         rel_path = url_map_module.compute_relative_path(source_file, target)
         return f"[{link_text}]({rel_path})"
 
-    # Build a pattern that matches markdown links containing the old repo name.
-    pattern = re.compile(
-        r"\[([^\]]*)\]\((https?://github\.com/(DevCloudNinjas|devcloudninjas)/"
-        + re.escape(old_repo_name)
-        + r"[^)]*)\)",
-        re.IGNORECASE,
-    )
-    return pattern.sub(_repl, context_line)
+    return _MARKDOWN_LINK_RE.sub(_repl, context_line)
 
 
 def _replace_raw_url(
@@ -360,18 +419,13 @@ def _replace_raw_url(
     tree URL.  For bare ``github.com/...`` references, uses a relative
     path when the source is a documentation file, or the tree URL otherwise.
     """
-    consolidated_path = url_map_module.lookup(old_repo_name)
-    if consolidated_path is None:
-        return context_line
-
     # Extract subpath for this specific URL occurrence.
     raw_sub = _extract_subpath(full_old_url, old_repo_name)
     clean_sub = _strip_github_prefix(raw_sub)
 
-    if clean_sub:
-        target = f"{consolidated_path}/{clean_sub}"
-    else:
-        target = consolidated_path
+    target = url_map_module.route(old_repo_name, clean_sub)
+    if target is None:
+        return context_line
 
     # For full https:// URLs in comments/docs, use the consolidated tree URL.
     if full_old_url.startswith("http"):
@@ -587,140 +641,6 @@ def fix_account_id(finding: Finding) -> Replacement:
         action="replace",
     )
 
-# ---------------------------------------------------------------------------
-# Go module fixer
-# ---------------------------------------------------------------------------
-
-
-def fix_go_module(
-    finding: Finding,
-    url_map_module: object | None = None,
-    repo_root: str = ".",
-) -> list[Replacement]:
-    """Fix a ``go.mod`` module declaration and update sibling Go source files.
-
-    When a ``go.mod`` file declares a module path referencing an old
-    standalone repo (e.g. ``github.com/devcloudninjas/devops-bootcamp/...``),
-    this function:
-
-    1. Updates the ``module`` directive in ``go.mod`` to use the
-       consolidated repo path.
-    2. Scans ``require`` directives in the same ``go.mod`` for old repo
-       references and updates them.
-    3. Walks sibling ``.go`` files in the same module directory tree and
-       updates any import paths that reference the old module path.
-
-    Parameters
-    ----------
-    finding:
-        A :class:`Finding` for a ``go.mod`` file with ``issue_type == "old_url"``.
-    url_map_module:
-        The URL-map module (defaults to :mod:`tools.repo_consolidation.url_map`).
-    repo_root:
-        Path to the repository root.
-
-    Returns
-    -------
-    list[Replacement]
-        One or more replacements — the first for the ``go.mod`` file itself,
-        followed by any Go source files that need import path updates.
-
-    Requirements: 7.2, 7.3, 7.4, 8.4
-    """
-    if url_map_module is None:
-        url_map_module = umap
-
-    old_repo_name = finding.old_repo_name
-    if not old_repo_name:
-        return []
-
-    consolidated_path = url_map_module.lookup(old_repo_name)
-    if consolidated_path is None:
-        return []
-
-    replacements: list[Replacement] = []
-
-    # --- 1. Fix the go.mod file itself ---
-    gomod_path = os.path.join(repo_root, finding.file_path)
-    new_import_base = f"github.com/DevCloudNinjas/DevOps-Projects/{consolidated_path}"
-
-    # Build regex to match old module/import paths in go.mod
-    old_import_pattern = re.compile(
-        r"github\.com/(DevCloudNinjas|devcloudninjas)/"
-        + re.escape(old_repo_name)
-        + r"(/[^\s\"']*)?",
-        re.IGNORECASE,
-    )
-
-    # Read the full go.mod content and update all matching lines
-    try:
-        with open(gomod_path, encoding="utf-8") as fh:
-            gomod_lines = fh.readlines()
-    except OSError:
-        # If we can't read the file, just fix the single finding line
-        new_text = _replace_go_import(
-            finding.context, old_repo_name, consolidated_path, "",
-        )
-        replacements.append(Replacement(
-            file_path=finding.file_path,
-            line_number=finding.line_number,
-            old_text=finding.context,
-            new_text=new_text,
-            comment=None,
-            action="replace",
-        ))
-        return replacements
-
-    for line_no, line in enumerate(gomod_lines, start=1):
-        line_stripped = line.rstrip("\n")
-        if old_import_pattern.search(line_stripped):
-            new_line = _replace_go_import(
-                line_stripped, old_repo_name, consolidated_path, "",
-            )
-            replacements.append(Replacement(
-                file_path=finding.file_path,
-                line_number=line_no,
-                old_text=line_stripped,
-                new_text=new_line,
-                comment=None,
-                action="replace",
-            ))
-
-    # --- 2. Scan sibling .go files for import paths referencing the old module ---
-    gomod_abs_dir = os.path.dirname(gomod_path)
-    if os.path.isdir(gomod_abs_dir):
-        for dirpath, _dirnames, filenames in os.walk(gomod_abs_dir):
-            for fname in filenames:
-                if not fname.endswith(".go"):
-                    continue
-                go_file_abs = os.path.join(dirpath, fname)
-                try:
-                    with open(go_file_abs, encoding="utf-8") as fh:
-                        go_lines = fh.readlines()
-                except OSError:
-                    continue
-
-                # Compute relative path from repo root
-                go_file_rel = os.path.relpath(go_file_abs, repo_root).replace("\\", "/")
-
-                for go_line_no, go_line in enumerate(go_lines, start=1):
-                    go_line_stripped = go_line.rstrip("\n")
-                    if old_import_pattern.search(go_line_stripped):
-                        new_go_line = _replace_go_import(
-                            go_line_stripped, old_repo_name,
-                            consolidated_path, "",
-                        )
-                        replacements.append(Replacement(
-                            file_path=go_file_rel,
-                            line_number=go_line_no,
-                            old_text=go_line_stripped,
-                            new_text=new_go_line,
-                            comment=None,
-                            action="replace",
-                        ))
-
-    return replacements
-
 
 # ---------------------------------------------------------------------------
 # Docker image fixer
@@ -774,15 +694,126 @@ def fix_docker_image(finding: Finding) -> Replacement:
         comment=None,
         action="replace",
     )
+
+
 # ---------------------------------------------------------------------------
 # Go module fixer
 # ---------------------------------------------------------------------------
 
 
+def _merge_go_edit(
+    edits: dict[tuple[str, int], Replacement],
+    file_path: str,
+    line_number: int,
+    line: str,
+    old_repo_name: str,
+    consolidated_path: str,
+) -> None:
+    """Record a Go path rewrite, stacking it onto an earlier edit of the same line."""
+    key = (file_path, line_number)
+    existing = edits.get(key)
+    base = existing.new_text if existing is not None else line
+    new_text = _replace_go_import(base, old_repo_name, consolidated_path, "")
+    if existing is not None and new_text == existing.new_text:
+        return
+    edits[key] = Replacement(
+        file_path=file_path,
+        line_number=line_number,
+        old_text=line,
+        new_text=new_text,
+        comment=None,
+        action="replace",
+    )
+
+
+def fix_go_modules(
+    findings: list[Finding],
+    url_map_module: object | None = None,
+    repo_root: str = ".",
+    index: GoModuleIndex | None = None,
+) -> list[Replacement]:
+    """Fix every ``go.mod`` finding in *findings* against one module index.
+
+    Each finding is resolved as described in :func:`fix_go_module`, but
+    the module directories are walked and their files read once for the
+    whole batch.  Replacements are deduplicated per ``(file, line)``: a
+    line touched by several findings — the same module reported twice,
+    nested modules, or two old repos on one line — yields one
+    replacement carrying every rewrite.
+
+    Parameters
+    ----------
+    findings:
+        ``go.mod`` findings with ``issue_type == "old_url"``.
+    url_map_module:
+        The URL-map module (defaults to :mod:`tools.repo_consolidation.url_map`).
+    repo_root:
+        Path to the repository root.
+    index:
+        A :class:`GoModuleIndex` to reuse across calls; a fresh one is
+        built for *repo_root* when omitted.
+
+    Returns
+    -------
+    list[Replacement]
+        Replacements in finding order; within a module the ``go.mod``
+        comes first, followed by its Go sources in path order.
+    """
+    if url_map_module is None:
+        url_map_module = umap
+    if index is None:
+        index = GoModuleIndex(repo_root)
+
+    edits: dict[tuple[str, int], Replacement] = {}
+    resolved: set[tuple[str, str]] = set()
+
+    for finding in findings:
+        old_repo_name = finding.old_repo_name
+        if not old_repo_name:
+            continue
+        consolidated_path = url_map_module.lookup(old_repo_name)
+        if consolidated_path is None:
+            continue
+
+        key = (finding.file_path, old_repo_name.lower())
+        if key in resolved:
+            continue
+        resolved.add(key)
+
+        gomod = index.source(finding.file_path)
+        if gomod is None:
+            # If we can't read the file, just fix the single finding line
+            _merge_go_edit(
+                edits, finding.file_path, finding.line_number,
+                finding.context, old_repo_name, consolidated_path,
+            )
+            continue
+
+        # Shared matcher for old module/import paths in go.mod and .go files
+        matcher = umap.url_matcher_for(old_repo_name)
+        module_dir = posixpath.dirname(finding.file_path)
+        sources = [(finding.file_path, gomod)]
+        sources.extend((rel, index.source(rel)) for rel in index.go_files(module_dir))
+
+        for rel_path, source in sources:
+            if source is None:
+                continue
+            for line_no in source.reference_lines:
+                line = source.lines[line_no - 1]
+                if matcher.finditer(line, old_repo_name):
+                    _merge_go_edit(
+                        edits, rel_path, line_no, line,
+                        old_repo_name, consolidated_path,
+                    )
+
+    return list(edits.values())
+
+
 def fix_go_module(
     finding: Finding,
     url_map_module: object | None = None,
     repo_root: str = ".",
+    index: GoModuleIndex | None = None,
 ) -> list[Replacement]:
     """Fix a ``go.mod`` module declaration and update sibling Go source files.
 
@@ -794,8 +825,8 @@ def fix_go_module(
        consolidated repo path.
     2. Scans ``require`` directives in the same ``go.mod`` for old repo
        references and updates them.
-    3. Walks sibling ``.go`` files in the same module directory tree and
-       updates any import paths that reference the old module path.
+    3. Updates references to the old module path in the ``.go`` files
+       of the same module directory tree, as listed by *index*.
 
     Parameters
     ----------
@@ -805,6 +836,9 @@ def fix_go_module(
         The URL-map module (defaults to :mod:`tools.repo_consolidation.url_map`).
     repo_root:
         Path to the repository root.
+    index:
+        A :class:`GoModuleIndex` shared across findings of one run, so
+        each module is walked and read once; built on demand if omitted.
 
     Returns
     -------
@@ -814,100 +848,137 @@ def fix_go_module(
 
     Requirements: 7.2, 7.3, 7.4, 8.4
     """
-    if url_map_module is None:
-        url_map_module = umap
+    return fix_go_modules([finding], url_map_module, repo_root, index)
 
-    old_repo_name = finding.old_repo_name
-    if not old_repo_name:
-        return []
 
-    consolidated_path = url_map_module.lookup(old_repo_name)
-    if consolidated_path is None:
-        return []
+# ---------------------------------------------------------------------------
+# Per-file batch fixing
+# ---------------------------------------------------------------------------
 
-    replacements: list[Replacement] = []
+#: Fixes every finding of one issue type on one line; see :func:`fix_file`.
+BatchFixer = Callable[[list[Finding]], Replacement | None]
 
-    # --- 1. Fix the go.mod file itself ---
-    gomod_path = os.path.join(repo_root, finding.file_path)
-    gomod_dir = os.path.dirname(finding.file_path)
 
-    new_import_base = f"github.com/DevCloudNinjas/DevOps-Projects/{consolidated_path}"
+def per_finding(fixer: Callable[[Finding], Replacement | None]) -> BatchFixer:
+    """Adapt a single-finding fixer to the :data:`BatchFixer` interface.
 
-    # Build regex to match old module/import paths in go.mod
-    old_import_pattern = re.compile(
-        r"github\.com/(DevCloudNinjas|devcloudninjas)/"
-        + re.escape(old_repo_name)
-        + r"(/[^\s\"']*)?",
-        re.IGNORECASE,
-    )
+    The fixer is called once per finding, each time with the line as
+    rewritten by the previous calls, and the results are folded into one
+    replacement.  A ``delete_file`` or ``flag_for_review`` result is
+    returned as is, since it supersedes any line edit.
+    """
 
-    # Read the full go.mod content and update all matching lines
-    try:
-        with open(gomod_path, encoding="utf-8") as fh:
-            gomod_lines = fh.readlines()
-    except OSError:
-        # If we can't read the file, just fix the single finding line
-        new_text = _replace_go_import(
-            finding.context, old_repo_name, consolidated_path, "",
-        )
-        replacements.append(Replacement(
-            file_path=finding.file_path,
-            line_number=finding.line_number,
-            old_text=finding.context,
-            new_text=new_text,
-            comment=None,
-            action="replace",
-        ))
-        return replacements
-
-    for line_no, line in enumerate(gomod_lines, start=1):
-        line_stripped = line.rstrip("\n")
-        if old_import_pattern.search(line_stripped):
-            new_line = _replace_go_import(
-                line_stripped, old_repo_name, consolidated_path, "",
-            )
-            replacements.append(Replacement(
-                file_path=finding.file_path,
-                line_number=line_no,
-                old_text=line_stripped,
-                new_text=new_line,
-                comment=None,
+    def fix_line(findings: list[Finding]) -> Replacement | None:
+        merged: Replacement | None = None
+        comments: list[str] = []
+        for finding in findings:
+            if merged is not None:
+                finding = replace(finding, context=merged.new_text)
+            result = fixer(finding)
+            if result is None:
+                continue
+            if result.action != "replace":
+                return result
+            if result.comment and result.comment not in comments:
+                comments.append(result.comment)
+            merged = Replacement(
+                file_path=result.file_path,
+                line_number=result.line_number,
+                old_text=findings[0].context,
+                new_text=result.new_text,
+                comment="\n".join(comments) or None,
                 action="replace",
-            ))
-
-    # --- 2. Scan sibling .go files for import paths referencing the old module ---
-    gomod_abs_dir = os.path.dirname(gomod_path)
-    if os.path.isdir(gomod_abs_dir):
-        for dirpath, _dirnames, filenames in os.walk(gomod_abs_dir):
-            for fname in filenames:
-                if not fname.endswith(".go"):
-                    continue
-                go_file_abs = os.path.join(dirpath, fname)
-                try:
-                    with open(go_file_abs, encoding="utf-8") as fh:
-                        go_lines = fh.readlines()
-                except OSError:
-                    continue
-
-                # Compute relative path from repo root
-                go_file_rel = os.path.relpath(go_file_abs, repo_root).replace("\\", "/")
-
-                for go_line_no, go_line in enumerate(go_lines, start=1):
-                    go_line_stripped = go_line.rstrip("\n")
-                    if old_import_pattern.search(go_line_stripped):
-                        new_go_line = _replace_go_import(
-                            go_line_stripped, old_repo_name,
-                            consolidated_path, "",
-                        )
-                        replacements.append(Replacement(
-                            file_path=go_file_rel,
-                            line_number=go_line_no,
-                            old_text=go_line_stripped,
-                            new_text=new_go_line,
-                            comment=None,
-                            action="replace",
-                        ))
-
-    return replacements
+            )
+        return merged
+
+    return fix_line
 
 
+def default_fixers(repo_root: str = ".") -> dict[str, BatchFixer]:
+    """Return the issue type → :data:`BatchFixer` mapping for *repo_root*."""
+    return {
+        "old_url": lambda findings: fix_old_urls(findings, repo_root=repo_root),
+        "credential": per_finding(fix_credential),
+        "hardcoded_account_id": per_finding(fix_account_id),
+        "stale_docker_image": per_finding(fix_docker_image),
+    }
+
+
+def fix_file(
+    findings: list[Finding],
+    fixers: dict[str, BatchFixer] | None = None,
+) -> FileEdits:
+    """Fix all *findings* of one file and return them as one edit set.
+
+    Findings are grouped by line, then by issue type in the order they
+    were found.  Each group goes to its batch fixer exactly once, with
+    the line as rewritten by the groups before it, so a line holding
+    e.g. an old URL and an account ID gets both fixes instead of the
+    last one winning, and every context classifier runs once per line.
+
+    A fixer that raises is logged and its group skipped; the rest of the
+    file is still fixed.
+
+    Parameters
+    ----------
+    findings:
+        Findings sharing one ``file_path``.
+    fixers:
+        Batch fixers keyed by issue type (defaults to
+        :func:`default_fixers` for the current directory).
+
+    Returns
+    -------
+    FileEdits
+        Span edits for changed lines plus any whole-file actions.
+    """
+    if fixers is None:
+        fixers = default_fixers()
+    file_path = findings[0].file_path if findings else ""
+    edits = FileEdits(file_path=file_path)
+
+    by_line: dict[int, dict[str, list[Finding]]] = {}
+    for finding in findings:
+        by_line.setdefault(finding.line_number, {}).setdefault(
+            finding.issue_type, [],
+        ).append(finding)
+
+    for line_number in sorted(by_line):
+        groups = by_line[line_number]
+        old_line = next(iter(groups.values()))[0].context
+        line = old_line
+        comments: list[str] = []
+        for issue_type, group in groups.items():
+            fixer = fixers.get(issue_type)
+            if fixer is None:
+                logger.warning(
+                    "No fixer for issue type %r in %s:%d — skipping",
+                    issue_type, file_path, line_number,
+                )
+                continue
+            if line != old_line:
+                group = [replace(f, context=line) for f in group]
+            try:
+                result = fixer(group)
+            except Exception:
+                logger.exception(
+                    "Error fixing %s:%d (%s) — skipping",
+                    file_path, line_number, issue_type,
+                )
+                continue
+            if result is None:
+                logger.debug(
+                    "Fixer returned None for %s:%d (%s) — unmapped or skipped",
+                    file_path, line_number, issue_type,
+                )
+                continue
+            if result.action != "replace":
+                edits.actions.append(result)
+                continue
+            line = result.new_text
+            if result.comment and result.comment not in comments:
+                comments.append(result.comment)
+        if line != old_line or comments:
+            edits.add_line(line_number, old_line, line, "\n".join(comments) or None)
+
+    return edits
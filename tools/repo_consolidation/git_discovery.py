@@ -0,0 +1,133 @@
+"""Git-index-driven file discovery for the repo consolidation pipeline.
+
+Enumerates candidate files with ``git ls-files`` instead of walking the
+tree, and classifies binaries from ``.gitattributes`` and well-known
+binary extensions so images, archives and fonts are never opened.  Used
+by :func:`tools.repo_consolidation.scanner.discover_files` whenever the
+repo root is inside a git checkout.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+#: Extensions whose formats always contain NUL bytes near the start, so
+#: the null-byte sniff in :func:`~tools.repo_consolidation.scanner.is_binary`
+#: would reject them anyway.
+BINARY_EXTENSIONS: frozenset[str] = frozenset({
+    ".7z", ".avif", ".bin", ".bmp", ".class", ".dll", ".dylib", ".eot",
+    ".exe", ".gif", ".gz", ".ico", ".jar", ".jpeg", ".jpg", ".mp3",
+    ".mp4", ".o", ".otf", ".png", ".pyc", ".so", ".tgz", ".tif",
+    ".tiff", ".ttf", ".war", ".webm", ".webp", ".woff", ".woff2",
+    ".xz", ".zip",
+})
+
+# Index entry modes that are not regular files (symlinks are kept and
+# resolved like the walker does; gitlinks/submodules are directories).
+_GITLINK_MODE = "160000"
+
+
+class GitDiscoveryError(RuntimeError):
+    """Raised when a git command needed for discovery fails."""
+
+
+def _git(root: Path, *args: str, stdin: bytes | None = None) -> bytes:
+    """Run ``git <args>`` in *root* and return its stdout."""
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=root,
+            input=stdin,
+            capture_output=True,
+            check=False,
+        )
+    except OSError as exc:
+        raise GitDiscoveryError(f"cannot run git: {exc}") from exc
+    if result.returncode != 0:
+        message = result.stderr.decode("utf-8", "replace").strip()
+        raise GitDiscoveryError(f"git {args[0]} failed: {message}")
+    return result.stdout
+
+
+def _split_z(output: bytes) -> list[str]:
+    return [os.fsdecode(item) for item in output.split(b"\0") if item]
+
+
+def is_git_checkout(root: str | Path) -> bool:
+    """Return ``True`` if *root* is inside a git work tree."""
+    try:
+        out = _git(Path(root), "rev-parse", "--is-inside-work-tree")
+    except GitDiscoveryError:
+        return False
+    return out.strip() == b"true"
+
+
+def _binary_by_attributes(root: Path, paths: list[str]) -> set[str]:
+    """Return the subset of *paths* that ``.gitattributes`` marks binary.
+
+    A path counts as binary when ``binary`` is set, or ``text`` or
+    ``diff`` is explicitly unset (``-text`` / ``-diff``).
+    """
+    if not paths:
+        return set()
+    stdin = b"\0".join(os.fsencode(p) for p in paths) + b"\0"
+    fields = _split_z(_git(root, "check-attr", "-z", "--stdin", "binary", "text", "diff", stdin=stdin))
+    binary: set[str] = set()
+    for i in range(0, len(fields) - 2, 3):
+        path, attr, value = fields[i], fields[i + 1], fields[i + 2]
+        if (attr == "binary" and value == "set") or (
+            attr in ("text", "diff") and value == "unset"
+        ):
+            binary.add(path)
+    return binary
+
+
+def list_files(
+    root: str | Path,
+    *,
+    changed_since: str | None = None,
+) -> list[tuple[str, bool]]:
+    """Return ``(relative_path, known_binary)`` for every candidate file.
+
+    Candidates are tracked files plus untracked files not excluded by
+    ``.gitignore``, relative to *root* (which may be a subdirectory of
+    the checkout), in git's sorted order.  ``known_binary`` is ``True``
+    when the file is binary by attribute or extension; ``False`` means
+    "unknown" and the caller should still sniff the content.
+
+    When *changed_since* is given, only files that differ from that ref
+    (committed, staged or in the work tree) plus untracked files are
+    returned.
+
+    Raises:
+        GitDiscoveryError: if git is unavailable or *changed_since* is
+            not a valid ref.
+    """
+    root = Path(root)
+    tracked: list[str] = []
+    for record in _split_z(_git(root, "ls-files", "-z", "--stage")):
+        meta, _, path = record.partition("\t")
+        if meta.split(" ", 1)[0] == _GITLINK_MODE:
+            continue
+        tracked.append(path)
+    # Unmerged paths appear once per stage.
+    tracked = list(dict.fromkeys(tracked))
+    untracked = _split_z(_git(root, "ls-files", "-z", "--others", "--exclude-standard"))
+
+    if changed_since is not None:
+        changed = set(_split_z(_git(
+            root, "diff", "--name-only", "--relative", "-z", changed_since, "--",
+        )))
+        tracked = [p for p in tracked if p in changed]
+
+    paths = sorted(set(tracked).union(untracked))
+    by_attr = _binary_by_attributes(root, paths)
+    return [
+        (p, p in by_attr or os.path.splitext(p)[1].lower() in BINARY_EXTENSIONS)
+        for p in paths
+    ]
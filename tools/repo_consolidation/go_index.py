@@ -0,0 +1,102 @@
+"""Go module index for the repo consolidation fixers.
+
+:class:`GoModuleIndex` maps each Go module root (a directory holding a
+``go.mod``) to the ``.go`` files beneath it and caches every file's
+lines together with the lines that mention an old-org GitHub path.
+Each directory tree is walked at most once and each file read at most
+once per index, so resolving many ``go.mod`` findings that share a
+module — or nested modules inside one another — costs a single pass.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import os
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+# Lower-cased host/org prefix every old module or import path contains.
+_OLD_ORG_MARKER = "github.com/devcloudninjas/"
+
+
+@dataclass
+class GoSource:
+    """A cached Go source or ``go.mod`` file.
+
+    Attributes:
+        lines: File lines without line terminators.
+        reference_lines: 1-based numbers of the lines mentioning an
+            old-org GitHub path — the only lines a fixer needs to match.
+    """
+
+    lines: list[str]
+    reference_lines: list[int] = field(default_factory=list)
+
+
+class GoModuleIndex:
+    """Lazily built index of Go modules under *repo_root*.
+
+    Paths passed to and returned from the index are POSIX-style and
+    relative to *repo_root*.
+    """
+
+    def __init__(self, repo_root: str) -> None:
+        self.repo_root = repo_root
+        # Walked directory → sorted .go files (relative paths) beneath it.
+        self._walked: dict[str, list[str]] = {}
+        self._sources: dict[str, GoSource | None] = {}
+
+    def _abs(self, rel_path: str) -> str:
+        return os.path.join(self.repo_root, rel_path)
+
+    def _walk(self, rel_dir: str) -> list[str]:
+        files: list[str] = []
+        for dirpath, _dirnames, filenames in os.walk(self._abs(rel_dir)):
+            for fname in filenames:
+                if fname.endswith(".go"):
+                    rel = os.path.relpath(os.path.join(dirpath, fname), self.repo_root)
+                    files.append(rel.replace("\\", "/"))
+        files.sort()
+        return files
+
+    def go_files(self, module_dir: str) -> list[str]:
+        """Return the ``.go`` files beneath *module_dir*, sorted.
+
+        Nested modules are included, matching ``go.mod`` resolution of
+        the outer module's directory tree.  A directory already covered
+        by an earlier walk is answered from that walk's listing.
+        """
+        module_dir = module_dir.strip("/")
+        for walked, files in self._walked.items():
+            if walked == module_dir:
+                return files
+            if not walked or module_dir.startswith(walked + "/"):
+                prefix = f"{module_dir}/" if module_dir else ""
+                lo = bisect.bisect_left(files, prefix)
+                hi = bisect.bisect_left(files, prefix + "\U0010ffff")
+                return files[lo:hi]
+        files = self._walk(module_dir)
+        self._walked[module_dir] = files
+        return files
+
+    def source(self, rel_path: str) -> GoSource | None:
+        """Return the cached contents of *rel_path*, or ``None`` if unreadable."""
+        if rel_path not in self._sources:
+            try:
+                with open(self._abs(rel_path), encoding="utf-8") as fh:
+                    lines = [line.rstrip("\n") for line in fh]
+            except (OSError, UnicodeDecodeError) as exc:
+                logger.debug("Cannot read %s: %s", rel_path, exc)
+                self._sources[rel_path] = None
+            else:
+                self._sources[rel_path] = GoSource(
+                    lines,
+                    [
+                        line_no
+                        for line_no, line in enumerate(lines, start=1)
+                        if _OLD_ORG_MARKER in line.lower()
+                    ],
+                )
+        return self._sources[rel_path]
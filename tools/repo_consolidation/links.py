@@ -0,0 +1,280 @@
+"""Relative link checking for the repo consolidation pipeline.
+
+Extracts relative links from markdown (inline ``[text](target)`` and
+``![alt](target)`` links, reference definitions, and embedded HTML) and
+HTML files (``href``/``src`` attributes), then resolves each against an
+in-memory index of every path in the repository — files and the
+directories that contain them — so no link costs a filesystem call.
+Extraction, which reads and parses the files, can run on a process
+pool; resolution is a set lookup per link.
+
+Absolute URLs, ``mailto:``-style schemes, root-absolute paths, pure
+``#anchor`` links and templated targets are not relative links and are
+skipped.  Links inside fenced code blocks and inline code are ignored.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import posixpath
+import re
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import unquote
+
+from tools.repo_consolidation.manifest import PathIndex, RepoManifest
+from tools.repo_consolidation.models import BrokenLink
+from tools.repo_consolidation.scanner import read_text, resolve_jobs
+
+logger = logging.getLogger(__name__)
+
+#: File types whose links are checked.
+MARKDOWN_TYPES: frozenset[str] = frozenset({".md", ".markdown"})
+HTML_TYPES: frozenset[str] = frozenset({".html", ".htm"})
+
+# Files per task handed to a worker process when checking with ``jobs > 1``.
+_BATCH_FILES = 64
+
+# ``](target)`` closes every inline link or image, including the outer
+# link of a nested ``[![badge](img)](target)``.  An optional title may
+# follow the target.
+_MD_INLINE = re.compile(
+    r"""\]\(\s*<?([^)\s>]+)>?(?:\s+(?:"[^"]*"|'[^']*'|\([^)]*\)))?\s*\)"""
+)
+_MD_REFERENCE = re.compile(r"^[ \t]{0,3}\[[^\]\n]+\]:[ \t]*<?([^\s>]+)>?", re.MULTILINE)
+# Quoted attribute values; the attribute name in front of the ``=`` is
+# checked separately (see :func:`_html_links`), since a pattern that
+# starts with a literal is searched an order of magnitude faster.
+_ATTR_VALUE = re.compile(r"""=\s*["']([^"']+)["']""")
+_LINK_ATTRS = ("href", "src")
+_INLINE_CODE = re.compile(r"`+[^`\n]*`+")
+_FENCE = re.compile(r"^[ \t]{0,3}(```|~~~)", re.MULTILINE)
+_SCHEME = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*:")
+_TEMPLATE_MARKERS = ("{{", "{%", "${", "<%")
+# Build-time placeholders such as create-react-app's ``%PUBLIC_URL%``.
+_PLACEHOLDER = re.compile(r"^%[A-Za-z_]+%")
+
+
+@dataclass
+class LinkCheckResult:
+    """Outcome of :func:`check_links`.
+
+    Attributes:
+        files_checked: Markdown and HTML files whose links were extracted.
+        links_checked: Relative links resolved against the path index.
+        broken: Links whose target does not exist, in discovery then line order.
+    """
+
+    files_checked: int = 0
+    links_checked: int = 0
+    broken: list[BrokenLink] = field(default_factory=list)
+
+    @property
+    def links_resolved(self) -> int:
+        """Relative links whose target exists."""
+        return self.links_checked - len(self.broken)
+
+
+def extract_links(text: str, *, markdown: bool = True) -> list[tuple[int, str]]:
+    """Return ``(line_number, target)`` for every relative link in *text*.
+
+    *markdown* enables markdown link syntax and code skipping; HTML
+    attributes are always extracted.  Targets are returned as written,
+    including any ``#fragment`` or ``?query``.
+    """
+    matches = _html_links(text)
+    code: list[tuple[int, int]] = []
+    if markdown:
+        if "](" in text:
+            matches.extend((m.start(), m.group(1)) for m in _MD_INLINE.finditer(text))
+        if "]:" in text:
+            matches.extend((m.start(), m.group(1)) for m in _MD_REFERENCE.finditer(text))
+        matches.sort()
+        code = _code_spans(text)
+    code_starts = [start for start, _ in code]
+
+    links: list[tuple[int, str]] = []
+    line_number, line_pos = 1, 0
+    for pos, target in matches:
+        if code:
+            i = bisect.bisect_right(code_starts, pos) - 1
+            if i >= 0 and pos < code[i][1]:
+                continue
+        if not _is_relative(target):
+            continue
+        line_number += text.count("\n", line_pos, pos)
+        line_pos = pos
+        links.append((line_number, target))
+    return links
+
+
+def _html_links(text: str) -> list[tuple[int, str]]:
+    """Return ``(offset, target)`` for every ``href``/``src`` attribute value."""
+    links: list[tuple[int, str]] = []
+    for m in _ATTR_VALUE.finditer(text):
+        start = m.start()
+        head = text[max(start - 16, 0):start].rstrip().lower()
+        for name in _LINK_ATTRS:
+            if head.endswith(name):
+                before = head[:-len(name)]
+                if not before or not (before[-1].isalnum() or before[-1] == "_"):
+                    links.append((start, m.group(1)))
+                break
+    return links
+
+
+def _code_spans(text: str) -> list[tuple[int, int]]:
+    """Return sorted, non-overlapping ``(start, end)`` spans of fenced and inline code."""
+    spans: list[tuple[int, int]] = []
+    pos = 0
+    open_fence: re.Match[str] | None = None
+    fences = _FENCE.finditer(text) if "```" in text or "~~~" in text else ()
+    for fence in fences:
+        if open_fence is None:
+            spans.extend(_inline_code_spans(text, pos, fence.start()))
+            open_fence = fence
+        elif fence.group(1) == open_fence.group(1):
+            spans.append((open_fence.start(), fence.end()))
+            pos = fence.end()
+            open_fence = None
+    if open_fence is not None:
+        spans.append((open_fence.start(), len(text)))
+    else:
+        spans.extend(_inline_code_spans(text, pos, len(text)))
+    return spans
+
+
+def _inline_code_spans(text: str, start: int, end: int) -> list[tuple[int, int]]:
+    if "`" not in text[start:end]:
+        return []
+    return [m.span() for m in _INLINE_CODE.finditer(text, start, end)]
+
+
+def _is_relative(target: str) -> bool:
+    return not (
+        not target
+        or target.startswith(("#", "?", "/", "\\"))
+        or _SCHEME.match(target)
+        or _PLACEHOLDER.match(target)
+        or any(marker in target for marker in _TEMPLATE_MARKERS)
+    )
+
+
+def resolve_target(source_path: str, target: str) -> str | None:
+    """Resolve *target*, linked from repo-relative *source_path*, to a repo path.
+
+    The fragment and query are dropped and percent-escapes decoded.
+    Returns ``""`` for the repository root and ``None`` for a target
+    that leaves the repository.
+    """
+    path = target.split("#", 1)[0].split("?", 1)[0]
+    resolved = posixpath.normpath(posixpath.join(posixpath.dirname(source_path), unquote(path)))
+    if resolved == ".":
+        return ""
+    if resolved == ".." or resolved.startswith("../"):
+        return None
+    return resolved
+
+
+def build_path_index(rel_paths: Iterable[str]) -> frozenset[str]:
+    """Return *rel_paths* plus every directory above them (``""`` is the root).
+
+    See :class:`~tools.repo_consolidation.manifest.PathIndex` for the
+    queryable form :func:`check_links` uses.
+    """
+    return frozenset(PathIndex(rel_paths))
+
+
+def _extract_file(path: str, markdown: bool) -> list[tuple[int, str]]:
+    text = read_text(Path(path))
+    if not text:
+        return []
+    return extract_links(text, markdown=markdown)
+
+
+def _extract_batch(items: list[tuple[str, bool]]) -> list[list[tuple[int, str]]]:
+    """Extract the links of each ``(absolute path, markdown)`` item (runs in a worker)."""
+    return [_extract_file(path, markdown) for path, markdown in items]
+
+
+def check_links(
+    repo_root: str | Path,
+    *,
+    jobs: int = 1,
+    manifest: RepoManifest | None = None,
+    backend: str = "auto",
+    changed_since: str | None = None,
+) -> LinkCheckResult:
+    """Check every relative link in the markdown and HTML files under *repo_root*.
+
+    Parameters
+    ----------
+    repo_root:
+        Path to the repository root directory.
+    jobs:
+        Worker processes for link extraction (``0`` = one per CPU).
+        The result is identical for any value.
+    manifest:
+        The run's :class:`~tools.repo_consolidation.manifest.RepoManifest`;
+        its files are the files checked and its
+        :meth:`~tools.repo_consolidation.manifest.RepoManifest.path_index`
+        resolves the links.
+        Without one the tree is discovered here.
+    backend, changed_since:
+        Discovery options (see
+        :func:`~tools.repo_consolidation.scanner.discover_files`).  With
+        *changed_since* only the changed files are checked, but links
+        still resolve against every file in the repository.
+
+    Returns
+    -------
+    LinkCheckResult
+        Counts and the broken links, in discovery then line order.
+    """
+    if manifest is None:
+        manifest = RepoManifest.build(repo_root, backend=backend, changed_since=changed_since)
+    universe = manifest
+    if changed_since is not None:
+        universe = RepoManifest.build(repo_root, backend=backend)
+    index = universe.path_index()
+
+    checked = [
+        entry for entry in manifest.entries()
+        if not entry.binary and entry.file_type in MARKDOWN_TYPES | HTML_TYPES
+    ]
+    items = [(str(entry.path), entry.file_type in MARKDOWN_TYPES) for entry in checked]
+
+    jobs = resolve_jobs(jobs)
+    if jobs == 1 or len(items) <= _BATCH_FILES:
+        extracted = _extract_batch(items)
+    else:
+        batches = [items[i:i + _BATCH_FILES] for i in range(0, len(items), _BATCH_FILES)]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            extracted = [links for batch in pool.map(_extract_batch, batches) for links in batch]
+
+    result = LinkCheckResult(files_checked=len(checked))
+    for entry, links in zip(checked, extracted):
+        for line_number, target in links:
+            resolved = resolve_target(entry.rel_path, target)
+            result.links_checked += 1
+            if resolved is None or not index.exists(resolved):
+                result.broken.append(BrokenLink(
+                    file_path=entry.rel_path,
+                    line_number=line_number,
+                    target=target,
+                ))
+
+    if result.broken:
+        logger.warning(
+            "Link check: %d of %d relative link(s) in %d file(s) are broken.",
+            len(result.broken), result.links_checked, result.files_checked,
+        )
+    else:
+        logger.info(
+            "Link check: %d relative link(s) in %d file(s) resolve.",
+            result.links_checked, result.files_checked,
+        )
+    return result
@@ -0,0 +1,294 @@
+"""Shared discovery manifest for one pipeline run.
+
+A :class:`RepoManifest` records every file discovery finds — its file
+type, size, binary flag and (lazily) content hash — so the scan, count,
+apply and validate stages share a single walk of the tree instead of
+each repeating discovery, binary sniffing and symlink resolution.
+
+Typical use::
+
+    manifest = RepoManifest.build(repo_root)
+    findings = scan_repo(repo_root, manifest=manifest)
+    summary = apply_file_edits(edits, repo_root, manifest=manifest)
+    report = validate_fixes(repo_root, manifest=manifest)
+
+The applier refreshes the entries of the files it modifies or deletes,
+so the manifest keeps describing the tree as it is on disk.
+
+:meth:`RepoManifest.path_index` answers path existence questions (is
+there a file or directory at this path, what is its nearest existing
+ancestor) from the same discovery pass, so the fixers and the link
+check never ask the filesystem.
+"""
+
+from __future__ import annotations
+
+import logging
+import posixpath
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from tools.repo_consolidation.cache import file_digest
+from tools.repo_consolidation.scanner import SKIP_DIRS, _file_type, discover_candidates, is_binary
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ManifestEntry:
+    """One discovered file.
+
+    Attributes:
+        rel_path: POSIX path relative to the repository root.
+        path: Absolute path.
+        file_type: Normalised file type (see :func:`scanner._file_type`).
+        size: Size in bytes when discovered or last refreshed.
+        binary: ``True`` for files the scanner skips as binary.
+        digest: Hex SHA-256 of the contents, or ``None`` until first
+            requested through :meth:`RepoManifest.digest`.
+    """
+
+    rel_path: str
+    path: Path
+    file_type: str
+    size: int
+    binary: bool
+    digest: str | None = None
+
+
+class PathIndex:
+    """Every file of a repository, and every directory above one, held in memory.
+
+    Paths are repo-relative POSIX paths; ``""`` is the repository root.
+    Queries normalise their argument (``a/./b/`` is ``a/b``) and treat
+    a path that leaves the repository as missing.  Directories are known
+    only through the files under them, so an empty directory is missing.
+    """
+
+    def __init__(self, rel_paths: Iterable[str] = ()) -> None:
+        self._files: set[str] = set()
+        self._dirs: set[str] = {""}
+        for rel_path in rel_paths:
+            self.add(rel_path)
+
+    def add(self, rel_path: str) -> None:
+        """Record the file *rel_path* and the directories above it."""
+        self._files.add(rel_path)
+        parent = posixpath.dirname(rel_path)
+        while parent not in self._dirs:
+            self._dirs.add(parent)
+            parent = posixpath.dirname(parent)
+
+    @staticmethod
+    def _key(path: str) -> str | None:
+        key = posixpath.normpath(path) if path else "."
+        if key == ".":
+            return ""
+        if key == ".." or key.startswith(("../", "/")):
+            return None
+        return key
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield every file and directory, the root as ``""``."""
+        yield from self._dirs
+        yield from self._files
+
+    def exists(self, path: str) -> bool:
+        """Return ``True`` if *path* is a known file or directory."""
+        key = self._key(path)
+        return key is not None and (key in self._files or key in self._dirs)
+
+    def is_file(self, path: str) -> bool:
+        """Return ``True`` if *path* is a known file."""
+        return self._key(path) in self._files
+
+    def is_dir(self, path: str) -> bool:
+        """Return ``True`` if *path* is a directory containing a known file."""
+        return self._key(path) in self._dirs
+
+    def nearest_existing(self, path: str) -> str | None:
+        """Return *path*, or its closest ancestor that exists (``""`` at worst).
+
+        Returns ``None`` for a path that leaves the repository.
+        """
+        key = self._key(path)
+        if key is None:
+            return None
+        while key not in self._files and key not in self._dirs:
+            key = posixpath.dirname(key)
+        return key
+
+
+class RepoManifest:
+    """Every file under *repo_root* that discovery yields, in discovery order.
+
+    Populate it with :meth:`build`, or incrementally by consuming
+    :meth:`discover` (as the streaming scan does).  Lookups accept either
+    a repo-relative path or an absolute :class:`~pathlib.Path`.
+
+    Attributes:
+        root: Resolved repository root.
+        complete: ``True`` once a :meth:`discover` pass ran to the end.
+    """
+
+    def __init__(self, repo_root: str | Path) -> None:
+        self.root = Path(repo_root).resolve()
+        self.complete = False
+        self._entries: dict[str, ManifestEntry] = {}
+        self._by_path: dict[Path, ManifestEntry] = {}
+        self._path_index: PathIndex | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(
+        cls,
+        repo_root: str | Path,
+        *,
+        backend: str = "auto",
+        changed_since: str | None = None,
+    ) -> RepoManifest:
+        """Discover every file under *repo_root* and return the manifest.
+
+        Raises:
+            ValueError: As :func:`~tools.repo_consolidation.scanner.discover_files`.
+        """
+        manifest = cls(repo_root)
+        for _ in manifest.discover(backend=backend, changed_since=changed_since):
+            pass
+        return manifest
+
+    def discover(
+        self,
+        *,
+        backend: str = "auto",
+        changed_since: str | None = None,
+    ) -> Iterator[Path]:
+        """Run discovery, recording each file, and yield the text files.
+
+        Raises:
+            ValueError: As :func:`~tools.repo_consolidation.scanner.discover_files`.
+        """
+        for fpath, binary in discover_candidates(
+            self.root, backend=backend, changed_since=changed_since,
+        ):
+            entry = self._record(fpath, binary)
+            if entry is not None and not binary:
+                yield fpath
+        self.complete = True
+
+    def _record(self, fpath: Path, binary: bool) -> ManifestEntry | None:
+        try:
+            size = fpath.stat().st_size
+        except OSError as exc:
+            logger.debug("Cannot stat %s: %s", fpath, exc)
+            return None
+        entry = ManifestEntry(
+            rel_path=fpath.relative_to(self.root).as_posix(),
+            path=fpath,
+            file_type=_file_type(fpath),
+            size=size,
+            binary=binary,
+        )
+        with self._lock:
+            self._entries[entry.rel_path] = entry
+            self._by_path[fpath] = entry
+            if self._path_index is not None:
+                self._path_index.add(entry.rel_path)
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str | Path) -> ManifestEntry | None:
+        """Return the entry for *key*, or ``None`` if it is not recorded."""
+        if isinstance(key, Path):
+            return self._by_path.get(key)
+        return self._entries.get(key)
+
+    def entries(self) -> list[ManifestEntry]:
+        """Return every entry, binary files included, in discovery order."""
+        return list(self._entries.values())
+
+    def text_files(self, rel_paths: Iterable[str] | None = None) -> Iterator[Path]:
+        """Yield the absolute paths of text files.
+
+        All of them in discovery order, or only those among *rel_paths*
+        (in that order) when given.
+        """
+        if rel_paths is None:
+            entries: Iterable[ManifestEntry | None] = self.entries()
+        else:
+            entries = [self._entries.get(rel_path) for rel_path in rel_paths]
+        for entry in entries:
+            if entry is not None and not entry.binary:
+                yield entry.path
+
+    def counts_by_type(self) -> dict[str, int]:
+        """Count text files by file type, as :func:`validator.count_files_by_extension` does."""
+        counts: dict[str, int] = {}
+        for entry in self._entries.values():
+            if not entry.binary:
+                counts[entry.file_type] = counts.get(entry.file_type, 0) + 1
+        return counts
+
+    def size(self, key: str | Path) -> int | None:
+        """Return the recorded size of *key*, or ``None`` if unknown."""
+        entry = self.get(key)
+        return entry.size if entry is not None else None
+
+    def digest(self, key: str | Path) -> str | None:
+        """Return the content hash of *key*, hashing it on first request.
+
+        Returns ``None`` for unknown or unreadable files.
+        """
+        entry = self.get(key)
+        if entry is None:
+            return None
+        if entry.digest is None:
+            try:
+                entry.digest = file_digest(entry.path)
+            except OSError as exc:
+                logger.debug("Cannot hash %s: %s", entry.path, exc)
+                return None
+        return entry.digest
+
+    def refresh(self, rel_paths: Iterable[str]) -> None:
+        """Re-read the metadata of *rel_paths* after they changed on disk.
+
+        Files that no longer exist are dropped; files that do are
+        re-stat'ed and re-sniffed, and their content hash is forgotten.
+        Paths under :data:`~tools.repo_consolidation.scanner.SKIP_DIRS`
+        are ignored, as discovery would.
+        """
+        for rel_path in rel_paths:
+            parts = rel_path.split("/")
+            if any(part in SKIP_DIRS for part in parts[:-1]):
+                continue
+            fpath = self.root.joinpath(*parts)
+            if fpath.is_file():
+                self._record(fpath, is_binary(fpath))
+                continue
+            with self._lock:
+                entry = self._entries.pop(rel_path, None)
+                if entry is not None:
+                    self._by_path.pop(entry.path, None)
+                    # Dropping a file may empty directories; rebuild on next use.
+                    self._path_index = None
+
+    def path_index(self) -> PathIndex:
+        """Return a :class:`PathIndex` of every recorded file, binary ones included.
+
+        Built on first request and kept current as files are recorded
+        or dropped.  It is only as complete as the manifest: build the
+        manifest without *changed_since*, and let discovery finish,
+        before relying on it for files outside the scan.
+        """
+        with self._lock:
+            if self._path_index is None:
+                self._path_index = PathIndex(self._entries)
+            return self._path_index
@@ -2,14 +2,21 @@
 
 Defines the dataclasses used across all pipeline stages: scanning,
 classification, fixing, validation, and reporting.
+
+:class:`Finding` and :class:`Replacement` exist in the tens of thousands
+on large trees, so they are slotted and intern their repeated strings
+(paths, file types, issue types); see
+:class:`~tools.repo_consolidation.columnar.FindingTable` for a denser
+columnar container.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import asdict, astuple, dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """A single issue detected by the scanner.
 
@@ -33,8 +40,28 @@ class Finding:
     context: str
     file_type: str
 
+    def __post_init__(self) -> None:
+        self.file_path = sys.intern(self.file_path)
+        self.issue_type = sys.intern(self.issue_type)
+        self.old_repo_name = sys.intern(self.old_repo_name)
+        self.file_type = sys.intern(self.file_type)
 
-@dataclass
+    def __reduce__(self) -> tuple[type[Finding], tuple[object, ...]]:
+        # Unpickle through __init__ so findings returned by worker
+        # processes share interned strings too.
+        return type(self), astuple(self)
+
+    def to_dict(self) -> dict[str, object]:
+        """Return a JSON-serialisable dict of all fields."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, object]) -> Finding:
+        """Rebuild a :class:`Finding` from :meth:`to_dict` output."""
+        return cls(**data)
+
+
+@dataclass(slots=True)
 class Replacement:
     """A proposed or applied fix for a single finding.
 
@@ -55,6 +82,121 @@ class Replacement:
     comment: str | None = None
     action: str = "replace"
 
+    def __post_init__(self) -> None:
+        self.file_path = sys.intern(self.file_path)
+        self.action = sys.intern(self.action)
+
+    def __reduce__(self) -> tuple[type[Replacement], tuple[object, ...]]:
+        return type(self), astuple(self)
+
+    def to_dict(self) -> dict[str, object]:
+        """Return a JSON-serialisable dict of all fields."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, object]) -> Replacement:
+        """Rebuild a :class:`Replacement` from :meth:`to_dict` output."""
+        return cls(**data)
+
+
+@dataclass
+class SpanEdit:
+    """A change to one character span of one line.
+
+    Attributes:
+        line_number: 1-based line number of the edited line.
+        start: 0-based offset of the first replaced character.
+        end: Offset one past the last replaced character (``start`` for
+            a pure insertion).
+        old_text: The original text of the span, ``line[start:end]``.
+        new_text: The text the span is replaced with.
+    """
+
+    line_number: int
+    start: int
+    end: int
+    old_text: str
+    new_text: str
+
+
+@dataclass
+class FileEdits:
+    """Every fix for one file, merged into non-overlapping line spans.
+
+    Produced by :func:`tools.repo_consolidation.fixers.fix_file`, which
+    folds all findings on a line into a single rewritten line, so fixes
+    on the same line compose instead of overwriting one another.
+
+    Attributes:
+        file_path: Relative path from repo root to the file to modify.
+        spans: Span edits in line order, at most one per line.
+        lines: Original text of each edited line, keyed by line number.
+        comments: Comment to insert above a line, keyed by line number.
+        actions: Whole-file ``delete_file`` and ``flag_for_review``
+            replacements, which carry no span.
+    """
+
+    file_path: str
+    spans: list[SpanEdit] = field(default_factory=list)
+    lines: dict[int, str] = field(default_factory=dict)
+    comments: dict[int, str] = field(default_factory=dict)
+    actions: list[Replacement] = field(default_factory=list)
+
+    def add_line(
+        self,
+        line_number: int,
+        old_line: str,
+        new_line: str,
+        comment: str | None = None,
+    ) -> None:
+        """Record that *old_line* becomes *new_line*.
+
+        The change is stored as the single span between the longest
+        common prefix and suffix of the two lines.
+        """
+        limit = min(len(old_line), len(new_line))
+        start = 0
+        while start < limit and old_line[start] == new_line[start]:
+            start += 1
+        tail = 0
+        while (
+            tail < limit - start
+            and old_line[len(old_line) - 1 - tail] == new_line[len(new_line) - 1 - tail]
+        ):
+            tail += 1
+        if old_line != new_line:
+            self.spans.append(SpanEdit(
+                line_number=line_number,
+                start=start,
+                end=len(old_line) - tail,
+                old_text=old_line[start:len(old_line) - tail],
+                new_text=new_line[start:len(new_line) - tail],
+            ))
+        self.lines[line_number] = old_line
+        if comment:
+            self.comments[line_number] = comment
+
+    def to_replacements(self) -> list[Replacement]:
+        """Return one line-level :class:`Replacement` per edited line, then the actions."""
+        spans = {span.line_number: span for span in self.spans}
+        replacements: list[Replacement] = []
+        for line_number in sorted(self.lines):
+            line = self.lines[line_number]
+            span = spans.get(line_number)
+            if span is not None:
+                new_line = line[:span.start] + span.new_text + line[span.end:]
+            else:
+                new_line = line
+            replacements.append(Replacement(
+                file_path=self.file_path,
+                line_number=line_number,
+                old_text=line,
+                new_text=new_line,
+                comment=self.comments.get(line_number),
+                action="replace",
+            ))
+        return replacements + list(self.actions)
+
 
 @dataclass
 class RepoMapping:
@@ -97,6 +239,46 @@ class ScanConfig:
     patterns: dict[str, str] = field(default_factory=dict)
 
 
+@dataclass
+class ScanStats:
+    """Counters collected while scanning.
+
+    Attributes:
+        files_scanned: Files read and matched against the scan patterns.
+        bytes_scanned: Total size of the files in ``files_scanned``.
+        files_cached: Files whose findings came from the scan cache.
+        files_deduplicated: Files skipped because an earlier file in the
+            same scan had byte-identical content; their findings were
+            copied from that file.
+        bytes_deduplicated: Total size of the files in ``files_deduplicated``.
+    """
+
+    files_scanned: int = 0
+    bytes_scanned: int = 0
+    files_cached: int = 0
+    files_deduplicated: int = 0
+    bytes_deduplicated: int = 0
+
+
+@dataclass
+class BrokenLink:
+    """A relative link whose target does not exist in the repository.
+
+    Attributes:
+        file_path: Relative path from repo root to the file with the link.
+        line_number: 1-based line number of the link.
+        target: The link target as written (fragment and query included).
+    """
+
+    file_path: str
+    line_number: int
+    target: str
+
+    def to_dict(self) -> dict[str, object]:
+        """Return a JSON-serialisable dict of all fields."""
+        return asdict(self)
+
+
 @dataclass
 class ValidationReport:
     """Results of the post-fix validation pass.
@@ -109,6 +291,8 @@ class ValidationReport:
         total_links_validated: Number of relative links verified as resolving.
         total_broken_relative_paths: Number of relative paths that do not resolve.
         remaining_issues: Findings that still exist after all fixes were applied.
+        broken_links: The relative links counted in
+            ``total_broken_relative_paths``.
     """
 
     total_files_scanned: dict[str, int] = field(default_factory=dict)
@@ -118,3 +302,4 @@ class ValidationReport:
     total_links_validated: int = 0
     total_broken_relative_paths: int = 0
     remaining_issues: list[Finding] = field(default_factory=list)
+    broken_links: list[BrokenLink] = field(default_factory=list)
@@ -0,0 +1,181 @@
+"""Pipelined scan → fix → apply execution.
+
+:func:`run_pipelined` runs the three stages concurrently on threads
+joined by bounded queues: the scan stage feeds each file's findings to
+the fix stage as soon as the scanner moves on to the next file, and
+apply workers write each file as soon as its edit set is ready.  The
+whole run therefore takes little longer than the scan alone, and
+because a full queue blocks the stage feeding it, at most
+``queue_size`` files are buffered between any two stages, however large
+the repository.
+
+The findings and the apply summary are returned in scan order, exactly
+as the sequential stages produce them.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from tools.repo_consolidation.applier import ApplySummary, apply_file_edits
+from tools.repo_consolidation.fixers import BatchFixer, fix_file
+from tools.repo_consolidation.manifest import RepoManifest
+from tools.repo_consolidation.models import Finding
+
+#: Default number of files buffered between two stages.
+DEFAULT_QUEUE_SIZE = 64
+
+# Marks the end of a stage's output.
+_DONE = object()
+
+# How often a blocked stage checks whether another stage failed.
+_POLL_SECONDS = 0.1
+
+
+@dataclass
+class PipelineResult:
+    """Outcome of :func:`run_pipelined`.
+
+    Attributes:
+        findings: Every finding, in scan order.
+        summary: The merged apply summary, in scan order.
+        replacements: Line edits and whole-file actions generated.
+    """
+
+    findings: list[Finding] = field(default_factory=list)
+    summary: ApplySummary = field(default_factory=ApplySummary)
+    replacements: int = 0
+
+
+def _by_file(findings: Iterable[Finding]) -> Iterator[list[Finding]]:
+    """Group consecutive findings of the same file, as the scanner emits them."""
+    current: list[Finding] = []
+    for finding in findings:
+        if current and finding.file_path != current[0].file_path:
+            yield current
+            current = []
+        current.append(finding)
+    if current:
+        yield current
+
+
+class _Pipeline:
+    """Thread plumbing shared by the stages: bounded queues and failure propagation."""
+
+    def __init__(self, queue_size: int) -> None:
+        self.to_fix: queue.Queue[object] = queue.Queue(maxsize=queue_size)
+        self.to_apply: queue.Queue[object] = queue.Queue(maxsize=queue_size)
+        self.failed = threading.Event()
+        self.error: BaseException | None = None
+
+    def put(self, q: queue.Queue[object], item: object) -> bool:
+        """Block until *item* is queued; return ``False`` if another stage failed."""
+        while not self.failed.is_set():
+            try:
+                q.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def get(self, q: queue.Queue[object]) -> object:
+        """Block until an item arrives; return ``_DONE`` if another stage failed."""
+        while not self.failed.is_set():
+            try:
+                return q.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def thread(self, name: str, target: Callable[[], None]) -> threading.Thread:
+        def run() -> None:
+            try:
+                target()
+            except BaseException as exc:  # re-raised in the calling thread
+                if self.error is None:
+                    self.error = exc
+                self.failed.set()
+
+        return threading.Thread(target=run, name=f"repo-consolidation-{name}", daemon=True)
+
+
+def run_pipelined(
+    findings: Iterable[Finding],
+    fixer_map: dict[str, BatchFixer],
+    repo_root: str | Path,
+    *,
+    dry_run: bool = False,
+    fsync: bool = False,
+    apply_workers: int = 1,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    manifest: RepoManifest | None = None,
+) -> PipelineResult:
+    """Fix and apply *findings* while they are still being produced.
+
+    Args:
+        findings: Findings grouped by file, e.g. the
+            :func:`~tools.repo_consolidation.scanner.iter_findings`
+            generator; it is consumed on the scan thread.
+        fixer_map: Issue type → batch fixer, as for
+            :func:`~tools.repo_consolidation.fixers.fix_file`.
+        repo_root: Path to the repository root.
+        dry_run: If ``True``, log proposed changes without writing to disk.
+        fsync: See :func:`~tools.repo_consolidation.applier.apply_replacements`.
+        apply_workers: Threads writing files concurrently.
+        queue_size: Files buffered between two stages at most.
+        manifest: See :func:`~tools.repo_consolidation.applier.apply_replacements`.
+
+    Returns:
+        A :class:`PipelineResult`, identical for any *apply_workers*.
+
+    Raises:
+        Exception: Whatever a stage raised (e.g. ``ValueError`` from file
+            discovery); the other stages are stopped first.
+    """
+    pipe = _Pipeline(max(1, queue_size))
+    apply_workers = max(1, apply_workers)
+    root = str(repo_root)
+    result = PipelineResult()
+    summaries: dict[int, ApplySummary] = {}
+
+    def scan() -> None:
+        for seq, file_findings in enumerate(_by_file(findings)):
+            result.findings.extend(file_findings)
+            if not pipe.put(pipe.to_fix, (seq, file_findings)):
+                return
+        pipe.put(pipe.to_fix, _DONE)
+
+    def fix() -> None:
+        while (item := pipe.get(pipe.to_fix)) is not _DONE:
+            seq, file_findings = item  # type: ignore[misc]
+            edits = fix_file(file_findings, fixer_map)
+            result.replacements += len(edits.lines) + len(edits.actions)
+            if not pipe.put(pipe.to_apply, (seq, edits)):
+                return
+        for _ in range(apply_workers):
+            pipe.put(pipe.to_apply, _DONE)
+
+    def apply() -> None:
+        while (item := pipe.get(pipe.to_apply)) is not _DONE:
+            seq, edits = item  # type: ignore[misc]
+            summaries[seq] = apply_file_edits(
+                [edits], root, dry_run=dry_run, fsync=fsync, manifest=manifest,
+            )
+
+    threads = [pipe.thread("scan", scan), pipe.thread("fix", fix)]
+    threads += [pipe.thread(f"apply-{i}", apply) for i in range(apply_workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if pipe.error is not None:
+        raise pipe.error
+
+    for seq in sorted(summaries):
+        result.summary.merge(summaries[seq])
+    return result
+
@@ -0,0 +1,278 @@
+"""Persisted remediation plans: scan and fix once, review, apply later.
+
+A plan records, for every file with findings, the findings, the
+:class:`~tools.repo_consolidation.models.FileEdits` the fixers produced
+and the SHA-256 of the file when it was scanned.  :func:`apply_plan`
+executes those edits without scanning again, refusing any file whose
+contents no longer match the recorded hash.
+
+The plan file is JSON Lines: a ``plan`` header record, then one
+``file`` record per file, written compactly in the scan cache's row
+format.  A path ending in ``.gz`` is gzip-compressed.  Typical use::
+
+    plan = make_plan(repo_root, findings, file_edits, manifest=manifest)
+    write_plan("remediation-plan.jsonl", plan)
+    ...
+    summary = apply_plan(load_plan("remediation-plan.jsonl"))
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any
+
+from tools.repo_consolidation.applier import ApplySummary, apply_file_edits
+from tools.repo_consolidation.cache import _decode_findings, _encode_findings, file_digest
+from tools.repo_consolidation.manifest import RepoManifest
+from tools.repo_consolidation.models import FileEdits, Finding, Replacement, SpanEdit
+
+logger = logging.getLogger(__name__)
+
+#: Bumped when the plan file layout changes incompatibly.
+PLAN_VERSION = 1
+
+#: Plan file written by ``plan`` and read by ``apply`` when none is named.
+DEFAULT_PLAN_PATH = "remediation-plan.jsonl"
+
+
+@dataclass
+class PlannedFile:
+    """Everything the plan knows about one file.
+
+    Attributes:
+        file_path: Relative path from repo root.
+        file_type: File type of the findings (see :func:`scanner._file_type`).
+        sha256: Hex SHA-256 of the file when it was scanned.
+        findings: The file's findings, in scan order.
+        edits: The fixes to apply.
+    """
+
+    file_path: str
+    file_type: str
+    sha256: str
+    findings: list[Finding]
+    edits: FileEdits
+
+    @property
+    def has_changes(self) -> bool:
+        """``True`` if applying this file would change or flag anything."""
+        return bool(self.edits.lines or self.edits.actions)
+
+
+@dataclass
+class RemediationPlan:
+    """A plan for one repository.
+
+    Attributes:
+        repo_root: Absolute path of the repository the plan was made for.
+        files: One :class:`PlannedFile` per file with findings, in scan order.
+    """
+
+    repo_root: str
+    files: list[PlannedFile] = field(default_factory=list)
+
+    @property
+    def findings(self) -> list[Finding]:
+        """Every finding in the plan, in scan order."""
+        return [finding for planned in self.files for finding in planned.findings]
+
+
+def make_plan(
+    repo_root: str | Path,
+    findings: Iterable[Finding],
+    file_edits: Iterable[FileEdits],
+    *,
+    manifest: RepoManifest | None = None,
+) -> RemediationPlan:
+    """Bundle *findings* and their *file_edits* with each file's current hash.
+
+    Hashes come from *manifest* when given (so files it already hashed
+    are not read again), otherwise the files are hashed here.
+
+    Raises:
+        OSError: If a file with findings cannot be read.
+    """
+    root = Path(repo_root).resolve()
+    edits_by_path = {edits.file_path: edits for edits in file_edits}
+    grouped: dict[str, list[Finding]] = {}
+    for finding in findings:
+        grouped.setdefault(finding.file_path, []).append(finding)
+
+    plan = RemediationPlan(repo_root=str(root))
+    for rel_path, file_findings in grouped.items():
+        digest = manifest.digest(rel_path) if manifest is not None else None
+        if digest is None:
+            digest = file_digest(root / rel_path)
+        plan.files.append(PlannedFile(
+            file_path=rel_path,
+            file_type=file_findings[0].file_type,
+            sha256=digest,
+            findings=file_findings,
+            edits=edits_by_path.get(rel_path) or FileEdits(rel_path),
+        ))
+    return plan
+
+
+def _open(path: str | Path, mode: str) -> IO[str]:
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _encode_edits(edits: FileEdits) -> dict[str, object]:
+    return {
+        "spans": [[s.line_number, s.start, s.end, s.old_text, s.new_text] for s in edits.spans],
+        "lines": {str(n): line for n, line in edits.lines.items()},
+        "comments": {str(n): comment for n, comment in edits.comments.items()},
+        "actions": [
+            [r.line_number, r.old_text, r.new_text, r.comment, r.action] for r in edits.actions
+        ],
+    }
+
+
+def _decode_edits(data: dict[str, Any], rel_path: str) -> FileEdits:
+    return FileEdits(
+        file_path=rel_path,
+        spans=[SpanEdit(*row) for row in data["spans"]],
+        lines={int(n): line for n, line in data["lines"].items()},
+        comments={int(n): comment for n, comment in data["comments"].items()},
+        actions=[
+            Replacement(rel_path, line_number, old_text, new_text, comment, action)
+            for line_number, old_text, new_text, comment, action in data["actions"]
+        ],
+    )
+
+
+def write_plan(path: str | Path, plan: RemediationPlan) -> None:
+    """Write *plan* to *path* (gzip-compressed if it ends in ``.gz``).
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with _open(path, "w") as fh:
+        header = {"type": "plan", "version": PLAN_VERSION, "repo_root": plan.repo_root}
+        fh.write(json.dumps(header, separators=(",", ":")) + "\n")
+        for planned in plan.files:
+            record = {
+                "type": "file",
+                "path": planned.file_path,
+                "file_type": planned.file_type,
+                "sha256": planned.sha256,
+                "findings": _encode_findings(planned.findings),
+                "edits": _encode_edits(planned.edits),
+            }
+            fh.write(json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n")
+
+
+def load_plan(path: str | Path) -> RemediationPlan:
+    """Read a plan written by :func:`write_plan`.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If it is not a plan file, or was written by an
+            incompatible version.
+    """
+    with _open(path, "r") as fh:
+        try:
+            header = json.loads(fh.readline())
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"{path} is not a remediation plan: {exc}") from exc
+        if not isinstance(header, dict) or header.get("type") != "plan":
+            raise ValueError(f"{path} is not a remediation plan")
+        if header.get("version") != PLAN_VERSION:
+            raise ValueError(
+                f"{path} has plan version {header.get('version')}, expected {PLAN_VERSION}"
+            )
+        plan = RemediationPlan(repo_root=header["repo_root"])
+        for line_no, line in enumerate(fh, start=2):
+            try:
+                record = json.loads(line)
+                rel_path, file_type = record["path"], record["file_type"]
+                plan.files.append(PlannedFile(
+                    file_path=rel_path,
+                    file_type=file_type,
+                    sha256=record["sha256"],
+                    findings=_decode_findings(record["findings"], rel_path, file_type),
+                    edits=_decode_edits(record["edits"], rel_path),
+                ))
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
+                raise ValueError(f"{path}:{line_no}: malformed plan record: {exc}") from exc
+    return plan
+
+
+def apply_plan(
+    plan: RemediationPlan,
+    repo_root: str | Path | None = None,
+    *,
+    dry_run: bool = False,
+    jobs: int = 1,
+    fsync: bool = False,
+    manifest: RepoManifest | None = None,
+) -> ApplySummary:
+    """Apply the edits in *plan* without scanning.
+
+    Each file is hashed first; a file that changed or disappeared since
+    the plan was made is skipped and reported in ``errors``.  The rest
+    are applied as :func:`~tools.repo_consolidation.applier.apply_file_edits`
+    would.
+
+    Args:
+        plan: The plan to execute.
+        repo_root: Repository to apply it to (default: ``plan.repo_root``),
+            e.g. another checkout of the same commit.
+        dry_run: If ``True``, check hashes and log proposed changes
+            without writing to disk.
+        jobs: See :func:`~tools.repo_consolidation.applier.apply_file_edits`.
+        fsync: See :func:`~tools.repo_consolidation.applier.apply_file_edits`.
+        manifest: See :func:`~tools.repo_consolidation.applier.apply_file_edits`.
+
+    Returns:
+        The :class:`ApplySummary` of the files applied, plus one error
+        per refused file.
+    """
+    root = Path(repo_root if repo_root is not None else plan.repo_root)
+    refused: list[str] = []
+    ready: list[FileEdits] = []
+    for planned in plan.files:
+        if not planned.has_changes:
+            continue
+        try:
+            current = file_digest(root / planned.file_path)
+        except OSError as exc:
+            refused.append(f"{planned.file_path}: cannot read ({exc}); skipped")
+            continue
+        if current != planned.sha256:
+            refused.append(f"{planned.file_path}: changed since the plan was made; skipped")
+            continue
+        ready.append(planned.edits)
+
+    for message in refused:
+        logger.error("Refusing %s", message)
+    summary = apply_file_edits(
+        ready, str(root), dry_run=dry_run, jobs=jobs, fsync=fsync, manifest=manifest,
+    )
+    summary.errors[:0] = refused
+    return summary
+
+
+def format_planned_file(planned: PlannedFile) -> list[str]:
+    """Return review lines for *planned*: each edited line before and after, then actions."""
+    lines = [planned.file_path]
+    for replacement in planned.edits.to_replacements():
+        if replacement.action != "replace":
+            detail = f": {replacement.comment}" if replacement.comment else ""
+            lines.append(f"  {replacement.action}{detail}")
+            continue
+        if replacement.comment:
+            lines.append(f"  {replacement.line_number}: + {replacement.comment}")
+        lines.append(f"  {replacement.line_number}: - {replacement.old_text}")
+        lines.append(f"  {replacement.line_number}: + {replacement.new_text}")
+    if not planned.has_changes:
+        lines.append("  (no automatic fix)")
+    return lines
@@ -0,0 +1,225 @@
+"""Run profiling for the repo consolidation pipeline.
+
+A :class:`Profiler` collects wall time per pipeline stage, time and
+match counts per scan pattern, and the slowest files and fixer calls of
+one run.  :meth:`Profiler.write` saves them as a JSON summary plus a
+Chrome trace-event file that can be opened in ``chrome://tracing`` or
+https://ui.perfetto.dev.
+
+Timestamps come from :func:`time.perf_counter`, which is a system-wide
+monotonic clock on Linux and macOS, so events recorded in scan worker
+processes line up with those of the main process.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict
+from pathlib import Path
+
+from tools.repo_consolidation.models import ScanStats
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_FILENAME = "profile.json"
+TRACE_FILENAME = "trace.json"
+
+#: Number of entries kept in the slowest-files and slowest-fixes lists.
+DEFAULT_TOP_N = 20
+
+# Indices into the per-pattern ``[seconds, matches, lines]`` accumulators
+# filled in by :func:`tools.repo_consolidation.scanner._scan_file`.
+_SECONDS, _MATCHES, _LINES = 0, 1, 2
+
+
+def merge_pattern_stats(
+    into: dict[str, list[float]],
+    other: dict[str, list[float]],
+) -> None:
+    """Add the per-pattern accumulators of *other* into *into*."""
+    for name, values in other.items():
+        entry = into.setdefault(name, [0.0, 0, 0])
+        for i, value in enumerate(values):
+            entry[i] += value
+
+
+class Profiler:
+    """Collect timing data for one pipeline run.
+
+    Attributes:
+        top_n: Length of the slowest-files and slowest-fixes lists.
+        pattern_stats: ``pattern name → [seconds, matches, lines tested]``,
+            updated in place by the scanner.
+    """
+
+    def __init__(self, *, top_n: int = DEFAULT_TOP_N) -> None:
+        self.top_n = top_n
+        self.pattern_stats: dict[str, list[float]] = {}
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._stages: dict[str, float] = {}
+        self._events: list[dict[str, object]] = []
+        self._slowest_files: list[tuple[float, str]] = []
+        self._slowest_fixes: list[tuple[float, str, str, int]] = []
+        self._fixers: dict[str, list[float]] = {}
+        self._files_timed = 0
+
+    def _event(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        seconds: float,
+        *,
+        tid: int | None = None,
+        args: dict[str, object] | None = None,
+    ) -> None:
+        event: dict[str, object] = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((start - self._origin) * 1e6, 3),
+            "dur": round(seconds * 1e6, 3),
+            "pid": self._pid,
+            "tid": tid if tid is not None else self._pid,
+        }
+        if args:
+            event["args"] = args
+        self._events.append(event)
+
+    @staticmethod
+    def _keep_slowest(heap: list[tuple], item: tuple, limit: int) -> None:
+        if len(heap) < limit:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as pipeline stage *name*.
+
+        Re-entering a stage adds to its total.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self._stages[name] = self._stages.get(name, 0.0) + seconds
+            self._event(name, "stage", start, seconds)
+
+    def file_scanned(
+        self,
+        rel_path: str,
+        start: float,
+        seconds: float,
+        *,
+        worker: int | None = None,
+    ) -> None:
+        """Record that scanning *rel_path* took *seconds* from *start*.
+
+        *worker* is the pid of the scan worker process, if any; it
+        becomes the trace thread id so each worker gets its own track.
+        """
+        self._files_timed += 1
+        self._keep_slowest(self._slowest_files, (seconds, rel_path), self.top_n)
+        self._event(rel_path, "file", start, seconds, tid=worker)
+
+    def add_pattern_stats(self, stats: dict[str, list[float]]) -> None:
+        """Merge per-pattern accumulators returned by a scan worker."""
+        merge_pattern_stats(self.pattern_stats, stats)
+
+    def fixer_called(
+        self,
+        fixer: str,
+        rel_path: str,
+        line_number: int,
+        start: float,
+        seconds: float,
+    ) -> None:
+        """Record one call of the fixer for issue type *fixer*."""
+        entry = self._fixers.setdefault(fixer, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] = max(entry[2], seconds)
+        self._keep_slowest(
+            self._slowest_fixes, (seconds, fixer, rel_path, line_number), self.top_n,
+        )
+        self._event(
+            fixer, "fix", start, seconds,
+            args={"path": rel_path, "line": line_number},
+        )
+
+    def summary(self, stats: ScanStats | None = None) -> dict[str, object]:
+        """Return the collected data as a JSON-serialisable dict."""
+        data: dict[str, object] = {
+            "stages": {name: round(s, 6) for name, s in self._stages.items()},
+            "total_seconds": round(sum(self._stages.values()), 6),
+            "patterns": {
+                name: {
+                    "seconds": round(values[_SECONDS], 6),
+                    "matches": int(values[_MATCHES]),
+                    "lines": int(values[_LINES]),
+                }
+                for name, values in sorted(
+                    self.pattern_stats.items(), key=lambda kv: -kv[1][_SECONDS],
+                )
+            },
+            "files_timed": self._files_timed,
+            "slowest_files": [
+                {"path": path, "seconds": round(seconds, 6)}
+                for seconds, path in sorted(self._slowest_files, reverse=True)
+            ],
+            "fixers": {
+                name: {
+                    "calls": int(calls),
+                    "seconds": round(total, 6),
+                    "max_seconds": round(slowest, 6),
+                }
+                for name, (calls, total, slowest) in sorted(
+                    self._fixers.items(), key=lambda kv: -kv[1][1],
+                )
+            },
+            "slowest_fixes": [
+                {"fixer": fixer, "path": path, "line": line, "seconds": round(seconds, 6)}
+                for seconds, fixer, path, line in sorted(self._slowest_fixes, reverse=True)
+            ],
+        }
+        if stats is not None:
+            data["scan_stats"] = asdict(stats)
+        return data
+
+    def trace(self) -> dict[str, object]:
+        """Return the recorded events in Chrome trace-event format."""
+        return {"traceEvents": self._events, "displayTimeUnit": "ms"}
+
+    def write(
+        self,
+        directory: str | Path,
+        stats: ScanStats | None = None,
+    ) -> tuple[Path, Path]:
+        """Write the summary and trace files into *directory*.
+
+        Returns:
+            The ``(summary_path, trace_path)`` that were written.
+
+        Raises:
+            OSError: If the directory or files cannot be written.
+        """
+        out = Path(directory)
+        out.mkdir(parents=True, exist_ok=True)
+        summary_path = out / SUMMARY_FILENAME
+        trace_path = out / TRACE_FILENAME
+        summary_path.write_text(
+            json.dumps(self.summary(stats), indent=2) + "\n", encoding="utf-8",
+        )
+        with open(trace_path, "w", encoding="utf-8") as fh:
+            json.dump(self.trace(), fh, separators=(",", ":"))
+        logger.info("Profile written to %s and %s", summary_path, trace_path)
+        return summary_path, trace_path
@@ -1,33 +1,66 @@
 """Report generator for the repo consolidation remediation pipeline.
 
 Produces human-readable summary and unresolved-issues reports from
-scan results and validation data.
+scan results and validation data, and streams the same results in
+machine-readable formats (JSON Lines, SARIF 2.1.0 and JUnit XML) for CI
+systems; see :func:`write_report`.
 """
 
 from __future__ import annotations
 
+import json
+import re
 from collections import Counter
+from collections.abc import Callable
+from dataclasses import asdict
+from typing import TextIO
+from xml.sax.saxutils import escape, quoteattr
 
-from .models import Finding, ValidationReport
+from .models import BrokenLink, Finding, ScanStats, ValidationReport
+
+#: Values accepted by :func:`write_report` (and ``--report-format``).
+REPORT_FORMATS = ("text", "jsonl", "sarif", "junit")
+
+_TOOL_NAME = "repo-consolidation"
+# Control characters XML 1.0 cannot represent, even escaped.
+_XML_INVALID = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+# SARIF rule / JUnit failure type for broken links; issue types are the
+# rule IDs of findings.
+_BROKEN_LINK_RULE = "broken_relative_link"
+
+# Rule ID -> (short description, SARIF level).
+_RULES: dict[str, tuple[str, str]] = {
+    "old_url": ("Reference to a repository that was merged into the consolidated repo", "warning"),
+    "credential": ("Exposed credential or private key file", "error"),
+    "hardcoded_account_id": ("Hardcoded AWS account ID", "warning"),
+    "stale_docker_image": ("Docker image name from before the consolidation", "warning"),
+    _BROKEN_LINK_RULE: ("Relative link whose target does not exist", "warning"),
+}
 
 
 def generate_report(
     scan_results: list[Finding],
     validation: ValidationReport,
+    stats: ScanStats | None = None,
 ) -> str:
     """Produce a formatted summary report.
 
     The report includes:
     - Header
     - Files scanned by type
+    - Scan statistics (if *stats* is given)
     - Fix summary (references fixed, credentials removed, account IDs
       parameterized)
     - Validation results (links validated, broken paths, remaining issues)
     - Unresolved issues detail (if any remain)
+    - Broken relative links detail (if any)
 
     Args:
         scan_results: Findings from the initial scan pass.
         validation: The :class:`ValidationReport` produced after fixes.
+        stats: Optional :class:`ScanStats` from the initial scan pass.
 
     Returns:
         A multi-line formatted string suitable for display or file output.
@@ -50,6 +83,18 @@ def generate_report(
         lines.append("  (none)")
     lines.append("")
 
+    # -- Scan statistics ------------------------------------------------------
+    if stats is not None:
+        lines.append("Scan Statistics")
+        lines.append("-" * 40)
+        lines.append(f"  Files scanned:           {stats.files_scanned} ({stats.bytes_scanned} bytes)")
+        lines.append(f"  Served from cache:       {stats.files_cached}")
+        lines.append(
+            f"  Duplicates skipped:      {stats.files_deduplicated} "
+            f"({stats.bytes_deduplicated} bytes)"
+        )
+        lines.append("")
+
     # -- Initial scan summary -------------------------------------------------
     type_counts = Counter(f.issue_type for f in scan_results)
     lines.append("Initial Scan Summary")
@@ -79,6 +124,10 @@ def generate_report(
     if validation.remaining_issues:
         lines.append(_format_unresolved_section(validation.remaining_issues))
 
+    # -- Broken relative links ------------------------------------------------
+    if validation.broken_links:
+        lines.append(_format_broken_links_section(validation.broken_links))
+
     lines.append("=" * 60)
     return "\n".join(lines)
 
@@ -88,6 +137,7 @@ def generate_unresolved_report(validation: ValidationReport) -> str:
 
     Args:
         validation: The :class:`ValidationReport` produced after fixes.
+        stats: Optional :class:`ScanStats` from the initial scan pass.
 
     Returns:
         A multi-line formatted string listing every remaining issue,
@@ -130,3 +180,246 @@ def _format_unresolved_section(issues: list[Finding]) -> str:
         lines.append("")
 
     return "\n".join(lines)
+
+
+def _format_broken_links_section(links: list[BrokenLink]) -> str:
+    """Format broken relative links, grouped by the file containing them."""
+    lines: list[str] = []
+    lines.append("Broken Relative Links")
+    lines.append("-" * 40)
+
+    by_file: dict[str, list[BrokenLink]] = {}
+    for link in links:
+        by_file.setdefault(link.file_path, []).append(link)
+
+    for file_path in sorted(by_file):
+        lines.append(f"  {file_path}")
+        for link in sorted(by_file[file_path], key=lambda link: link.line_number):
+            lines.append(f"    Line {link.line_number}: {link.target}")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def write_report(
+    out: TextIO,
+    report_format: str,
+    scan_results: list[Finding],
+    validation: ValidationReport,
+    stats: ScanStats | None = None,
+) -> None:
+    """Write the report for *validation* to *out* in *report_format*.
+
+    ``text`` writes :func:`generate_report`.  The other formats are
+    written record by record as the findings are iterated, in the order
+    the pipeline produced them, so no more than one record is held in
+    memory beyond the inputs themselves.
+
+    Args:
+        out: Text stream to write to.
+        report_format: One of :data:`REPORT_FORMATS`.
+        scan_results: Findings from the initial scan pass.
+        validation: The :class:`ValidationReport` produced after fixes.
+        stats: Optional :class:`ScanStats` from the initial scan pass.
+
+    Raises:
+        ValueError: If *report_format* is not one of :data:`REPORT_FORMATS`.
+    """
+    writers: dict[str, Callable[..., None]] = {
+        "jsonl": write_jsonl_report,
+        "sarif": write_sarif_report,
+        "junit": write_junit_report,
+    }
+    if report_format == "text":
+        out.write(generate_report(scan_results, validation, stats))
+        out.write("\n")
+    elif report_format in writers:
+        writers[report_format](out, scan_results, validation, stats)
+    else:
+        raise ValueError(
+            f"unknown report format {report_format!r}; expected one of {', '.join(REPORT_FORMATS)}"
+        )
+
+
+def _summary(
+    scan_results: list[Finding],
+    validation: ValidationReport,
+    stats: ScanStats | None,
+) -> dict[str, object]:
+    summary: dict[str, object] = {
+        "files_scanned": dict(sorted(validation.total_files_scanned.items())),
+        "findings": len(scan_results),
+        "findings_by_type": dict(sorted(Counter(f.issue_type for f in scan_results).items())),
+        "references_fixed": validation.total_references_fixed,
+        "credentials_removed": validation.total_credentials_removed,
+        "account_ids_parameterized": validation.total_account_ids_parameterized,
+        "links_validated": validation.total_links_validated,
+        "broken_relative_paths": validation.total_broken_relative_paths,
+        "remaining_issues": len(validation.remaining_issues),
+    }
+    if stats is not None:
+        summary["scan_stats"] = asdict(stats)
+    return summary
+
+
+def write_jsonl_report(
+    out: TextIO,
+    scan_results: list[Finding],
+    validation: ValidationReport,
+    stats: ScanStats | None = None,
+) -> None:
+    """Write the report as JSON Lines.
+
+    One ``finding`` record per initial finding, one ``remaining`` record
+    per remaining issue and one ``broken_link`` record per broken link,
+    then a ``summary`` record — the record types ``--format jsonl``
+    uses.
+    """
+    def record(record_type: str, payload: dict[str, object]) -> None:
+        out.write(json.dumps({"type": record_type, **payload}, ensure_ascii=False))
+        out.write("\n")
+
+    for finding in scan_results:
+        record("finding", finding.to_dict())
+    for finding in validation.remaining_issues:
+        record("remaining", finding.to_dict())
+    for link in validation.broken_links:
+        record("broken_link", link.to_dict())
+    record("summary", _summary(scan_results, validation, stats))
+
+
+def _sarif_result(rule_id: str, message: str, file_path: str, line_number: int) -> dict[str, object]:
+    location: dict[str, object] = {
+        "artifactLocation": {"uri": file_path, "uriBaseId": "%SRCROOT%"},
+    }
+    if line_number > 0:
+        location["region"] = {"startLine": line_number}
+    return {
+        "ruleId": rule_id,
+        "level": _RULES[rule_id][1] if rule_id in _RULES else "warning",
+        "message": {"text": message},
+        "locations": [{"physicalLocation": location}],
+    }
+
+
+def write_sarif_report(
+    out: TextIO,
+    scan_results: list[Finding],
+    validation: ValidationReport,
+    stats: ScanStats | None = None,
+) -> None:
+    """Write the report as a SARIF 2.1.0 log for code-scanning upload.
+
+    Each remaining issue and broken link becomes a result whose rule is
+    the issue type (or ``broken_relative_link``); findings that were
+    fixed are not results.  Credential values are not copied into the
+    log.  The summary counts go in the run's ``properties``.
+    """
+    rules = [
+        {"id": rule_id, "shortDescription": {"text": text},
+         "defaultConfiguration": {"level": level}}
+        for rule_id, (text, level) in _RULES.items()
+    ]
+    head = {
+        "$schema": _SARIF_SCHEMA,
+        "version": "2.1.0",
+    }
+    run_head = {
+        "tool": {"driver": {"name": _TOOL_NAME, "rules": rules}},
+        "properties": _summary(scan_results, validation, stats),
+    }
+    # The log is one JSON document; write its envelope around the
+    # results so they can be serialised one at a time.
+    out.write(json.dumps(head, ensure_ascii=False)[:-1])
+    out.write(', "runs": [')
+    out.write(json.dumps(run_head, ensure_ascii=False)[:-1])
+    out.write(', "results": [')
+    separator = "\n"
+    for finding in validation.remaining_issues:
+        shown = "" if finding.issue_type == "credential" else f": {finding.matched_text}"
+        result = _sarif_result(
+            finding.issue_type,
+            f"Unresolved {finding.issue_type}{shown}",
+            finding.file_path,
+            finding.line_number,
+        )
+        out.write(separator + json.dumps(result, ensure_ascii=False))
+        separator = ",\n"
+    for link in validation.broken_links:
+        result = _sarif_result(
+            _BROKEN_LINK_RULE,
+            f"Broken relative link: {link.target}",
+            link.file_path,
+            link.line_number,
+        )
+        out.write(separator + json.dumps(result, ensure_ascii=False))
+        separator = ",\n"
+    out.write("\n]}]}\n")
+
+
+def write_junit_report(
+    out: TextIO,
+    scan_results: list[Finding],
+    validation: ValidationReport,
+    stats: ScanStats | None = None,
+) -> None:
+    """Write the report as JUnit XML.
+
+    Two test suites, ``remaining_issues`` and ``broken_links``, with one
+    failing test case per remaining issue or broken link (class name =
+    file path).  An empty suite gets a single passing test case, so CI
+    dashboards show the check ran.
+    """
+    issues = validation.remaining_issues
+    links = validation.broken_links
+    failures = len(issues) + len(links)
+    tests = max(len(issues), 1) + max(len(links), 1)
+    out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    out.write(
+        f"<testsuites name={quoteattr(_TOOL_NAME)} tests=\"{tests}\" failures=\"{failures}\">\n"
+    )
+
+    out.write(_junit_suite_open("remaining_issues", len(issues)))
+    for finding in issues:
+        detail = "" if finding.issue_type == "credential" else finding.matched_text
+        out.write(_junit_failure(
+            finding.file_path,
+            f"Line {finding.line_number}: [{finding.issue_type}]",
+            finding.issue_type,
+            f"Unresolved {finding.issue_type}",
+            detail,
+        ))
+    if not issues:
+        out.write('    <testcase classname="remaining_issues" name="no remaining issues"/>\n')
+    out.write("  </testsuite>\n")
+
+    out.write(_junit_suite_open("broken_links", len(links)))
+    for link in links:
+        out.write(_junit_failure(
+            link.file_path,
+            f"Line {link.line_number}: {link.target}",
+            _BROKEN_LINK_RULE,
+            "Broken relative link",
+            link.target,
+        ))
+    if not links:
+        out.write('    <testcase classname="broken_links" name="no broken links"/>\n')
+    out.write("  </testsuite>\n")
+    out.write("</testsuites>\n")
+
+
+def _junit_suite_open(name: str, failures: int) -> str:
+    return (
+        f"  <testsuite name={quoteattr(name)} tests=\"{max(failures, 1)}\" "
+        f"failures=\"{failures}\">\n"
+    )
+
+
+def _junit_failure(classname: str, name: str, failure_type: str, message: str, detail: str) -> str:
+    classname, name = _XML_INVALID.sub("?", classname), _XML_INVALID.sub("?", name)
+    return (
+        f"    <testcase classname={quoteattr(classname)} name={quoteattr(name)}>\n"
+        f"      <failure type={quoteattr(failure_type)} message={quoteattr(message)}>"
+        f"{escape(_XML_INVALID.sub('?', detail))}</failure>\n"
+        f"    </testcase>\n"
+    )
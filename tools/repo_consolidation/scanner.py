@@ -1,18 +1,33 @@
 """File discovery and scanning for the repo consolidation pipeline.
 
 Provides recursive file walking with binary detection, symlink loop
-handling, encoding fallback, and permission error resilience.
+handling, encoding fallback, and permission error resilience.  Scanning
+can optionally be spread across a process pool (see :func:`scan_repo`).
 """
 
 from __future__ import annotations
 
+import codecs
+import hashlib
 import logging
+import mmap
 import os
 import re
-from collections.abc import Iterator
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import replace
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from tools.repo_consolidation.models import Finding
+from tools.repo_consolidation import __version__, git_discovery
+from tools.repo_consolidation.cache import DEFAULT_CACHE_DIR, ScanCache, file_digest
+from tools.repo_consolidation.models import Finding, ScanStats
+from tools.repo_consolidation.profiling import Profiler
+
+if TYPE_CHECKING:
+    from tools.repo_consolidation.manifest import RepoManifest
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +42,22 @@ SKIP_DIRS: frozenset[str] = frozenset({
 # Number of bytes to read for binary detection.
 _BINARY_CHECK_SIZE = 8192
 
+# Window size for chunked work on mapped files (prefilter, UTF-8 check,
+# newline counting), which bounds per-file allocations.
+_CHUNK_SIZE = 1 << 20
+
+# Bump when the scanning logic changes in a way that alters findings, so
+# persisted scan caches are invalidated.
+_SCAN_ENGINE_VERSION = 1
+
+# Files per task handed to a worker process when scanning with ``jobs > 1``.
+_STREAM_BATCH_FILES = 64
+
+# Most files whose findings the deduplicator keeps for later duplicates.
+# Past it the least recently used are dropped, and a duplicate of a
+# dropped file is scanned on its own.
+_DEDUP_STORE_FILES = 4096
+
 
 def is_binary(file_path: Path) -> bool:
     """Return ``True`` if *file_path* appears to be a binary file.
@@ -63,17 +94,114 @@ def read_text(file_path: Path) -> str | None:
     return None
 
 
-def discover_files(repo_root: str | Path) -> Iterator[Path]:
+#: Valid values for the ``backend`` argument of :func:`discover_files`.
+DISCOVERY_BACKENDS = ("auto", "git", "walk")
+
+
+def discover_files(
+    repo_root: str | Path,
+    *,
+    backend: str = "auto",
+    changed_since: str | None = None,
+) -> Iterator[Path]:
     """Yield paths to every text file under *repo_root*.
 
-    Walks the directory tree recursively, skipping:
+    Two backends are available:
+
+    ``git``
+        Enumerates tracked and untracked-but-not-ignored files from the
+        git index (see :mod:`tools.repo_consolidation.git_discovery`).
+        Files marked binary by ``.gitattributes`` or a known binary
+        extension are skipped without being opened; the rest are sniffed
+        as usual.  Symlinked directories are not expanded.
+    ``walk``
+        Walks the directory tree with :func:`_walk_files`.
+
+    ``auto`` (the default) uses ``git`` when *repo_root* is inside a git
+    checkout and ``walk`` otherwise.  Directories listed in
+    :data:`SKIP_DIRS` are skipped by both backends.
+
+    *changed_since* limits the result to files that differ from the given
+    git ref, plus untracked files; it requires the ``git`` backend.
+
+    Raises:
+        ValueError: for an unknown *backend*, or *changed_since* outside
+            a git checkout or naming an invalid ref.
+    """
+    for fpath, binary in discover_candidates(
+        repo_root, backend=backend, changed_since=changed_since,
+    ):
+        if not binary:
+            yield fpath
+
+
+def discover_candidates(
+    repo_root: str | Path,
+    *,
+    backend: str = "auto",
+    changed_since: str | None = None,
+) -> Iterator[tuple[Path, bool]]:
+    """Yield ``(path, is_binary)`` for every file :func:`discover_files` considers.
+
+    Same backends, options and errors as :func:`discover_files`, which
+    is this generator with the binary files dropped.
+    """
+    if backend not in DISCOVERY_BACKENDS:
+        raise ValueError(f"unknown discovery backend: {backend!r}")
+    root = Path(repo_root).resolve()
+    if backend == "auto":
+        backend = "git" if git_discovery.is_git_checkout(root) else "walk"
+
+    if backend == "walk":
+        if changed_since is not None:
+            raise ValueError("changed_since requires a git checkout")
+        yield from _walk_candidates(root)
+        return
+
+    try:
+        entries = git_discovery.list_files(root, changed_since=changed_since)
+    except git_discovery.GitDiscoveryError as exc:
+        raise ValueError(str(exc)) from exc
+
+    for rel_path, known_binary in entries:
+        parts = rel_path.split("/")
+        if any(part in SKIP_DIRS for part in parts[:-1]):
+            continue
+        fpath = root.joinpath(*parts)
+        if known_binary:
+            logger.debug("Skipping binary file (by git attributes/extension): %s", rel_path)
+            yield fpath, True
+            continue
+        if not fpath.is_file():
+            # Deleted in the work tree, or a symlink to a directory.
+            continue
+        if is_binary(fpath):
+            logger.debug("Skipping binary file: %s", fpath)
+            yield fpath, True
+            continue
+        yield fpath, False
+
+
+def _walk_files(root: Path) -> Iterator[Path]:
+    """Yield text files under *root* by walking the directory tree.
+
+    See :func:`_walk_candidates`, which also yields the binary files.
+    """
+    for fpath, binary in _walk_candidates(root):
+        if not binary:
+            yield fpath
+
+
+def _walk_candidates(root: Path) -> Iterator[tuple[Path, bool]]:
+    """Yield ``(path, is_binary)`` for files under *root* by walking the tree.
+
+    Skips:
     * directories listed in :data:`SKIP_DIRS`
-    * binary files (detected via null-byte check)
     * symlink loops (tracked by real path)
 
+    Binary files (detected via null-byte check) are yielded flagged.
     Permission errors on directories or files are logged and skipped.
     """
-    root = Path(repo_root).resolve()
     visited_real_dirs: set[str] = set()
 
     for dirpath, dirnames, filenames in os.walk(root, followlinks=True):
@@ -99,15 +227,16 @@ def discover_files(repo_root: str | Path) -> Iterator[Path]:
             if d not in SKIP_DIRS
         ]
 
-        # --- yield text files ---
+        # --- yield files, flagging binaries ---
         for fname in filenames:
             fpath = current / fname
             if not fpath.is_file():
                 continue
             if is_binary(fpath):
                 logger.debug("Skipping binary file: %s", fpath)
+                yield fpath, True
                 continue
-            yield fpath
+            yield fpath, False
 
 
 # ---------------------------------------------------------------------------
@@ -190,6 +319,31 @@ SCAN_PATTERNS: dict[str, re.Pattern[str]] = {
     "stale_docker_image": _DOCKER_IMAGE_PATTERN,
 }
 
+#: Lowercase substrings that every match of a known pattern must contain.
+#: The scanner uses these as a cheap literal prefilter: a file (or line)
+#: containing none of them cannot match, so no regex is run on it.
+#: Patterns missing from this table (e.g. custom patterns passed to
+#: :func:`scan_repo`) disable the prefilter for the whole scan.
+_REQUIRED_LITERALS: dict[re.Pattern[str], tuple[str, ...]] = {
+    _OLD_URL_PATTERN: ("devcloudninjas",),
+    _PAT_PATTERN: ("ghp_",),
+    _ECR_PATTERN: (".dkr.ecr.",),
+    _DOCKER_IMAGE_PATTERN: ("devcloudninjas",),
+    _DOCKER_IMAGE_NAME_PATTERN: ("devcloudninjas",),
+}
+
+#: Characters other than ``\n`` that :meth:`str.splitlines` treats as line
+#: boundaries.  ``\r`` is absent because :func:`read_text` reads in
+#: universal-newline mode.
+_EXOTIC_LINE_BREAK = re.compile("[\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+#: The same boundaries as raw byte sequences, per decoding.
+_EXOTIC_UTF8_BREAKS = (
+    b"\x0b", b"\x0c", b"\x1c", b"\x1d", b"\x1e",
+    b"\xc2\x85", b"\xe2\x80\xa8", b"\xe2\x80\xa9",
+)
+_EXOTIC_LATIN1_BREAKS = (b"\x0b", b"\x0c", b"\x1c", b"\x1d", b"\x1e", b"\x85")
+
 # The consolidated repo name — matches against this are *not* old URLs.
 _CONSOLIDATED_REPO_NAME = "DevOps-Projects"
 
@@ -233,108 +387,867 @@ def _extract_repo_name(match: re.Match[str]) -> str:
     return name
 
 
-def scan_repo(
-    repo_root: str | Path,
-    patterns: dict[str, re.Pattern[str]] | None = None,
-) -> list[Finding]:
-    """Scan every text file under *repo_root* and return all findings.
+def _prefilter_literals(
+    patterns: dict[str, re.Pattern[str]],
+) -> tuple[str, ...] | None:
+    """Return the literal prefilter for *patterns*, or ``None`` if unknown.
 
-    Parameters
-    ----------
-    repo_root:
-        Path to the repository root directory.
-    patterns:
-        Optional mapping of ``issue_type → compiled regex``.  Defaults
-        to :data:`SCAN_PATTERNS` when *None*.
+    The result always includes the literals for
+    :data:`_DOCKER_IMAGE_NAME_PATTERN`, which runs on every line
+    regardless of the active pattern set.
+    """
+    literals: set[str] = set(_REQUIRED_LITERALS[_DOCKER_IMAGE_NAME_PATTERN])
+    for pattern in patterns.values():
+        required = _REQUIRED_LITERALS.get(pattern)
+        if required is None:
+            return None
+        literals.update(required)
+    return tuple(sorted(literals))
 
-    Returns
-    -------
-    list[Finding]
-        One :class:`Finding` per match, with ``file_path`` relative to
-        *repo_root*.
+
+def _candidate_lines(
+    content: str,
+    literals: tuple[str, ...],
+) -> Iterator[tuple[int, str]]:
+    """Yield ``(line_number, line)`` for lines containing any of *literals*.
+
+    Searches the lowercased file buffer once per literal and maps each hit
+    back to its line, so lines without a candidate substring are never
+    materialised.  Line numbers match ``enumerate(content.splitlines(), 1)``.
     """
-    if patterns is None:
-        patterns = SCAN_PATTERNS
+    lowered = content.lower()
+    if len(lowered) != len(content):
+        # Some non-ASCII characters change length when lowercased, so
+        # offsets in *lowered* would not line up with *content*.
+        for line_no, line in enumerate(content.splitlines(), start=1):
+            low = line.lower()
+            if any(lit in low for lit in literals):
+                yield line_no, line
+        return
 
-    root = Path(repo_root).resolve()
-    findings: list[Finding] = []
+    line_starts: set[int] = set()
+    for lit in literals:
+        idx = lowered.find(lit)
+        while idx != -1:
+            line_starts.add(content.rfind("\n", 0, idx) + 1)
+            idx = lowered.find(lit, idx + len(lit))
+    if not line_starts:
+        return
 
-    for fpath in discover_files(repo_root):
-        rel_path = str(fpath.relative_to(root))
-        ft = _file_type(fpath)
+    if _EXOTIC_LINE_BREAK.search(content):
+        # splitlines() would break on more than "\n" — number lines the
+        # slow way rather than risk disagreeing with the unfiltered scan.
+        for line_no, line in enumerate(content.splitlines(), start=1):
+            low = line.lower()
+            if any(lit in low for lit in literals):
+                yield line_no, line
+        return
+
+    prev_start = 0
+    line_no = 1
+    for start in sorted(line_starts):
+        line_no += content.count("\n", prev_start, start)
+        prev_start = start
+        end = content.find("\n", start)
+        yield line_no, content[start:] if end == -1 else content[start:end]
+
+
+def _open_buffer(fpath: Path) -> mmap.mmap | bytes | None:
+    """Map *fpath* read-only, or return ``None`` if it cannot be read.
+
+    Empty files (which cannot be mapped) come back as ``b""``; files that
+    refuse to be mapped (special files, some network filesystems) are
+    read into memory instead.
+    """
+    try:
+        with open(fpath, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                return b""
+            try:
+                return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return fh.read()
+    except OSError as exc:
+        logger.warning("Permission/OS error reading %s: %s", fpath, exc)
+        return None
 
-        # --- private key file detection (filename-based) ---
-        if _PRIVATE_KEY_FILE_PATTERN.search(fpath.name):
-            findings.append(
-                Finding(
-                    file_path=rel_path,
-                    line_number=0,
-                    matched_text=fpath.name,
-                    issue_type="credential",
-                    old_repo_name="",
-                    context=f"Private key file: {fpath.name}",
-                    file_type=ft,
-                )
-            )
 
-        # --- line-by-line content scanning ---
+def _literal_hits(buf: mmap.mmap | bytes, literals: tuple[bytes, ...]) -> list[int]:
+    """Return the sorted offsets of every occurrence of *literals* in *buf*.
+
+    Matching is ASCII case-insensitive.  The buffer is lowercased one
+    :data:`_CHUNK_SIZE` window at a time (``bytes.lower`` never changes
+    length), so peak memory stays bounded on large files.
+    """
+    size = len(buf)
+    overlap = max(len(lit) for lit in literals) - 1
+    hits: list[int] = []
+    for base in range(0, size, _CHUNK_SIZE):
+        window = buf[base:base + _CHUNK_SIZE + overlap].lower()
+        for lit in literals:
+            idx = window.find(lit)
+            # Hits starting in the overlap belong to the next window.
+            while idx != -1 and idx < _CHUNK_SIZE:
+                hits.append(base + idx)
+                idx = window.find(lit, idx + 1)
+    hits.sort()
+    return hits
+
+
+def _is_utf8(buf: mmap.mmap | bytes) -> bool:
+    """Return ``True`` if all of *buf* decodes as UTF-8 (chunked)."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        for base in range(0, len(buf), _CHUNK_SIZE):
+            decoder.decode(buf[base:base + _CHUNK_SIZE])
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _has_exotic_line_breaks(buf: mmap.mmap | bytes, encoding: str) -> bool:
+    r"""Return ``True`` if *buf* has line breaks other than ``\n`` / ``\r\n``.
+
+    Lone ``\r`` (a break in universal-newline mode) and the extra
+    characters :meth:`str.splitlines` splits on mean line numbers cannot
+    be derived from ``\n`` offsets alone.
+    """
+    extra = _EXOTIC_UTF8_BREAKS if encoding == "utf-8" else _EXOTIC_LATIN1_BREAKS
+    if any(buf.find(brk) != -1 for brk in extra):
+        return True
+    if buf.find(b"\r") == -1:
+        return False
+    for base in range(0, len(buf), _CHUNK_SIZE):
+        # One byte of overlap so a "\r\n" straddling windows still pairs up.
+        window = buf[base:base + _CHUNK_SIZE + 1]
+        if window.count(b"\r", 0, _CHUNK_SIZE) != window.count(b"\r\n"):
+            return True
+    return False
+
+
+class _LineIndex:
+    r"""Lazy newline offset index over a byte buffer.
+
+    Resolves offsets to ``(line_number, start, end)`` by counting
+    ``\n`` bytes forward from the previous query, so a sorted sequence of
+    lookups costs one pass over the buffer in total.
+    """
+
+    def __init__(self, buf: mmap.mmap | bytes) -> None:
+        self._buf = buf
+        self._pos = 0
+        self._line = 1
+
+    def locate(self, offset: int) -> tuple[int, int, int]:
+        buf = self._buf
+        start = buf.rfind(b"\n", 0, offset) + 1
+        # Count newlines between the cursor and this line, window by window.
+        for base in range(self._pos, start, _CHUNK_SIZE):
+            self._line += buf[base:min(base + _CHUNK_SIZE, start)].count(b"\n")
+        self._pos = max(self._pos, start)
+        end = buf.find(b"\n", offset)
+        return self._line, start, len(buf) if end == -1 else end
+
+
+def _mapped_candidate_lines(
+    fpath: Path,
+    literals: tuple[str, ...],
+) -> list[tuple[int, str]] | None:
+    """Memory-mapped equivalent of ``_candidate_lines(read_text(fpath), ...)``.
+
+    Searches the raw bytes for *literals* and decodes only the lines that
+    contain a hit, using the same UTF-8 → latin-1 fallback as
+    :func:`read_text`.  Returns ``None`` if the file cannot be read.
+    """
+    buf = _open_buffer(fpath)
+    if buf is None:
+        return None
+    try:
+        hits = _literal_hits(buf, tuple(lit.encode("ascii") for lit in literals))
+        if not hits:
+            return []
+
+        encoding = "utf-8" if _is_utf8(buf) else "latin-1"
+        if _has_exotic_line_breaks(buf, encoding):
+            # Rare: fall back to full decoding with splitlines() semantics.
+            content = buf[:].decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
+            return list(_candidate_lines(content, literals))
+
+        index = _LineIndex(buf)
+        lines: list[tuple[int, str]] = []
+        last_start = -1
+        for offset in hits:
+            line_no, start, end = index.locate(offset)
+            if start == last_start:
+                continue
+            last_start = start
+            raw = buf[start:end]
+            if raw.endswith(b"\r"):
+                raw = raw[:-1]
+            lines.append((line_no, raw.decode(encoding)))
+        return lines
+    finally:
+        if isinstance(buf, mmap.mmap):
+            buf.close()
+
+
+def _filename_findings(fpath: Path, rel_path: str, ft: str) -> list[Finding]:
+    """Return the findings that depend only on *fpath*'s name (line 0)."""
+    if not _PRIVATE_KEY_FILE_PATTERN.search(fpath.name):
+        return []
+    return [
+        Finding(
+            file_path=rel_path,
+            line_number=0,
+            matched_text=fpath.name,
+            issue_type="credential",
+            old_repo_name="",
+            context=f"Private key file: {fpath.name}",
+            file_type=ft,
+        )
+    ]
+
+
+def _scan_file(
+    fpath: Path,
+    root: Path,
+    patterns: dict[str, re.Pattern[str]],
+    *,
+    prefilter: bool = True,
+    pattern_stats: dict[str, list[float]] | None = None,
+) -> list[Finding]:
+    """Scan a single text file and return its findings in line order.
+
+    Kept at module level (rather than nested in :func:`scan_repo`) so it
+    can be pickled and dispatched to worker processes.  With *prefilter*
+    (the default) only lines containing a required literal from
+    :data:`_REQUIRED_LITERALS` are matched against the full regexes;
+    *prefilter* exists so benchmarks can measure the unfiltered path.
+    When *pattern_stats* is given, ``[seconds, matches, lines]`` per
+    issue type (plus ``docker_image_name`` for the image-name check) are
+    accumulated into it for :mod:`~tools.repo_consolidation.profiling`.
+    """
+    rel_path = str(fpath.relative_to(root))
+    ft = _file_type(fpath)
+    findings = _filename_findings(fpath, rel_path, ft)
+
+    # --- line-by-line content scanning ---
+    literals = _prefilter_literals(patterns) if prefilter else None
+    lines: Iterable[tuple[int, str]] | None
+    if literals is None:
         content = read_text(fpath)
-        if content is None:
-            continue
+        lines = None if content is None else enumerate(content.splitlines(), start=1)
+    else:
+        lines = _mapped_candidate_lines(fpath, literals)
+    if lines is None:
+        return findings
 
-        for line_no, line in enumerate(content.splitlines(), start=1):
-            for issue_type, pattern in patterns.items():
-                for m in pattern.finditer(line):
-                    matched = m.group(0)
-
-                    # For old_url: skip references to the consolidated repo itself,
-                    # self-references to project subfolders, and hash-like strings.
-                    if issue_type == "old_url":
-                        repo_name = _extract_repo_name(m)
-                        if repo_name == _CONSOLIDATED_REPO_NAME:
-                            continue
-                        if _SELF_REFERENCE_PATTERN.match(repo_name):
-                            continue
-                        if _HASH_PATTERN.match(repo_name):
-                            continue
-                        if not repo_name:
-                            continue
-                    else:
-                        repo_name = ""
+    timed = pattern_stats is not None
+    for line_no, line in lines:
+        lowered = line.lower() if literals is not None else ""
+        for issue_type, pattern in patterns.items():
+            if literals is not None and not any(
+                lit in lowered for lit in _REQUIRED_LITERALS[pattern]
+            ):
+                continue
+            if timed:
+                started, before = time.perf_counter(), len(findings)
+            for m in pattern.finditer(line):
+                matched = m.group(0)
+
+                # For old_url: skip references to the consolidated repo itself,
+                # self-references to project subfolders, and hash-like strings.
+                if issue_type == "old_url":
+                    repo_name = _extract_repo_name(m)
+                    if repo_name == _CONSOLIDATED_REPO_NAME:
+                        continue
+                    if _SELF_REFERENCE_PATTERN.match(repo_name):
+                        continue
+                    if _HASH_PATTERN.match(repo_name):
+                        continue
+                    if not repo_name:
+                        continue
+                else:
+                    repo_name = ""
+
+                findings.append(
+                    Finding(
+                        file_path=rel_path,
+                        line_number=line_no,
+                        matched_text=matched,
+                        issue_type=issue_type,
+                        old_repo_name=repo_name,
+                        context=line,
+                        file_type=ft,
+                    )
+                )
+            if timed:
+                _tally(pattern_stats, issue_type, started, len(findings) - before)
 
+        # --- devcloudninjas image name (not caught by URL/docker.build) ---
+        # Only flag if the line does NOT already contain a github.com URL
+        # or a docker.build call (those are handled above), AND the line
+        # is in a Docker-relevant context.
+        if timed:
+            started, before = time.perf_counter(), len(findings)
+        if _DOCKER_IMAGE_NAME_PATTERN.search(line):
+            if (
+                not _OLD_URL_PATTERN.search(line)
+                and not _DOCKER_IMAGE_PATTERN.search(line)
+                and _is_docker_image_context(line, ft)
+            ):
+                for m in _DOCKER_IMAGE_NAME_PATTERN.finditer(line):
                     findings.append(
                         Finding(
                             file_path=rel_path,
                             line_number=line_no,
-                            matched_text=matched,
-                            issue_type=issue_type,
-                            old_repo_name=repo_name,
+                            matched_text=m.group(0),
+                            issue_type="stale_docker_image",
+                            old_repo_name="",
                             context=line,
                             file_type=ft,
                         )
                     )
+        if timed:
+            _tally(pattern_stats, "docker_image_name", started, len(findings) - before)
 
-            # --- devcloudninjas image name (not caught by URL/docker.build) ---
-            # Only flag if the line does NOT already contain a github.com URL
-            # or a docker.build call (those are handled above), AND the line
-            # is in a Docker-relevant context.
-            if _DOCKER_IMAGE_NAME_PATTERN.search(line):
-                if (
-                    not _OLD_URL_PATTERN.search(line)
-                    and not _DOCKER_IMAGE_PATTERN.search(line)
-                    and _is_docker_image_context(line, ft)
-                ):
-                    for m in _DOCKER_IMAGE_NAME_PATTERN.finditer(line):
-                        findings.append(
-                            Finding(
-                                file_path=rel_path,
-                                line_number=line_no,
-                                matched_text=m.group(0),
-                                issue_type="stale_docker_image",
-                                old_repo_name="",
-                                context=line,
-                                file_type=ft,
-                            )
-                        )
+    return findings
+
+
+def _tally(
+    pattern_stats: dict[str, list[float]],
+    name: str,
+    started: float,
+    matches: int,
+) -> None:
+    entry = pattern_stats.setdefault(name, [0.0, 0, 0])
+    entry[0] += time.perf_counter() - started
+    entry[1] += matches
+    entry[2] += 1
+
+
+def _scan_batch(
+    paths: list[str],
+    root: str,
+    patterns: dict[str, re.Pattern[str]],
+) -> list[list[Finding]]:
+    """Scan a batch of files inside a worker process.
+
+    Paths travel as strings and the batch result as one list (one entry
+    per path, in order) so each round-trip through the pool pickles a
+    single payload.
+    """
+    root_path = Path(root)
+    return [_scan_file(Path(p), root_path, patterns) for p in paths]
+
+
+def _scan_batch_profiled(
+    paths: list[str],
+    root: str,
+    patterns: dict[str, re.Pattern[str]],
+) -> tuple[list[list[Finding]], list[tuple[float, float]], dict[str, list[float]], int]:
+    """Like :func:`_scan_batch`, also returning timing data for a profiler.
+
+    Returns the findings, ``(start, seconds)`` per path, the per-pattern
+    accumulators and the worker's pid.
+    """
+    root_path = Path(root)
+    pattern_stats: dict[str, list[float]] = {}
+    results: list[list[Finding]] = []
+    timings: list[tuple[float, float]] = []
+    for p in paths:
+        started = time.perf_counter()
+        results.append(_scan_file(Path(p), root_path, patterns, pattern_stats=pattern_stats))
+        timings.append((started, time.perf_counter() - started))
+    return results, timings, pattern_stats, os.getpid()
+
+
+class _Deduplicator:
+    """Spot files whose content matches a file scanned earlier in the same pass.
+
+    Files are bucketed by ``(size, file type)`` and only hashed once a
+    second file lands in the same bucket, so a file with a unique size
+    is never read an extra time.  The file type is part of the key
+    because it decides which docker-image lines count as findings.
+
+    Call :meth:`owner_of` for each file about to be scanned, in discovery
+    order; :meth:`record` with the findings of every file it returned
+    ``None`` for; and :meth:`fan_out` to derive a duplicate's findings
+    from its owner's.  Also keeps the scanned/deduplicated counters of
+    *stats* up to date.
+
+    Findings are kept for at most *max_stored* files (default
+    :data:`_DEDUP_STORE_FILES`), least recently used first out, plus
+    any owner with a duplicate still waiting for :meth:`fan_out`.  Once
+    an owner's findings are dropped, its next duplicate is scanned and
+    takes over as owner.  The size and digest index itself still grows
+    with the number of files, but holds no findings.
+    """
+
+    def __init__(
+        self,
+        stats: ScanStats,
+        *,
+        enabled: bool = True,
+        manifest: RepoManifest | None = None,
+        max_stored: int | None = None,
+    ) -> None:
+        self.stats = stats
+        self.enabled = enabled
+        self.manifest = manifest
+        self.max_stored = _DEDUP_STORE_FILES if max_stored is None else max_stored
+        self._first: dict[tuple[int, str], Path] = {}
+        self._owners: dict[tuple[str, str], Path] = {}
+        self._digests: dict[Path, str | None] = {}
+        self._candidates: set[Path] = set()
+        self._findings: OrderedDict[Path, list[Finding]] = OrderedDict()
+        # Owners with duplicates between owner_of() and fan_out().
+        self._pins: dict[Path, int] = {}
+
+    def owner_of(self, fpath: Path) -> Path | None:
+        """Return an earlier file with *fpath*'s exact content, else ``None``.
+
+        ``None`` means *fpath* must be scanned.
+        """
+        size = self._size(fpath)
+        if size is None:
+            size = 0
+        elif self.enabled:
+            owner = self._match(fpath, size)
+            if owner is not None:
+                self._pins[owner] = self._pins.get(owner, 0) + 1
+                if owner in self._findings:
+                    self._findings.move_to_end(owner)
+                self.stats.files_deduplicated += 1
+                self.stats.bytes_deduplicated += size
+                return owner
+        self.stats.files_scanned += 1
+        self.stats.bytes_scanned += size
+        return None
+
+    def _size(self, fpath: Path) -> int | None:
+        if self.manifest is not None:
+            size = self.manifest.size(fpath)
+            if size is not None:
+                return size
+        try:
+            return fpath.stat().st_size
+        except OSError:
+            return None
+
+    def _match(self, fpath: Path, size: int) -> Path | None:
+        ft = _file_type(fpath)
+        first = self._first.setdefault((size, ft), fpath)
+        if first == fpath:
+            self._candidates.add(fpath)
+            return None
+        if first not in self._digests:
+            first_digest = self._digest(first)
+            if first_digest is not None:
+                self._owners.setdefault((first_digest, ft), first)
+        digest = self._digest(fpath)
+        if digest is None:
+            return None
+        owner = self._owners.setdefault((digest, ft), fpath)
+        if owner != fpath and owner not in self._candidates:
+            # The owner's findings were dropped from the store.
+            owner = self._owners[(digest, ft)] = fpath
+        if owner == fpath:
+            self._candidates.add(fpath)
+            return None
+        return owner
+
+    def _digest(self, fpath: Path) -> str | None:
+        digest = self.manifest.digest(fpath) if self.manifest is not None else None
+        if digest is None:
+            try:
+                digest = file_digest(fpath)
+            except OSError:
+                digest = None
+        self._digests[fpath] = digest
+        return digest
+
+    def digest(self, fpath: Path) -> str | None:
+        """Return *fpath*'s content hash if it was computed, else ``None``."""
+        return self._digests.get(fpath)
+
+    def record(self, fpath: Path, findings: list[Finding]) -> None:
+        """Remember the content findings of *fpath* for later duplicates."""
+        if fpath in self._candidates:
+            self._findings[fpath] = [f for f in findings if f.line_number]
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop the least recently used unpinned findings beyond the limit."""
+        for _ in range(len(self._findings)):
+            if len(self._findings) <= self.max_stored:
+                return
+            owner, findings = self._findings.popitem(last=False)
+            if owner in self._pins:
+                self._findings[owner] = findings
+            else:
+                self._candidates.discard(owner)
+
+    def fan_out(self, owner: Path, fpath: Path, root: Path) -> list[Finding]:
+        """Return *fpath*'s findings, copied from those of *owner*."""
+        rel_path = str(fpath.relative_to(root))
+        findings = _filename_findings(fpath, rel_path, _file_type(fpath))
+        findings.extend(
+            replace(f, file_path=rel_path) for f in self._findings.get(owner, ())
+        )
+        pins = self._pins.pop(owner) - 1
+        if pins:
+            self._pins[owner] = pins
+        return findings
+
+
+def scan_version_key(patterns: dict[str, re.Pattern[str]]) -> str:
+    """Return a key identifying the scan semantics for *patterns*.
+
+    Covers the issue-type → regex mapping plus the fixed helper patterns
+    used by :func:`_scan_file`, so changing any of them invalidates a
+    :class:`~tools.repo_consolidation.cache.ScanCache`.
+    """
+    h = hashlib.sha256()
+    h.update(f"{__version__}:{_SCAN_ENGINE_VERSION}".encode())
+    for issue_type, pattern in patterns.items():
+        h.update(f"\0{issue_type}\0{pattern.pattern}\0{pattern.flags}".encode())
+    for helper in (
+        _OLD_URL_PATTERN,
+        _DOCKER_IMAGE_PATTERN,
+        _DOCKER_IMAGE_NAME_PATTERN,
+        _DOCKER_CONTEXT_INDICATORS,
+        _PRIVATE_KEY_FILE_PATTERN,
+        _SELF_REFERENCE_PATTERN,
+        _HASH_PATTERN,
+    ):
+        h.update(f"\0{helper.pattern}\0{helper.flags}".encode())
+    return h.hexdigest()
+
+
+def resolve_jobs(jobs: int | None) -> int:
+    """Normalise a ``--jobs`` value: ``None``/``0``/negative → CPU count."""
+    if jobs is None or jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def iter_findings(
+    repo_root: str | Path,
+    patterns: dict[str, re.Pattern[str]] | None = None,
+    *,
+    jobs: int = 1,
+    cache: ScanCache | None = None,
+    backend: str = "auto",
+    changed_since: str | None = None,
+    dedup: bool = True,
+    stats: ScanStats | None = None,
+    profiler: Profiler | None = None,
+    paths: Iterable[str] | None = None,
+    manifest: RepoManifest | None = None,
+    skip_dir: str | Path | None = None,
+) -> Iterator[Finding]:
+    """Yield findings for every text file under *repo_root* as they are produced.
+
+    The streaming counterpart of :func:`scan_repo` (which simply collects
+    this generator): findings arrive file by file, in discovery order,
+    with all findings for one file contiguous.  Findings are not
+    accumulated: with *jobs* > 1 at most ``2 * jobs`` batches of
+    :data:`_STREAM_BATCH_FILES` files are pending at any time, and
+    deduplication keeps the findings of at most
+    :data:`_DEDUP_STORE_FILES` files (plus owners of pending
+    duplicates).  Its per-file size and digest index does grow with the
+    repository, as does *manifest* when given.
+
+    Parameters are the same as :func:`scan_repo`.  The *cache* is saved
+    when the generator finishes; a generator closed early saves what it
+    has without pruning entries it never reached.  *stats* is updated as
+    files are consumed.
+    """
+    if patterns is None:
+        patterns = SCAN_PATTERNS
+
+    root = Path(repo_root).resolve()
+    jobs = resolve_jobs(jobs)
+    if cache is not None:
+        cache.open(scan_version_key(patterns))
+
+    files: Iterable[Path]
+    if paths is not None:
+        files = _existing_files(root, paths) if manifest is None else manifest.text_files(paths)
+    elif manifest is None:
+        files = discover_files(repo_root, backend=backend, changed_since=changed_since)
+    elif manifest.complete:
+        files = manifest.text_files()
+    else:
+        files = manifest.discover(backend=backend, changed_since=changed_since)
+    if skip_dir is None:
+        skip_dir = cache.cache_dir if cache is not None else DEFAULT_CACHE_DIR
+    files = _outside(files, (root / skip_dir).resolve())
+    dedup_state = _Deduplicator(
+        stats if stats is not None else ScanStats(), enabled=dedup, manifest=manifest,
+    )
+    completed = False
+    try:
+        if jobs == 1:
+            for fpath in files:
+                yield from _cached_or_scanned(
+                    fpath, root, patterns, cache, dedup_state, profiler,
+                )
+        else:
+            yield from _iter_pool(
+                files, root, patterns, cache, jobs, dedup_state, profiler,
+            )
+        completed = True
+    finally:
+        if dedup_state.stats.files_deduplicated:
+            logger.info(
+                "Deduplicated %d file(s) (%d byte(s)) with identical content.",
+                dedup_state.stats.files_deduplicated,
+                dedup_state.stats.bytes_deduplicated,
+            )
+        if cache is not None:
+            # A partial (changed-since, explicit-paths or abandoned) scan
+            # must not evict entries for the files it did not look at.
+            cache.save(prune=completed and changed_since is None and paths is None)
+            logger.info(
+                "Scan cache: %d hit(s), %d miss(es).", cache.hits, cache.misses,
+            )
+
+
+def _outside(files: Iterable[Path], skip_dir: Path) -> Iterator[Path]:
+    """Yield the paths in *files* that are not inside *skip_dir*."""
+    for fpath in files:
+        if not fpath.is_relative_to(skip_dir):
+            yield fpath
 
+
+def _existing_files(root: Path, paths: Iterable[str]) -> Iterator[Path]:
+    """Yield the text files among repo-relative *paths*, skipping missing ones."""
+    for rel_path in paths:
+        parts = rel_path.split("/")
+        if any(part in SKIP_DIRS for part in parts[:-1]):
+            continue
+        fpath = root.joinpath(*parts)
+        if not fpath.is_file():
+            continue
+        if is_binary(fpath):
+            logger.debug("Skipping binary file: %s", fpath)
+            continue
+        yield fpath
+
+
+def _cached_or_scanned(
+    fpath: Path,
+    root: Path,
+    patterns: dict[str, re.Pattern[str]],
+    cache: ScanCache | None,
+    dedup: _Deduplicator,
+    profiler: Profiler | None = None,
+) -> list[Finding]:
+    """Return *fpath*'s findings from *cache*, a duplicate, or a fresh scan.
+
+    Fresh and deduplicated results are stored back into *cache*.
+    """
+    rel_path = str(fpath.relative_to(root))
+    if cache is not None:
+        findings = cache.lookup(rel_path, fpath, _file_type(fpath))
+        if findings is not None:
+            dedup.stats.files_cached += 1
+            return findings
+    owner = dedup.owner_of(fpath)
+    if owner is None:
+        if profiler is None:
+            findings = _scan_file(fpath, root, patterns)
+        else:
+            started = time.perf_counter()
+            findings = _scan_file(
+                fpath, root, patterns, pattern_stats=profiler.pattern_stats,
+            )
+            profiler.file_scanned(rel_path, started, time.perf_counter() - started)
+        dedup.record(fpath, findings)
+    else:
+        findings = dedup.fan_out(owner, fpath, root)
+    if cache is not None:
+        cache.store(rel_path, fpath, findings, digest=dedup.digest(fpath))
     return findings
+
+
+def _iter_pool(
+    files: Iterable[Path],
+    root: Path,
+    patterns: dict[str, re.Pattern[str]],
+    cache: ScanCache | None,
+    jobs: int,
+    dedup: _Deduplicator,
+    profiler: Profiler | None = None,
+) -> Iterator[Finding]:
+    """Scan *files* on a process pool, yielding findings in discovery order.
+
+    Files are grouped into batches of :data:`_STREAM_BATCH_FILES`.  Cache
+    hits are resolved up front; the misses of each batch go to the pool
+    as one task, except duplicates of files already submitted, which are
+    filled in from their owner's findings while draining.  Batches are
+    drained strictly first-in first-out, which keeps the output
+    deterministic, caps the number in flight, and guarantees an owner is
+    resolved before any of its duplicates.
+    """
+    # Per file: cached findings, the owner it duplicates, or neither (scan).
+    Entry = tuple[Path, list[Finding] | None, Path | None]
+    pending: deque[tuple[list[Entry], Future | None]] = deque()
+
+    def drain_one() -> Iterator[Finding]:
+        batch, future = pending.popleft()
+        scanned: Iterator[list[Finding]] = iter(())
+        timings: Iterator[tuple[float, float]] = iter(())
+        worker = None
+        if future is not None and profiler is not None:
+            results, batch_timings, pattern_stats, worker = future.result()
+            profiler.add_pattern_stats(pattern_stats)
+            scanned, timings = iter(results), iter(batch_timings)
+        elif future is not None:
+            scanned = iter(future.result())
+        for fpath, findings, owner in batch:
+            if findings is None:
+                if owner is None:
+                    findings = next(scanned)
+                    dedup.record(fpath, findings)
+                    if profiler is not None:
+                        profiler.file_scanned(
+                            str(fpath.relative_to(root)), *next(timings), worker=worker,
+                        )
+                else:
+                    findings = dedup.fan_out(owner, fpath, root)
+                if cache is not None:
+                    cache.store(
+                        str(fpath.relative_to(root)), fpath, findings,
+                        digest=dedup.digest(fpath),
+                    )
+            yield from findings
+
+    def submit(batch_paths: list[Path]) -> None:
+        batch: list[Entry] = []
+        misses: list[str] = []
+        for fpath in batch_paths:
+            cached = owner = None
+            if cache is not None:
+                cached = cache.lookup(str(fpath.relative_to(root)), fpath, _file_type(fpath))
+            if cached is not None:
+                dedup.stats.files_cached += 1
+            else:
+                owner = dedup.owner_of(fpath)
+                if owner is None:
+                    misses.append(str(fpath))
+            batch.append((fpath, cached, owner))
+        scan = _scan_batch if profiler is None else _scan_batch_profiled
+        future = pool.submit(scan, misses, str(root), patterns) if misses else None
+        pending.append((batch, future))
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        try:
+            current: list[Path] = []
+            for fpath in files:
+                current.append(fpath)
+                if len(current) == _STREAM_BATCH_FILES:
+                    submit(current)
+                    current = []
+                    while len(pending) > 2 * jobs:
+                        yield from drain_one()
+            if current:
+                submit(current)
+            while pending:
+                yield from drain_one()
+        finally:
+            for _, future in pending:
+                if future is not None:
+                    future.cancel()
+
+
+def scan_repo(
+    repo_root: str | Path,
+    patterns: dict[str, re.Pattern[str]] | None = None,
+    *,
+    jobs: int = 1,
+    cache: ScanCache | None = None,
+    backend: str = "auto",
+    changed_since: str | None = None,
+    dedup: bool = True,
+    stats: ScanStats | None = None,
+    profiler: Profiler | None = None,
+    paths: Iterable[str] | None = None,
+    manifest: RepoManifest | None = None,
+    skip_dir: str | Path | None = None,
+) -> list[Finding]:
+    """Scan every text file under *repo_root* and return all findings.
+
+    Parameters
+    ----------
+    repo_root:
+        Path to the repository root directory.
+    patterns:
+        Optional mapping of ``issue_type → compiled regex``.  Defaults
+        to :data:`SCAN_PATTERNS` when *None*.
+    jobs:
+        Number of worker processes.  ``1`` (the default) scans in the
+        calling process; ``0`` or a negative value uses every CPU.  Files
+        from :func:`discover_files` are sent to the pool in contiguous
+        batches and the results are emitted in discovery order, so the
+        output is identical regardless of *jobs*.
+    cache:
+        Optional :class:`~tools.repo_consolidation.cache.ScanCache`.
+        Files whose size/mtime or content hash match a cached entry are
+        not re-scanned; only misses are read (and, with *jobs*, sent to
+        the pool).  The cache is saved before returning.
+    backend, changed_since:
+        Forwarded to :func:`discover_files`.
+    dedup:
+        When true (the default), a file whose bytes are identical to a
+        file already scanned in this pass is not scanned again; its
+        findings are copied from the earlier file with ``file_path``
+        rewritten.  Candidates are grouped by size and file type first,
+        so only files sharing both are hashed.
+    stats:
+        Optional :class:`~tools.repo_consolidation.models.ScanStats`
+        that receives the scanned, cached and deduplicated counts.
+    profiler:
+        Optional :class:`~tools.repo_consolidation.profiling.Profiler`
+        that receives per-file and per-pattern timings for every file
+        actually scanned (cache hits and duplicates are not timed).
+    paths:
+        Scan only these repo-relative paths, in the given order, instead
+        of discovering files; paths that no longer exist or are binary
+        are skipped.  *backend* and *changed_since* are then ignored.
+    manifest:
+        Shared :class:`~tools.repo_consolidation.manifest.RepoManifest`.
+        A complete manifest replaces discovery (and, with *paths*, limits
+        the scan to the listed files it records); an empty one is filled
+        in by this scan.  Its sizes and content hashes also serve
+        deduplication.
+    skip_dir:
+        Directory whose files are never scanned; a relative path is
+        taken from *repo_root*.  Defaults to the directory of *cache*,
+        or :data:`~tools.repo_consolidation.cache.DEFAULT_CACHE_DIR`
+        without one, so a scan cache is never scanned for the very
+        findings it records.
+
+    Returns
+    -------
+    list[Finding]
+        One :class:`Finding` per match, with ``file_path`` relative to
+        *repo_root*.  See :func:`iter_findings` for a streaming variant.
+    """
+    return list(iter_findings(
+        repo_root,
+        patterns,
+        jobs=jobs,
+        cache=cache,
+        backend=backend,
+        changed_since=changed_since,
+        dedup=dedup,
+        stats=stats,
+        profiler=profiler,
+        paths=paths,
+        manifest=manifest,
+        skip_dir=skip_dir,
+    ))
@@ -7,8 +7,8 @@ from pathlib import Path
 
 import pytest
 
-from tools.repo_consolidation.applier import ApplySummary, apply_replacements
-from tools.repo_consolidation.models import Replacement
+from tools.repo_consolidation.applier import ApplySummary, apply_file_edits, apply_replacements
+from tools.repo_consolidation.models import FileEdits, Replacement
 
 
 # ---------------------------------------------------------------------------
@@ -199,6 +199,18 @@ class TestDryRun:
 
         assert any("DRY-RUN" in rec.message for rec in caplog.records)
 
+    def test_dry_run_logs_whole_lines(self, tmp_path: Path, caplog) -> None:
+        _write_file(tmp_path, "f.md", "intro\nsee old-url and old-url here\n")
+        edits = FileEdits(file_path="f.md")
+        edits.add_line(2, "see old-url and old-url here", "see new and new here", "<!-- moved -->")
+        with caplog.at_level(logging.INFO):
+            apply_file_edits([edits], str(tmp_path), dry_run=True)
+
+        assert [rec.message for rec in caplog.records if "DRY-RUN" in rec.message] == [
+            "DRY-RUN: f.md line 2: insert '<!-- moved -->'",
+            "DRY-RUN: f.md line 2: 'see old-url and old-url here' -> 'see new and new here'",
+        ]
+
     def test_dry_run_logs_delete(self, tmp_path: Path, caplog) -> None:
         _write_file(tmp_path, "f.txt", "data\n")
         r = Replacement("f.txt", 1, "", "", action="delete_file")
@@ -279,6 +291,136 @@ class TestMultipleFiles:
         assert summary.files_flagged == 1
 
 
+# ---------------------------------------------------------------------------
+# Span patch engine
+# ---------------------------------------------------------------------------
+
+class TestPatchEngine:
+    """Tests for conflict detection, line endings and atomic writes."""
+
+    def test_conflicting_edits_reported(self, tmp_path: Path) -> None:
+        _write_file(tmp_path, "f.txt", "a\nb\n")
+        replacements = [
+            Replacement("f.txt", 2, "b", "B1", action="replace"),
+            Replacement("f.txt", 2, "b", "B2", action="replace"),
+        ]
+        summary = apply_replacements(replacements, str(tmp_path))
+
+        assert (tmp_path / "f.txt").read_text() == "a\nB1\n"
+        assert summary.replacements_applied == 1
+        assert len(summary.errors) == 1
+        assert "conflicting" in summary.errors[0].lower()
+
+    def test_identical_duplicates_are_not_conflicts(self, tmp_path: Path) -> None:
+        _write_file(tmp_path, "f.txt", "b\n")
+        r = Replacement("f.txt", 1, "b", "B", comment="# note", action="replace")
+        summary = apply_replacements([r, r], str(tmp_path))
+
+        assert (tmp_path / "f.txt").read_text() == "# note\nB\n"
+        assert summary.replacements_applied == 2
+        assert summary.errors == []
+
+    def test_line_endings_preserved(self, tmp_path: Path) -> None:
+        (tmp_path / "f.txt").write_bytes(b"a\r\nold\r\nlast")
+        replacements = [
+            Replacement("f.txt", 2, "old", "new", comment="# c", action="replace"),
+            Replacement("f.txt", 3, "last", "LAST", action="replace"),
+        ]
+        apply_replacements(replacements, str(tmp_path))
+
+        assert (tmp_path / "f.txt").read_bytes() == b"a\r\n# c\r\nnew\r\nLAST"
+
+    def test_atomic_write_keeps_mode_and_leaves_no_temp_files(self, tmp_path: Path) -> None:
+        path = _write_file(tmp_path, "run.sh", "old\n")
+        path.chmod(0o750)
+        apply_replacements([Replacement("run.sh", 1, "old", "new")], str(tmp_path))
+
+        assert path.read_text() == "new\n"
+        assert path.stat().st_mode & 0o777 == 0o750
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["run.sh"]
+
+    def test_symlink_is_written_through(self, tmp_path: Path) -> None:
+        target = _write_file(tmp_path, "shared/README.md", "old\n")
+        (tmp_path / "docs").mkdir()
+        link = tmp_path / "docs" / "README.md"
+        link.symlink_to("../shared/README.md")
+        apply_replacements([Replacement("docs/README.md", 1, "old", "new")], str(tmp_path))
+
+        assert link.is_symlink()
+        assert target.read_text() == "new\n"
+        assert sorted(p.name for p in (tmp_path / "docs").iterdir()) == ["README.md"]
+        assert sorted(p.name for p in (tmp_path / "shared").iterdir()) == ["README.md"]
+
+    def test_file_edits_replace_only_their_span(self, tmp_path: Path) -> None:
+        _write_file(tmp_path, "f.md", "see old-url here\nkeep\n")
+        edits = FileEdits(file_path="f.md")
+        edits.add_line(1, "see old-url here", "see new-path here", "<!-- note -->")
+        summary = apply_file_edits([edits], str(tmp_path))
+
+        assert (tmp_path / "f.md").read_text() == "<!-- note -->\nsee new-path here\nkeep\n"
+        assert summary.files_modified == 1
+        assert summary.replacements_applied == 1
+
+    def test_stale_file_edit_reported(self, tmp_path: Path) -> None:
+        _write_file(tmp_path, "f.md", "see something else\n")
+        edits = FileEdits(file_path="f.md")
+        edits.add_line(1, "see old-url here", "see new-path here")
+        summary = apply_file_edits([edits], str(tmp_path))
+
+        assert (tmp_path / "f.md").read_text() == "see something else\n"
+        assert summary.files_modified == 0
+        assert "stale" in summary.errors[0].lower()
+
+
+# ---------------------------------------------------------------------------
+# Concurrent apply
+# ---------------------------------------------------------------------------
+
+class TestConcurrentApply:
+    """Tests for the ``jobs`` and ``fsync`` options."""
+
+    @staticmethod
+    def _replacements(tmp_path: Path) -> list[Replacement]:
+        replacements = []
+        for i in range(12):
+            _write_file(tmp_path, f"d{i % 3}/f{i}.txt", "old\n")
+            replacements.append(Replacement(f"d{i % 3}/f{i}.txt", 1, "old", "new"))
+            replacements.append(Replacement(f"missing{i}.txt", 1, "old", "new"))
+        return replacements
+
+    def test_same_summary_for_any_jobs(self, tmp_path_factory: pytest.TempPathFactory) -> None:
+        serial_root = tmp_path_factory.mktemp("serial")
+        threaded_root = tmp_path_factory.mktemp("threaded")
+        serial = apply_replacements(self._replacements(serial_root), str(serial_root))
+        threaded = apply_replacements(
+            self._replacements(threaded_root), str(threaded_root), jobs=4,
+        )
+
+        assert threaded.files_modified == serial.files_modified == 12
+        assert threaded.replacements_applied == serial.replacements_applied
+        assert threaded.errors == serial.errors
+        assert len(threaded.errors) == 12
+        assert (threaded_root / "d1" / "f4.txt").read_text() == "new\n"
+
+    def test_fsync_flushes_files_and_each_directory_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        synced: list[int] = []
+        monkeypatch.setattr("tools.repo_consolidation.applier.os.fsync", synced.append)
+        replacements = [r for r in self._replacements(tmp_path) if "missing" not in r.file_path]
+        apply_replacements(replacements, str(tmp_path), jobs=3, fsync=True)
+
+        # 12 files plus the 3 directories holding them.
+        assert len(synced) == 15
+
+    def test_no_fsync_by_default(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        synced: list[int] = []
+        monkeypatch.setattr("tools.repo_consolidation.applier.os.fsync", synced.append)
+        apply_replacements(self._replacements(tmp_path), str(tmp_path))
+
+        assert synced == []
+
+
 # ---------------------------------------------------------------------------
 # Summary dataclass
 # ---------------------------------------------------------------------------
@@ -293,3 +435,17 @@ class TestApplySummary:
         assert s.files_flagged == 0
         assert s.replacements_applied == 0
         assert s.errors == []
+        assert s.modified_paths == []
+        assert s.deleted_paths == []
+
+    def test_records_touched_paths(self, tmp_path: Path) -> None:
+        _write_file(tmp_path, "a.md", "old\n")
+        _write_file(tmp_path, "b.md", "keep\n")
+        _write_file(tmp_path, "gone.sh", "x\n")
+        summary = apply_replacements([
+            Replacement("a.md", 1, "old", "new"),
+            Replacement("b.md", 0, "", "", action="flag_for_review"),
+            Replacement("gone.sh", 0, "", "", action="delete_file"),
+        ], str(tmp_path))
+        assert summary.modified_paths == ["a.md"]
+        assert summary.deleted_paths == ["gone.sh"]
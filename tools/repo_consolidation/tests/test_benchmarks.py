@@ -0,0 +1,115 @@
+"""Tests for the synthetic-repository benchmark harness."""
+
+from __future__ import annotations
+
+import json
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from tools.repo_consolidation.benchmarks.memory import REPRESENTATIONS, measure_memory
+from tools.repo_consolidation.benchmarks.pipeline import (
+    STAGES,
+    compare_results,
+    main,
+    run_benchmark,
+)
+from tools.repo_consolidation.benchmarks.synthetic import (
+    SyntheticSpec,
+    generate_repo,
+)
+from tools.repo_consolidation.scanner import scan_repo
+
+SMALL = SyntheticSpec(files=30, min_lines=5, max_lines=40, files_per_project=10, seed=7)
+
+
+def _tree(root: Path) -> dict[str, bytes]:
+    return {
+        str(p.relative_to(root)): p.read_bytes()
+        for p in sorted(root.rglob("*"))
+        if p.is_file()
+    }
+
+
+class TestGenerateRepo:
+    def test_deterministic(self, tmp_path: Path) -> None:
+        generate_repo(tmp_path / "a", SMALL)
+        generate_repo(tmp_path / "b", SMALL)
+        assert _tree(tmp_path / "a") == _tree(tmp_path / "b")
+
+    def test_file_count_and_bytes(self, tmp_path: Path) -> None:
+        repo = generate_repo(tmp_path, SMALL)
+        files = _tree(tmp_path)
+        assert repo.files == len(files) == SMALL.files
+        assert repo.bytes == sum(len(b) for b in files.values())
+
+    def test_planted_hits_are_found(self, tmp_path: Path) -> None:
+        spec = SyntheticSpec(
+            files=40, min_lines=20, max_lines=60, seed=3,
+            hits_per_1k_lines={"old_url": 40, "credential": 10, "hardcoded_account_id": 10,
+                               "stale_docker_image": 10},
+        )
+        repo = generate_repo(tmp_path, spec)
+        found = Counter(f.issue_type for f in scan_repo(tmp_path))
+        assert dict(found) == {k: v for k, v in repo.planted.items() if v}
+
+    def test_go_modules(self, tmp_path: Path) -> None:
+        generate_repo(tmp_path, SyntheticSpec(files=20, files_per_project=10, go_module_fraction=1.0))
+        assert len(list(tmp_path.rglob("go.mod"))) == 2
+
+    def test_unknown_issue_type(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="unknown issue type"):
+            generate_repo(tmp_path, SyntheticSpec(hits_per_1k_lines={"bogus": 1.0}))
+
+
+class TestRunBenchmark:
+    def test_result_layout(self) -> None:
+        result = run_benchmark(SMALL, repeat=2)
+        assert set(result["stages"]) == set(STAGES)
+        assert all(len(s["runs"]) == 2 for s in result["stages"].values())
+        assert result["counts"]["files"] == SMALL.files
+        assert result["counts"]["remaining_issues"] == 0
+        json.dumps(result)
+
+
+def _result(counts: dict[str, int], **best: float) -> dict[str, object]:
+    return {
+        "spec": {},
+        "counts": counts,
+        "stages": {stage: {"best": best.get(stage, 1.0)} for stage in STAGES},
+    }
+
+
+class TestCompare:
+    def test_within_threshold(self) -> None:
+        lines, failed = compare_results(_result({"findings": 1}), _result({"findings": 1}, scan=1.05))
+        assert not failed
+        assert any(line.startswith("scan") for line in lines)
+
+    def test_regression(self) -> None:
+        lines, failed = compare_results(_result({"findings": 1}), _result({"findings": 1}, apply=1.5))
+        assert failed
+        assert any("apply" in line and "REGRESSION" in line for line in lines)
+
+    def test_count_mismatch_fails(self) -> None:
+        lines, failed = compare_results(_result({"findings": 1}), _result({"findings": 2}))
+        assert failed
+        assert "  findings: 1 -> 2" in lines
+
+    def test_main_exit_codes(self, tmp_path: Path) -> None:
+        base, slow = tmp_path / "base.json", tmp_path / "slow.json"
+        base.write_text(json.dumps(_result({})))
+        slow.write_text(json.dumps(_result({}, validate=2.0)))
+        assert main(["compare", str(base), str(base)]) == 0
+        assert main(["compare", str(base), str(slow)]) == 1
+        assert main(["compare", str(base), str(tmp_path / "missing.json")]) == 2
+
+
+class TestMemoryBenchmark:
+    def test_compact_representations_are_smaller(self, tmp_path: Path) -> None:
+        repo = generate_repo(tmp_path, SyntheticSpec(files=100, seed=7))
+        findings = scan_repo(repo.root, backend="walk")
+        sizes = measure_memory(repo.root, findings)
+        assert list(sizes) == list(REPRESENTATIONS)
+        assert sizes["table"] < sizes["slotted"] < sizes["dataclass"]
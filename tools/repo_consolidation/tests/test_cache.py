@@ -0,0 +1,145 @@
+"""Tests for the persistent incremental scan cache."""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from tools.repo_consolidation.cache import ScanCache, file_digest
+from tools.repo_consolidation.scanner import SCAN_PATTERNS, scan_repo, scan_version_key
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _make_repo(root: Path) -> None:
+    (root / "README.md").write_text(
+        "# Project\nhttps://github.com/DevCloudNinjas/Zomato-Clone\n",
+        encoding="utf-8",
+    )
+    (root / "deploy.yaml").write_text(
+        "image: 123456789012.dkr.ecr.us-east-1.amazonaws.com/app\n",
+        encoding="utf-8",
+    )
+    (root / "clean.txt").write_text("nothing here\n", encoding="utf-8")
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Push *path*'s mtime into the past so its cache entry is not racy."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    root.mkdir()
+    _make_repo(root)
+    for p in root.iterdir():
+        _age(p)
+    return root
+
+
+# ---------------------------------------------------------------------------
+# ScanCache with scan_repo
+# ---------------------------------------------------------------------------
+
+
+class TestScanRepoCache:
+    """scan_repo(cache=...) must return what an uncached scan returns."""
+
+    def test_results_match_uncached_scan(self, repo: Path, tmp_path: Path) -> None:
+        cache = ScanCache(tmp_path / "cache")
+        assert scan_repo(repo, cache=cache) == scan_repo(repo)
+        assert scan_repo(repo, cache=cache) == scan_repo(repo)
+
+    def test_repeat_scan_hits_every_file(self, repo: Path, tmp_path: Path) -> None:
+        scan_repo(repo, cache=ScanCache(tmp_path / "cache"))
+
+        cache = ScanCache(tmp_path / "cache")
+        scan_repo(repo, cache=cache)
+
+        assert cache.hits == 3
+        assert cache.misses == 0
+
+    def test_modified_file_is_rescanned(self, repo: Path, tmp_path: Path) -> None:
+        scan_repo(repo, cache=ScanCache(tmp_path / "cache"))
+        (repo / "clean.txt").write_text(
+            "now dirty: https://github.com/DevCloudNinjas/rode\n", encoding="utf-8",
+        )
+
+        cache = ScanCache(tmp_path / "cache")
+        findings = scan_repo(repo, cache=cache)
+
+        assert cache.misses == 1
+        assert any(f.file_path == "clean.txt" for f in findings)
+
+    def test_touched_file_with_same_content_is_a_hit(self, repo: Path, tmp_path: Path) -> None:
+        scan_repo(repo, cache=ScanCache(tmp_path / "cache"))
+        _age(repo / "README.md", seconds=30)
+
+        cache = ScanCache(tmp_path / "cache")
+        scan_repo(repo, cache=cache)
+
+        assert cache.misses == 0
+
+    def test_pattern_change_invalidates(self, repo: Path, tmp_path: Path) -> None:
+        scan_repo(repo, cache=ScanCache(tmp_path / "cache"))
+
+        cache = ScanCache(tmp_path / "cache")
+        custom = {"custom": re.compile("nothing")}
+        findings = scan_repo(repo, custom, cache=cache)
+
+        assert cache.hits == 0
+        assert [f.issue_type for f in findings] == ["custom"]
+
+    def test_deleted_file_is_pruned(self, repo: Path, tmp_path: Path) -> None:
+        scan_repo(repo, cache=ScanCache(tmp_path / "cache"))
+        (repo / "deploy.yaml").unlink()
+
+        cache = ScanCache(tmp_path / "cache")
+        scan_repo(repo, cache=cache)
+        assert "deploy.yaml" not in cache.path.read_text(encoding="utf-8")
+
+    def test_parallel_scan_fills_cache(self, repo: Path, tmp_path: Path) -> None:
+        expected = scan_repo(repo)
+        assert scan_repo(repo, jobs=2, cache=ScanCache(tmp_path / "cache")) == expected
+
+        cache = ScanCache(tmp_path / "cache")
+        assert scan_repo(repo, jobs=2, cache=cache) == expected
+        assert cache.misses == 0
+
+    def test_default_cache_dir_is_not_scanned(self, repo: Path) -> None:
+        cache = ScanCache(repo / ".cache" / "repo_consolidation")
+        first = scan_repo(repo, cache=cache)
+        assert cache.path.exists()
+        assert scan_repo(repo) == first
+
+
+class TestScanCacheFile:
+    """Robustness of the cache file itself."""
+
+    def test_corrupt_cache_is_ignored(self, repo: Path, tmp_path: Path) -> None:
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "scan-cache.json").write_text("{not json", encoding="utf-8")
+
+        cache = ScanCache(cache_dir)
+        assert scan_repo(repo, cache=cache) == scan_repo(repo)
+        assert cache.hits == 0
+
+    def test_version_key_depends_on_patterns(self) -> None:
+        custom = {"custom": re.compile("x")}
+        assert scan_version_key(SCAN_PATTERNS) != scan_version_key(custom)
+        assert scan_version_key(SCAN_PATTERNS) == scan_version_key(dict(SCAN_PATTERNS))
+
+    def test_file_digest(self, tmp_path: Path) -> None:
+        f = tmp_path / "f.txt"
+        f.write_bytes(b"abc")
+        assert file_digest(f) == (
+            "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+        )
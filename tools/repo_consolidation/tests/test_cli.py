@@ -6,6 +6,8 @@ together: scan → classify → fix → apply → validate → report.
 
 from __future__ import annotations
 
+import json
+import logging
 import os
 from pathlib import Path
 from unittest.mock import patch
@@ -13,6 +15,8 @@ from unittest.mock import patch
 import pytest
 
 from tools.repo_consolidation.cli import main
+from tools.repo_consolidation.url_map import use_url_map
+from tools.repo_consolidation.watch import PollingWatcher, WatchState
 
 
 @pytest.fixture()
@@ -74,6 +78,17 @@ class TestMainPipelineStages:
             mock_rpt.assert_called_once()
 
 
+class TestBrokenLinks:
+    """Broken relative links are reported but do not fail the run."""
+
+    def test_exit_code_unaffected(self, empty_repo: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        (empty_repo / "README.md").write_text("[gone](missing.md)\n", encoding="utf-8")
+        assert main([str(empty_repo), "--no-cache"]) == 0
+        out = capsys.readouterr().out
+        assert "Broken relative paths:   1" in out
+        assert "Line 1: missing.md" in out
+
+
 class TestReportOutput:
     """Verify --report-output writes the report to a file."""
 
@@ -91,6 +106,154 @@ class TestReportOutput:
         assert "Remediation Report" in captured.out
 
 
+class TestReportFormat:
+    """--report-format streams a machine-readable report instead of the text one."""
+
+    def test_sarif_written_to_file(
+        self, mini_repo: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        report_file = tmp_path / "out" / "report.sarif"
+        main([
+            str(mini_repo), "--dry-run", "--no-cache",
+            "--report-format", "sarif", "--report-output", str(report_file),
+        ])
+        log = json.loads(report_file.read_text(encoding="utf-8"))
+        assert [r["ruleId"] for r in log["runs"][0]["results"]] == ["old_url"]
+        assert "Remediation Report" not in capsys.readouterr().out
+
+    def test_junit_to_stdout(self, empty_repo: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        assert main([str(empty_repo), "--report-format", "junit"]) == 0
+        assert capsys.readouterr().out.startswith('<?xml version="1.0"')
+
+    def test_rejected_with_jsonl_format(self, empty_repo: Path) -> None:
+        with pytest.raises(SystemExit):
+            main([str(empty_repo), "--format", "jsonl", "--report-format", "sarif"])
+
+
+class TestPlanApply:
+    """The plan and apply subcommands split one run into review and apply."""
+
+    def test_plan_then_apply_scans_once(
+        self, mini_repo: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        plan_file = tmp_path / "plans" / "plan.jsonl"
+        readme = mini_repo / "README.md"
+        original = readme.read_text(encoding="utf-8")
+
+        assert main(["plan", str(mini_repo), "--no-cache", "--output", str(plan_file)]) == 0
+        assert readme.read_text(encoding="utf-8") == original
+        assert "  2: - See https://github.com/DevCloudNinjas/Zomato-Clone" in capsys.readouterr().out
+
+        with patch("tools.repo_consolidation.cli.scan_repo") as mock_scan:
+            assert main(["apply", str(plan_file)]) == 0
+            mock_scan.assert_not_called()
+        assert "Zomato-Clone for details" not in readme.read_text(encoding="utf-8")
+
+    def test_apply_refuses_changed_file(self, mini_repo: Path, tmp_path: Path) -> None:
+        plan_file = tmp_path / "plan.jsonl"
+        main(["plan", str(mini_repo), "--no-cache", "-o", str(plan_file)])
+        readme = mini_repo / "README.md"
+        readme.write_text(readme.read_text(encoding="utf-8") + "more\n", encoding="utf-8")
+
+        assert main(["apply", str(plan_file)]) == 1
+        assert "Zomato-Clone for details" in readme.read_text(encoding="utf-8")
+
+    def test_apply_validate_prints_report(
+        self, mini_repo: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        plan_file = tmp_path / "plan.jsonl"
+        main(["plan", str(mini_repo), "--no-cache", "-o", str(plan_file)])
+
+        assert main(["apply", str(plan_file), "--validate"]) == 0
+        out = capsys.readouterr().out
+        assert "Remediation Report" in out
+        assert "Remaining issues:        0" in out
+
+    def test_apply_missing_plan(self, tmp_path: Path) -> None:
+        assert main(["apply", str(tmp_path / "missing.jsonl")]) == 1
+
+
+class TestWatch:
+    """The watch subcommand prints findings, then updates until interrupted."""
+
+    def test_prints_updates(
+        self, mini_repo: Path, capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        readme = mini_repo / "README.md"
+
+        class _Watcher:
+            calls = 0
+
+            def wait(self, timeout: float | None = None) -> set[str]:
+                self.calls += 1
+                if self.calls > 1:
+                    raise KeyboardInterrupt
+                readme.write_text("Nothing left.\n", encoding="utf-8")
+                return {"README.md"}
+
+            def close(self) -> None:
+                pass
+
+        with patch("tools.repo_consolidation.cli.open_watcher", return_value=_Watcher()):
+            assert main(["watch", str(mini_repo), "--discovery", "walk"]) == 0
+        out = capsys.readouterr().out
+        assert "README.md: 1 finding(s)" in out
+        assert out.rstrip().endswith("README.md: clean")
+
+    def test_edit_during_initial_scan_is_reported(
+        self, mini_repo: Path, capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        readme = mini_repo / "README.md"
+        load, wait = WatchState.load, PollingWatcher.wait
+        waits: list[set[str] | None] = []
+
+        def load_then_edit(state: WatchState) -> list[object]:
+            findings = load(state)
+            readme.write_text("Nothing left, and a different size.\n", encoding="utf-8")
+            return findings
+
+        def wait_once(watcher: PollingWatcher, timeout: float | None = None) -> set[str] | None:
+            if waits:
+                raise KeyboardInterrupt
+            waits.append(wait(watcher, timeout))
+            return waits[-1]
+
+        with patch.object(WatchState, "load", load_then_edit), \
+                patch.object(PollingWatcher, "wait", wait_once):
+            assert main([
+                "watch", str(mini_repo), "--discovery", "walk",
+                "--backend", "poll", "--interval", "0",
+            ]) == 0
+        assert waits == [{"README.md"}]
+        assert capsys.readouterr().out.rstrip().endswith("README.md: clean")
+
+    def test_missing_repo_root(self, tmp_path: Path) -> None:
+        assert main(["watch", str(tmp_path / "missing")]) == 1
+
+
+class TestUrlMapFlag:
+    """--url-map replaces the built-in map for the run."""
+
+    @pytest.fixture(autouse=True)
+    def _restore(self):
+        yield
+        use_url_map(None)
+
+    def test_custom_map(self, mini_repo: Path, tmp_path: Path) -> None:
+        url_map = tmp_path / "map.csv"
+        url_map.write_text("Zomato-Clone,learning/zomato\n", encoding="utf-8")
+        assert main([str(mini_repo), "--no-cache", "--url-map", str(url_map)]) == 0
+        assert "DevOps-Projects/tree/main/learning/zomato" in (
+            mini_repo / "README.md"
+        ).read_text(encoding="utf-8")
+
+    def test_bad_map(self, mini_repo: Path, tmp_path: Path) -> None:
+        url_map = tmp_path / "map.json"
+        url_map.write_text("[]", encoding="utf-8")
+        assert main([str(mini_repo), "--url-map", str(url_map)]) == 1
+        assert main(["plan", str(mini_repo), "--url-map", str(tmp_path / "missing.csv")]) == 1
+
+
 class TestVerboseFlag:
     """Verify --verbose enables debug logging."""
 
@@ -107,7 +270,7 @@ class TestErrorHandling:
     def test_fixer_exception_is_caught(self, mini_repo: Path) -> None:
         """If a fixer raises, the pipeline should log and continue."""
         with patch(
-            "tools.repo_consolidation.cli.fix_old_url",
+            "tools.repo_consolidation.cli.fix_old_urls",
             side_effect=RuntimeError("boom"),
         ):
             # Should not raise — errors are caught per-finding
@@ -121,3 +284,200 @@ class TestErrorHandling:
             side_effect=RuntimeError("scan failed"),
         ):
             assert main([str(empty_repo)]) == 1
+
+
+class TestJobsFlag:
+    """Verify --jobs is forwarded to the scan and validation stages."""
+
+    def test_jobs_forwarded(self, empty_repo: Path) -> None:
+        with patch("tools.repo_consolidation.cli.scan_repo", return_value=[]) as mock_scan, \
+                patch("tools.repo_consolidation.cli.validate_fixes") as mock_val:
+            from tools.repo_consolidation.models import ValidationReport
+            mock_val.return_value = ValidationReport()
+            main([str(empty_repo), "--jobs", "3"])
+            assert mock_scan.call_args.kwargs["jobs"] == 3
+            assert mock_val.call_args.kwargs["jobs"] == 3
+
+    def test_parallel_run_matches_serial_report(
+        self, mini_repo: Path, capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        main([str(mini_repo), "--dry-run", "--no-cache"])
+        serial = capsys.readouterr().out
+        main([str(mini_repo), "--dry-run", "--no-cache", "--jobs", "2"])
+        assert capsys.readouterr().out == serial
+
+
+class TestPipelineFlag:
+    """--pipeline overlaps the stages without changing the outcome."""
+
+    def test_matches_sequential_run(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        reports = []
+        for name, extra in (("seq", []), ("pipe", ["--pipeline", "--queue-size", "1"])):
+            repo = tmp_path / name
+            repo.mkdir()
+            for i in range(3):
+                (repo / f"doc{i}.md").write_text(
+                    f"# Doc {i}\nSee https://github.com/DevCloudNinjas/Zomato-Clone ({i})\n",
+                    encoding="utf-8",
+                )
+            assert main([str(repo), "--no-cache", *extra]) == 0
+            reports.append(capsys.readouterr().out)
+            assert "Zomato-Clone (" not in (repo / "doc2.md").read_text(encoding="utf-8")
+        assert reports[0] == reports[1]
+
+
+class TestApplyJobsFlag:
+    """Verify --apply-jobs and --fsync reach the apply stage."""
+
+    def test_forwarded(self, mini_repo: Path) -> None:
+        with patch("tools.repo_consolidation.cli.apply_file_edits") as mock_apply:
+            from tools.repo_consolidation.applier import ApplySummary
+            mock_apply.return_value = ApplySummary()
+            main([str(mini_repo), "--apply-jobs", "4", "--fsync"])
+        assert mock_apply.call_args.kwargs["jobs"] == 4
+        assert mock_apply.call_args.kwargs["fsync"] is True
+
+    def test_jsonl_applies_on_thread_pool(
+        self, mini_repo: Path, capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        assert main([str(mini_repo), "--format", "jsonl", "--apply-jobs", "2"]) == 0
+        summary = json.loads(capsys.readouterr().out.splitlines()[-1])
+        assert summary["files_modified"] == 1
+        assert "Zomato-Clone" not in (mini_repo / "README.md").read_text(encoding="utf-8")
+
+    @pytest.mark.parametrize("mode", [[], ["--format", "jsonl"], ["--pipeline"]])
+    def test_negative_means_default(
+        self, mini_repo: Path, mode: list[str], caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        # Two files to fix, so the apply stage does use a thread pool.
+        (mini_repo / "OTHER.md").write_text(
+            "https://github.com/DevCloudNinjas/Zomato-Clone\n", encoding="utf-8",
+        )
+        assert main([str(mini_repo), "--dry-run", "--apply-jobs", "-2", *mode]) == 1
+        assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
+        assert "Zomato-Clone" in (mini_repo / "README.md").read_text(encoding="utf-8")
+
+
+class TestFullValidateFlag:
+    """Verify validation is incremental unless --full-validate is given."""
+
+    def _validate_kwargs(self, repo: Path, *extra: str) -> dict[str, object]:
+        with patch("tools.repo_consolidation.cli.validate_fixes") as mock_val:
+            from tools.repo_consolidation.models import ValidationReport
+            mock_val.return_value = ValidationReport()
+            main([str(repo), "--no-cache", *extra])
+        return mock_val.call_args.kwargs
+
+    def test_incremental_by_default(self, mini_repo: Path) -> None:
+        kwargs = self._validate_kwargs(mini_repo)
+        assert kwargs["touched"] == ["README.md"]
+        assert [f.file_path for f in kwargs["initial_findings"]] == ["README.md"]
+        assert kwargs["manifest"].counts_by_type() == {".md": 1}
+
+    def test_full_validate(self, mini_repo: Path) -> None:
+        kwargs = self._validate_kwargs(mini_repo, "--full-validate")
+        assert "touched" not in kwargs
+        assert "initial_findings" not in kwargs
+
+
+class TestScanCacheFlags:
+    """Verify the scan cache is on by default and can be disabled."""
+
+    def test_cache_written_by_default(self, mini_repo: Path) -> None:
+        main([str(mini_repo), "--dry-run"])
+        assert (mini_repo / ".cache" / "repo_consolidation" / "scan-cache.json").exists()
+
+    def test_no_cache_writes_nothing(self, mini_repo: Path) -> None:
+        main([str(mini_repo), "--dry-run", "--no-cache"])
+        assert not (mini_repo / ".cache").exists()
+
+    def test_custom_cache_dir(
+        self, mini_repo: Path, tmp_path_factory: pytest.TempPathFactory,
+    ) -> None:
+        cache_dir = tmp_path_factory.mktemp("elsewhere")
+        main([str(mini_repo), "--dry-run", "--cache-dir", str(cache_dir)])
+        assert (cache_dir / "scan-cache.json").exists()
+
+
+class TestDiscoveryFlags:
+    """Verify discovery options reach the scanner."""
+
+    def test_changed_since_outside_git_returns_1(self, mini_repo: Path) -> None:
+        assert main([str(mini_repo), "--dry-run", "--changed-since", "HEAD"]) == 1
+
+    def test_no_dedup_flag(self, mini_repo: Path) -> None:
+        with patch("tools.repo_consolidation.cli.scan_repo", return_value=[]) as mock_scan:
+            main([str(mini_repo), "--dry-run", "--no-dedup"])
+        assert mock_scan.call_args.kwargs["dedup"] is False
+
+    def test_walk_backend(self, mini_repo: Path) -> None:
+        assert main([str(mini_repo), "--dry-run", "--discovery", "walk"]) in (0, 1)
+
+
+class TestProfileFlag:
+    """Verify --profile writes a summary and a Chrome trace."""
+
+    def test_writes_profile(self, mini_repo: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        out = tmp_path_factory.mktemp("profile")
+        main([str(mini_repo), "--profile", str(out)])
+        summary = json.loads((out / "profile.json").read_text(encoding="utf-8"))
+        assert list(summary["stages"]) == ["scan", "fix", "apply", "validate", "report"]
+        assert summary["fixers"]["old_url"]["calls"] == 1
+        assert summary["slowest_files"][0]["path"] == "README.md"
+        trace = json.loads((out / "trace.json").read_text(encoding="utf-8"))
+        assert {e["cat"] for e in trace["traceEvents"]} >= {"stage", "file", "fix"}
+
+    def test_jsonl_stages(self, mini_repo: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        out = tmp_path_factory.mktemp("profile")
+        main([str(mini_repo), "--dry-run", "--format", "jsonl", "--profile", str(out)])
+        summary = json.loads((out / "profile.json").read_text(encoding="utf-8"))
+        assert list(summary["stages"]) == ["remediate", "validate"]
+
+
+class TestJsonlFormat:
+    """Verify --format jsonl streams typed records."""
+
+    def _records(self, path: Path) -> list[dict[str, object]]:
+        return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+    def test_record_types(self, mini_repo: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        out = tmp_path_factory.mktemp("out") / "findings.jsonl"
+        main([str(mini_repo), "--dry-run", "--format", "jsonl", "--report-output", str(out)])
+        records = self._records(out)
+        types = [r["type"] for r in records]
+        assert types[0] == "finding"
+        assert "replacement" in types
+        assert "remaining" in types
+        assert types[-1] == "summary"
+        assert records[0]["file_path"] == "README.md"
+        assert records[-1]["findings"] == types.count("finding")
+
+    def test_dry_run_does_not_modify_files(self, mini_repo: Path) -> None:
+        readme = mini_repo / "README.md"
+        original = readme.read_text(encoding="utf-8")
+        main([str(mini_repo), "--dry-run", "--format", "jsonl"])
+        assert readme.read_text(encoding="utf-8") == original
+
+    def test_applies_replacements(self, mini_repo: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        assert main([str(mini_repo), "--format", "jsonl"]) == 0
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        summary = records[-1]
+        assert summary["type"] == "summary"
+        assert summary["files_modified"] == 1
+        assert summary["remaining_issues"] == 0
+        assert "Zomato-Clone" not in (mini_repo / "README.md").read_text(encoding="utf-8")
+
+    def test_broken_link_records(self, mini_repo: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        (mini_repo / "docs.md").write_text("[gone](missing.md)\n", encoding="utf-8")
+        main([str(mini_repo), "--dry-run", "--format", "jsonl", "--no-cache"])
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        broken = [r for r in records if r["type"] == "broken_link"]
+        assert broken == [{
+            "type": "broken_link", "file_path": "docs.md", "line_number": 1, "target": "missing.md",
+        }]
+        assert records[-1]["broken_relative_paths"] == 1
+
+    def test_text_report_not_printed(self, empty_repo: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        assert main([str(empty_repo), "--format", "jsonl"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line)["type"] for line in lines] == ["summary"]
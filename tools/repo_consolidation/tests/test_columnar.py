@@ -0,0 +1,88 @@
+"""Tests for the columnar finding table and the slotted finding models."""
+
+from __future__ import annotations
+
+import pickle
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from tools.repo_consolidation.columnar import FindingTable
+from tools.repo_consolidation.models import Finding, Replacement
+from tools.repo_consolidation.scanner import scan_repo
+
+OLD_URL = "https://github.com/DevCloudNinjas/Zomato-Clone"
+
+
+def _repo(root: Path) -> Path:
+    (root / "docs").mkdir()
+    (root / "docs" / "README.md").write_text(
+        f"# Title\nSee {OLD_URL} and {OLD_URL}.git\nplain\r\nclone {OLD_URL}\n"
+    )
+    (root / "latin.md").write_bytes(f"caf\xe9 {OLD_URL}\n".encode("latin-1"))
+    (root / "deploy.pem").write_text("key\n")
+    return root
+
+
+class TestSlottedModels:
+    """Finding and Replacement are slotted and intern their repeated strings."""
+
+    def test_no_instance_dict(self) -> None:
+        finding = Finding("a.md", 1, "x", "old_url", "Repo", "x", ".md")
+        assert not hasattr(finding, "__dict__")
+        assert not hasattr(Replacement("a.md", 1, "x", "y"), "__dict__")
+
+    def test_strings_are_interned(self) -> None:
+        path = "".join(["docs/", "README.md"])
+        other = "".join(["docs/", "README.md"])
+        finding = Finding.from_dict({
+            "file_path": path, "line_number": 1, "matched_text": "x",
+            "issue_type": "old_url", "old_repo_name": "Repo", "context": "x",
+            "file_type": ".md",
+        })
+        assert Replacement(other, 1, "x", "y").file_path is finding.file_path
+
+    def test_pickle_round_trip_interns(self) -> None:
+        finding = Finding("docs/a.md", 3, "x", "old_url", "Repo", "ctx", ".md")
+        copy = pickle.loads(pickle.dumps(finding))
+        assert copy == finding
+        assert copy.file_path is finding.file_path
+        assert replace(copy, context="new").context == "new"
+
+
+class TestFindingTable:
+    """FindingTable stores findings column by column and rebuilds them on access."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        findings = scan_repo(_repo(tmp_path), backend="walk")
+        table = FindingTable.from_findings(tmp_path, findings)
+
+        assert len(table) == len(findings) == 5
+        assert table.to_findings() == findings
+        assert table[-1] == findings[-1]
+        assert table.context(1) == findings[1].context
+
+    def test_contexts_are_not_stored(self, tmp_path: Path) -> None:
+        findings = scan_repo(_repo(tmp_path), backend="walk")
+        table = FindingTable.from_findings(tmp_path, findings)
+
+        # Only the line-0 filename finding has no line to point at.
+        assert list(table._inline.values()) == ["Private key file: deploy.pem"]
+
+    def test_rewritten_context_is_kept_inline(self, tmp_path: Path) -> None:
+        findings = scan_repo(_repo(tmp_path), backend="walk")
+        edited = [replace(f, context="rewritten") if f.line_number == 4 else f for f in findings]
+
+        table = FindingTable.from_findings(tmp_path, edited)
+
+        assert table.to_findings() == edited
+
+    def test_append_and_index_errors(self, tmp_path: Path) -> None:
+        finding = scan_repo(_repo(tmp_path), backend="walk")[0]
+        table = FindingTable(tmp_path)
+        table.append(finding)
+
+        assert list(table) == [finding]
+        with pytest.raises(IndexError):
+            table[1]
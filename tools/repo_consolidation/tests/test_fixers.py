@@ -9,7 +9,9 @@ from pathlib import Path
 import pytest
 
 from tools.repo_consolidation.fixers import fix_account_id, fix_docker_image, fix_old_url
-from tools.repo_consolidation.models import Finding
+from tools.repo_consolidation.manifest import PathIndex
+from tools.repo_consolidation.models import FileEdits, Finding
+from tools.repo_consolidation.url_map import CONSOLIDATED_TREE_URL, UrlIndex, use_url_map
 
 
 # ---------------------------------------------------------------------------
@@ -78,6 +80,38 @@ class TestFixOldUrlBasic:
         assert result.action == "replace"
 
 
+class TestFixOldUrlSubpathRoutes:
+    """Subpath routes of the URL map redirect moved subdirectories."""
+
+    @pytest.fixture(autouse=True)
+    def _routed_map(self):
+        use_url_map(UrlIndex([
+            ("Zomato-Clone", "project-13-zomato-clone-devsecops"),
+            ("Zomato-Clone/docs", "learning/zomato-docs"),
+        ]))
+        yield
+        use_url_map(None)
+
+    def test_markdown_link_follows_route(self):
+        context = "[Setup](https://github.com/DevCloudNinjas/Zomato-Clone/blob/main/docs/setup.md)"
+        finding = _make_finding(file_path="learning/README.md", context=context)
+        result = fix_old_url(finding)
+        assert result is not None
+        assert "[Setup](zomato-docs/setup.md)" in result.new_text
+
+    def test_raw_url_follows_route(self):
+        context = "See https://github.com/DevCloudNinjas/Zomato-Clone/tree/main/docs/api"
+        result = fix_old_url(_make_finding(context=context))
+        assert result is not None
+        assert result.new_text == f"See {CONSOLIDATED_TREE_URL}/learning/zomato-docs/api"
+
+    def test_unrouted_subpath_keeps_repo_destination(self):
+        context = "See https://github.com/DevCloudNinjas/Zomato-Clone/tree/main/src"
+        result = fix_old_url(_make_finding(context=context))
+        assert result is not None
+        assert result.new_text == f"See {CONSOLIDATED_TREE_URL}/project-13-zomato-clone-devsecops/src"
+
+
 # ---------------------------------------------------------------------------
 # Tests: markdown links
 # ---------------------------------------------------------------------------
@@ -130,6 +164,17 @@ class TestFixOldUrlMarkdownLinks:
         # Same directory → should be just "."
         assert "[Clone](.)" in result.new_text
 
+    def test_only_links_to_finding_repo_are_rewritten(self):
+        context = (
+            "[A](https://github.com/DevCloudNinjas/Zomato-Clone) "
+            "[B](https://github.com/DevCloudNinjas/Zomato-Clone-Extras)"
+        )
+        finding = _make_finding(file_path="README.md", context=context)
+        result = fix_old_url(finding)
+        assert result is not None
+        assert "[A](project-13-zomato-clone-devsecops)" in result.new_text
+        assert "[B](https://github.com/DevCloudNinjas/Zomato-Clone-Extras)" in result.new_text
+
 
 # ---------------------------------------------------------------------------
 # Tests: git clone URLs
@@ -190,6 +235,21 @@ class TestFixOldUrlGoImports:
         assert result is not None
         assert "github.com/DevCloudNinjas/DevOps-Projects/learning/devops-bootcamp" in result.new_text
 
+    def test_go_import_keeps_surrounding_text(self):
+        context = 'import util "github.com/devcloudninjas/devops-bootcamp/pkg/util" // v1'
+        finding = _make_finding(
+            file_path="learning/devops-bootcamp/main.go",
+            context=context,
+            old_repo_name="devops-bootcamp",
+            file_type=".go",
+        )
+        result = fix_old_url(finding)
+        assert result is not None
+        assert result.new_text == (
+            'import util "github.com/DevCloudNinjas/DevOps-Projects/'
+            'learning/devops-bootcamp/pkg/util" // v1'
+        )
+
 
 # ---------------------------------------------------------------------------
 # Tests: JSON metadata fields
@@ -301,6 +361,32 @@ class TestFixOldUrlTargetVerification:
         assert result.comment is None
 
 
+    def test_path_index_hit_skips_the_disk(self, monkeypatch):
+        finding = _make_finding(
+            context="See https://github.com/DevCloudNinjas/Zomato-Clone/blob/main/docs/a.md",
+        )
+        index = PathIndex(["project-13-zomato-clone-devsecops/docs/a.md"])
+
+        def no_disk(path):
+            raise AssertionError(f"disk checked for {path}")
+
+        monkeypatch.setattr(os.path, "exists", no_disk)
+        result = fix_old_url(finding, repo_root="/nonexistent", path_index=index)
+        assert result is not None
+        assert result.comment is None
+
+    def test_path_index_miss_is_confirmed_on_disk(self):
+        finding = _make_finding(
+            context="See https://github.com/DevCloudNinjas/Zomato-Clone for details",
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # An empty directory: on disk, but not in a file-based index.
+            (Path(tmpdir) / "project-13-zomato-clone-devsecops").mkdir()
+            result = fix_old_url(finding, repo_root=tmpdir, path_index=PathIndex())
+        assert result is not None
+        assert result.comment is None
+
+
 # ---------------------------------------------------------------------------
 # Tests: case-insensitive org matching
 # ---------------------------------------------------------------------------
@@ -739,7 +825,8 @@ class TestFixDockerImageStandalone:
 # Go module fixer tests
 # ---------------------------------------------------------------------------
 
-from tools.repo_consolidation.fixers import fix_go_module
+from tools.repo_consolidation.fixers import fix_go_module, fix_go_modules
+from tools.repo_consolidation.go_index import GoModuleIndex
 
 
 def _make_gomod_finding(
@@ -992,3 +1079,169 @@ class TestFixGoModuleExampleTestGo:
             gomod_replacements = [r for r in result if r.file_path.endswith("go.mod")]
             assert len(gomod_replacements) >= 1
             assert "DevOps-Projects/learning/devops-bootcamp" in gomod_replacements[0].new_text
+
+
+class TestGoModuleIndex:
+    """Verify the shared Go module index and batch resolution."""
+
+    @staticmethod
+    def _write_module(root: Path) -> Path:
+        module = root / "learning" / "devops-bootcamp"
+        (module / "cmd").mkdir(parents=True)
+        (module / "go.mod").write_text(
+            "module github.com/devcloudninjas/devops-bootcamp\n\ngo 1.19\n"
+        )
+        (module / "cmd" / "main.go").write_text(
+            'package main\n\nimport (\n\t"fmt"\n\n'
+            '\t"github.com/devcloudninjas/devops-bootcamp/internal/util"\n'
+            ')\n\nfunc main() { fmt.Println(util.Name) }\n'
+        )
+        return module
+
+    def test_records_reference_lines(self, tmp_path: Path) -> None:
+        self._write_module(tmp_path)
+        index = GoModuleIndex(str(tmp_path))
+
+        source = index.source("learning/devops-bootcamp/cmd/main.go")
+        assert source.reference_lines == [6]
+        assert index.source("missing.go") is None
+
+    def test_nested_directory_answered_from_parent_walk(self, tmp_path: Path) -> None:
+        self._write_module(tmp_path)
+        index = GoModuleIndex(str(tmp_path))
+        assert index.go_files("learning") == ["learning/devops-bootcamp/cmd/main.go"]
+        assert index.go_files("learning/devops-bootcamp/cmd") == [
+            "learning/devops-bootcamp/cmd/main.go",
+        ]
+        assert list(index._walked) == ["learning"]
+
+    def test_duplicate_findings_yield_one_replacement_per_line(self, tmp_path: Path) -> None:
+        self._write_module(tmp_path)
+        finding = _make_gomod_finding(
+            file_path="learning/devops-bootcamp/go.mod",
+            context="module github.com/devcloudninjas/devops-bootcamp",
+        )
+        result = fix_go_modules([finding, finding], repo_root=str(tmp_path))
+
+        keys = [(r.file_path, r.line_number) for r in result]
+        assert keys == [
+            ("learning/devops-bootcamp/go.mod", 1),
+            ("learning/devops-bootcamp/cmd/main.go", 6),
+        ]
+
+    def test_shared_index_reads_each_file_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        self._write_module(tmp_path)
+        index = GoModuleIndex(str(tmp_path))
+        opened: list[str] = []
+        real_open = open
+
+        def counting_open(path, *args, **kwargs):
+            opened.append(os.fspath(path))
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr("builtins.open", counting_open)
+        finding = _make_gomod_finding(
+            file_path="learning/devops-bootcamp/go.mod",
+            context="module github.com/devcloudninjas/devops-bootcamp",
+        )
+        first = fix_go_module(finding, repo_root=str(tmp_path), index=index)
+        second = fix_go_module(finding, repo_root=str(tmp_path), index=index)
+
+        assert first == second
+        assert len(opened) == 2
+
+
+# ---------------------------------------------------------------------------
+# Per-file batch fixer tests
+# ---------------------------------------------------------------------------
+
+from tools.repo_consolidation.fixers import default_fixers, fix_file, fix_old_urls
+
+
+class TestFileEdits:
+    """Verify line changes are stored as minimal spans."""
+
+    def test_span_covers_changed_middle(self):
+        edits = FileEdits(file_path="a.md")
+        edits.add_line(3, "see old-url here", "see new-path here")
+        span = edits.spans[0]
+        assert (span.line_number, span.start, span.end) == (3, 4, 11)
+        assert (span.old_text, span.new_text) == ("old-url", "new-path")
+
+    def test_to_replacements_rebuilds_lines(self):
+        edits = FileEdits(file_path="a.md")
+        edits.add_line(2, "b old", "b new", "# note")
+        edits.add_line(1, "a", "a")
+        replacements = edits.to_replacements()
+        assert [(r.line_number, r.new_text, r.comment) for r in replacements] == [
+            (1, "a", None),
+            (2, "b new", "# note"),
+        ]
+
+
+class TestFixFile:
+    """Verify fix_file merges every finding on a line into one edit."""
+
+    def test_two_issue_types_on_one_line_both_fixed(self, tmp_path: Path):
+        (tmp_path / "project-13-zomato-clone-devsecops").mkdir()
+        line = "image: 123456789012.dkr.ecr.us-east-1.amazonaws.com/app https://github.com/DevCloudNinjas/Zomato-Clone"
+        findings = [
+            _make_finding(context=line, line_number=4),
+            _make_finding(
+                context=line,
+                line_number=4,
+                issue_type="hardcoded_account_id",
+                matched_text="123456789012",
+                old_repo_name="",
+            ),
+        ]
+        edits = fix_file(findings, default_fixers(str(tmp_path)))
+
+        [replacement] = edits.to_replacements()
+        assert "<AWS_ACCOUNT_ID>" in replacement.new_text
+        assert "DevCloudNinjas/Zomato-Clone" not in replacement.new_text
+        assert replacement.comment == "# Replace <AWS_ACCOUNT_ID> with your AWS account ID"
+
+    def test_classifier_runs_once_per_line(self, monkeypatch: pytest.MonkeyPatch):
+        from tools.repo_consolidation import fixers
+
+        calls: list[str] = []
+        real = fixers._classify_context
+
+        def counting(context_line, file_type):
+            calls.append(context_line)
+            return real(context_line, file_type)
+
+        monkeypatch.setattr(fixers, "_classify_context", counting)
+        line = "See https://github.com/DevCloudNinjas/Zomato-Clone and https://github.com/DevCloudNinjas/DevOps-Project-01"
+        findings = [
+            _make_finding(context=line),
+            _make_finding(context=line, old_repo_name="DevOps-Project-01"),
+        ]
+        replacement = fix_old_urls(findings)
+
+        assert len(calls) == 1
+        assert "Zomato-Clone" not in replacement.new_text
+        assert "DevCloudNinjas/DevOps-Project-01" not in replacement.new_text
+
+    def test_failing_fixer_skips_only_its_group(self):
+        line = "image: 123456789012.dkr.ecr.us-east-1.amazonaws.com/app"
+
+        def boom(findings):
+            raise RuntimeError("boom")
+
+        findings = [
+            _make_finding(context="see https://github.com/DevCloudNinjas/Zomato-Clone", line_number=1),
+            _make_finding(
+                context=line,
+                line_number=2,
+                issue_type="hardcoded_account_id",
+                matched_text="123456789012",
+                old_repo_name="",
+            ),
+        ]
+        fixers = dict(default_fixers(), old_url=boom)
+        replacements = fix_file(findings, fixers).to_replacements()
+        assert [r.line_number for r in replacements] == [2]
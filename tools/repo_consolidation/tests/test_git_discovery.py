@@ -0,0 +1,164 @@
+"""Tests for git-index-driven file discovery."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from tools.repo_consolidation import git_discovery
+from tools.repo_consolidation.scanner import discover_files, scan_repo
+
+
+def _run(cmd: list[str], cwd: Path) -> None:
+    subprocess.run(cmd, cwd=cwd, check=True, capture_output=True, text=True)
+
+
+@pytest.fixture()
+def git_repo(tmp_path: Path) -> Path:
+    _run(["git", "init"], tmp_path)
+    _run(["git", "config", "user.email", "test@example.com"], tmp_path)
+    _run(["git", "config", "user.name", "Test User"], tmp_path)
+    return tmp_path
+
+
+def _commit_all(repo: Path, message: str = "test") -> None:
+    _run(["git", "add", "-A"], repo)
+    _run(["git", "commit", "-m", message], repo)
+
+
+def _names(root: Path, **kwargs: object) -> set[str]:
+    return {p.relative_to(root.resolve()).as_posix() for p in discover_files(root, **kwargs)}
+
+
+# ---------------------------------------------------------------------------
+# Backend selection
+# ---------------------------------------------------------------------------
+
+
+class TestBackendSelection:
+    """auto picks git inside a checkout and the walker elsewhere."""
+
+    def test_is_git_checkout(self, git_repo: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        assert git_discovery.is_git_checkout(git_repo)
+        assert not git_discovery.is_git_checkout(tmp_path_factory.mktemp("plain"))
+
+    def test_auto_uses_walker_outside_git(self, tmp_path_factory: pytest.TempPathFactory) -> None:
+        plain = tmp_path_factory.mktemp("plain")
+        (plain / "a.md").write_text("# a")
+        with patch.object(git_discovery, "list_files") as mock_list:
+            assert _names(plain) == {"a.md"}
+            mock_list.assert_not_called()
+
+    def test_unknown_backend(self, git_repo: Path) -> None:
+        with pytest.raises(ValueError):
+            list(discover_files(git_repo, backend="svn"))
+
+    def test_changed_since_requires_git(self, tmp_path_factory: pytest.TempPathFactory) -> None:
+        plain = tmp_path_factory.mktemp("plain")
+        with pytest.raises(ValueError):
+            list(discover_files(plain, changed_since="HEAD"))
+
+
+# ---------------------------------------------------------------------------
+# git backend
+# ---------------------------------------------------------------------------
+
+
+class TestGitBackend:
+    """File enumeration and binary classification from the index."""
+
+    def test_tracked_and_untracked_files(self, git_repo: Path) -> None:
+        (git_repo / "tracked.md").write_text("# t")
+        _commit_all(git_repo)
+        (git_repo / "untracked.md").write_text("# u")
+        assert _names(git_repo) == {"tracked.md", "untracked.md"}
+
+    def test_ignored_files_are_excluded(self, git_repo: Path) -> None:
+        (git_repo / ".gitignore").write_text("build/\n")
+        (git_repo / "build").mkdir()
+        (git_repo / "build" / "out.txt").write_text("generated")
+        (git_repo / "keep.txt").write_text("keep")
+        assert _names(git_repo) == {".gitignore", "keep.txt"}
+
+    def test_binary_extensions_are_not_opened(self, git_repo: Path) -> None:
+        (git_repo / "logo.png").write_bytes(b"\x89PNG\r\n\x1a\n\x00")
+        (git_repo / "readme.md").write_text("# r")
+        _commit_all(git_repo)
+        with patch("tools.repo_consolidation.scanner.is_binary", return_value=False) as sniff:
+            assert _names(git_repo) == {"readme.md"}
+        sniffed = {Path(c.args[0]).name for c in sniff.call_args_list}
+        assert sniffed == {"readme.md"}
+
+    def test_gitattributes_binary(self, git_repo: Path) -> None:
+        (git_repo / ".gitattributes").write_text("*.dat binary\n*.blob -text\n")
+        (git_repo / "a.dat").write_text("looks like text")
+        (git_repo / "b.blob").write_text("looks like text")
+        (git_repo / "c.txt").write_text("text")
+        assert _names(git_repo) == {".gitattributes", "c.txt"}
+
+    def test_unknown_extensions_are_still_sniffed(self, git_repo: Path) -> None:
+        (git_repo / "data.raw").write_bytes(b"abc\x00def")
+        assert _names(git_repo) == set()
+
+    def test_skip_dirs_apply(self, git_repo: Path) -> None:
+        (git_repo / "node_modules" / "pkg").mkdir(parents=True)
+        (git_repo / "node_modules" / "pkg" / "index.js").write_text("x")
+        (git_repo / "app.js").write_text("y")
+        _run(["git", "add", "-f", "."], git_repo)
+        assert _names(git_repo) == {"app.js"}
+
+    def test_deleted_tracked_file_is_skipped(self, git_repo: Path) -> None:
+        (git_repo / "gone.md").write_text("# gone")
+        _commit_all(git_repo)
+        (git_repo / "gone.md").unlink()
+        assert _names(git_repo) == set()
+
+    def test_subdirectory_root(self, git_repo: Path) -> None:
+        (git_repo / "sub").mkdir()
+        (git_repo / "sub" / "inner.md").write_text("# i")
+        (git_repo / "outer.md").write_text("# o")
+        _commit_all(git_repo)
+        assert _names(git_repo / "sub") == {"inner.md"}
+
+    def test_matches_walker_findings(self, git_repo: Path) -> None:
+        (git_repo / "docs").mkdir()
+        (git_repo / "docs" / "a.md").write_text(
+            "https://github.com/DevCloudNinjas/Zomato-Clone\n",
+        )
+        (git_repo / "Jenkinsfile").write_text('docker.build("devcloudninjas")\n')
+        _commit_all(git_repo)
+
+        def key(f: object) -> tuple:
+            return (f.file_path, f.line_number, f.matched_text)
+
+        walked = [f for f in scan_repo(git_repo, backend="walk")]
+        indexed = scan_repo(git_repo, backend="git")
+        assert sorted(indexed, key=key) == sorted(walked, key=key)
+
+
+class TestChangedSince:
+    """--changed-since limits discovery to files that differ from a ref."""
+
+    def test_only_changed_and_untracked(self, git_repo: Path) -> None:
+        (git_repo / "old.md").write_text("# old")
+        (git_repo / "edited.md").write_text("# v1")
+        _commit_all(git_repo, "base")
+        _run(["git", "tag", "base"], git_repo)
+
+        (git_repo / "edited.md").write_text("# v2")
+        (git_repo / "committed.md").write_text("# new")
+        _commit_all(git_repo, "second")
+        (git_repo / "untracked.md").write_text("# u")
+
+        assert _names(git_repo, changed_since="base") == {
+            "committed.md", "edited.md", "untracked.md",
+        }
+
+    def test_invalid_ref(self, git_repo: Path) -> None:
+        (git_repo / "a.md").write_text("# a")
+        _commit_all(git_repo)
+        with pytest.raises(ValueError):
+            list(discover_files(git_repo, changed_since="no-such-ref"))
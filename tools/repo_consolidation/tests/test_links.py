@@ -0,0 +1,154 @@
+"""Tests for the relative link checker."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from tools.repo_consolidation.links import (
+    build_path_index,
+    check_links,
+    extract_links,
+    resolve_target,
+)
+from tools.repo_consolidation.manifest import RepoManifest
+from tools.repo_consolidation.models import BrokenLink
+
+
+# ---------------------------------------------------------------------------
+# extract_links
+# ---------------------------------------------------------------------------
+
+
+class TestExtractLinks:
+    """Tests for link extraction from markdown and HTML text."""
+
+    def test_inline_links_and_images(self) -> None:
+        text = "See [docs](docs/README.md).\n![diagram](./img/arch.png \"Arch\")\n"
+        assert extract_links(text) == [(1, "docs/README.md"), (2, "./img/arch.png")]
+
+    def test_nested_badge_link(self) -> None:
+        text = "[![build](badge.svg)](ci/status.md)\n"
+        assert extract_links(text) == [(1, "badge.svg"), (1, "ci/status.md")]
+
+    def test_reference_definition(self) -> None:
+        text = "Intro\n\n[guide]: ../guide.md \"Guide\"\n"
+        assert extract_links(text) == [(3, "../guide.md")]
+
+    def test_html_in_markdown(self) -> None:
+        text = '<p><img src="logo.png" width="80"><a HREF=\'setup.md\'>x</a></p>\n'
+        assert extract_links(text) == [(1, "logo.png"), (1, "setup.md")]
+
+    def test_attribute_name_must_be_whole_word(self) -> None:
+        assert extract_links('<img data-src="lazy.png" xsrc="x.png">\n') == [
+            (1, "lazy.png"),
+        ]
+
+    def test_skips_non_relative_targets(self) -> None:
+        text = (
+            "[a](https://example.com) [b](mailto:me@example.com) [c](#usage)\n"
+            "[d](/abs/path.md) [e]({{ site.url }}/x.md) [f](?tab=1)\n"
+            '<link href="%PUBLIC_URL%/favicon.ico">\n'
+        )
+        assert extract_links(text) == []
+
+    def test_skips_code(self) -> None:
+        text = (
+            "```bash\n"
+            "echo [x](not/a/link.md)\n"
+            "```\n"
+            "Use `[y](also/not.md)` or [z](real.md).\n"
+            "~~~\n"
+            "[w](fenced.md)\n"
+        )
+        assert extract_links(text) == [(4, "real.md")]
+
+    def test_html_mode_ignores_markdown_syntax(self) -> None:
+        text = "[x](a.md)\n<a href=\"b.html\">b</a>\n"
+        assert extract_links(text, markdown=False) == [(2, "b.html")]
+
+
+# ---------------------------------------------------------------------------
+# resolve_target / build_path_index
+# ---------------------------------------------------------------------------
+
+
+class TestResolveTarget:
+    """Tests for resolving a link target against its source file."""
+
+    def test_relative_to_source_directory(self) -> None:
+        assert resolve_target("docs/guide/README.md", "../img/a.png") == "docs/img/a.png"
+
+    def test_drops_fragment_and_query_and_decodes(self) -> None:
+        assert resolve_target("README.md", "my%20file.md?plain=1#top") == "my file.md"
+
+    def test_repository_root(self) -> None:
+        assert resolve_target("docs/README.md", "..") == ""
+
+    def test_escaping_the_repository(self) -> None:
+        assert resolve_target("README.md", "../other/README.md") is None
+
+
+class TestBuildPathIndex:
+    """Tests for the in-memory path index."""
+
+    def test_includes_parent_directories(self) -> None:
+        index = build_path_index(["a/b/c.md", "a/d.md"])
+        assert index == {"", "a", "a/b", "a/b/c.md", "a/d.md"}
+
+
+# ---------------------------------------------------------------------------
+# check_links
+# ---------------------------------------------------------------------------
+
+
+def _repo(root: Path) -> Path:
+    (root / "docs" / "img").mkdir(parents=True)
+    (root / "docs" / "img" / "arch.png").write_bytes(b"\x89PNG\x00\x00")
+    (root / "docs" / "setup.md").write_text("# Setup\n")
+    (root / "README.md").write_text(
+        "# Project\n"
+        "[setup](docs/setup.md#install)\n"
+        "![arch](docs/img/arch.png)\n"
+        "[docs](docs/)\n"
+        "[gone](docs/missing.md)\n"
+        "[web](https://example.com)\n"
+    )
+    (root / "docs" / "index.html").write_text('<a href="../README.md">home</a>\n<img src="nope.gif">\n')
+    return root
+
+
+class TestCheckLinks:
+    """Tests for check_links on a small repository."""
+
+    def test_reports_broken_links(self, tmp_path: Path) -> None:
+        result = check_links(_repo(tmp_path))
+
+        assert result.files_checked == 3
+        assert result.links_checked == 6
+        assert result.links_resolved == 4
+        assert sorted(result.broken, key=lambda b: b.file_path) == [
+            BrokenLink("README.md", 5, "docs/missing.md"),
+            BrokenLink("docs/index.html", 2, "nope.gif"),
+        ]
+
+    def test_uses_manifest_without_touching_disk(self, tmp_path: Path) -> None:
+        manifest = RepoManifest.build(_repo(tmp_path))
+        # Created after the manifest: the index does not know it exists.
+        (tmp_path / "docs" / "missing.md").write_text("# Late\n")
+
+        result = check_links(tmp_path, manifest=manifest)
+
+        assert BrokenLink("README.md", 5, "docs/missing.md") in result.broken
+
+    def test_parallel_matches_serial(self, tmp_path: Path) -> None:
+        _repo(tmp_path)
+        for i in range(150):
+            (tmp_path / "docs" / f"page{i}.md").write_text(
+                f"[next](page{i + 1}.md)\n[setup](setup.md)\n"
+            )
+
+        serial = check_links(tmp_path, jobs=1)
+        parallel = check_links(tmp_path, jobs=2)
+
+        assert parallel == serial
+        assert BrokenLink("docs/page149.md", 1, "page150.md") in serial.broken
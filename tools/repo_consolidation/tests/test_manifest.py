@@ -0,0 +1,181 @@
+"""Tests for the shared discovery manifest."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from tools.repo_consolidation.applier import apply_file_edits
+from tools.repo_consolidation.cache import file_digest
+from tools.repo_consolidation.manifest import PathIndex, RepoManifest
+from tools.repo_consolidation.models import FileEdits
+from tools.repo_consolidation.scanner import discover_files, iter_findings, scan_repo
+
+OLD_URL = "https://github.com/DevCloudNinjas/Zomato-Clone\n"
+
+
+def _repo(root: Path) -> Path:
+    (root / "docs").mkdir()
+    (root / "docs" / "README.md").write_text(OLD_URL)
+    (root / "docs" / "copy.md").write_text(OLD_URL)
+    (root / "Jenkinsfile").write_text("pipeline {}\n")
+    (root / "logo.png").write_bytes(b"\x89PNG\x00\x00")
+    (root / ".git").mkdir()
+    (root / ".git" / "config").write_text("[core]\n")
+    return root
+
+
+class TestBuild:
+    """RepoManifest.build records every discovered file."""
+
+    def test_records_text_and_binary_files(self, tmp_path: Path) -> None:
+        manifest = RepoManifest.build(_repo(tmp_path), backend="walk")
+
+        assert manifest.complete
+        assert len(manifest) == 4
+        png = manifest.get("logo.png")
+        assert png is not None and png.binary and png.file_type == ".png"
+        readme = manifest.get("docs/README.md")
+        assert readme is not None and not readme.binary
+        assert readme.size == len(OLD_URL)
+        assert manifest.get(".git/config") is None
+
+    def test_text_files_match_discovery(self, tmp_path: Path) -> None:
+        _repo(tmp_path)
+        manifest = RepoManifest.build(tmp_path, backend="walk")
+
+        assert list(manifest.text_files()) == list(discover_files(tmp_path, backend="walk"))
+
+    def test_counts_skip_binaries(self, tmp_path: Path) -> None:
+        manifest = RepoManifest.build(_repo(tmp_path))
+
+        assert manifest.counts_by_type() == {".md": 2, "Jenkinsfile": 1}
+
+    def test_lookup_by_absolute_path(self, tmp_path: Path) -> None:
+        _repo(tmp_path)
+        manifest = RepoManifest.build(tmp_path)
+
+        entry = manifest.get("Jenkinsfile")
+        assert entry is not None
+        assert manifest.get(entry.path) is entry
+
+
+class TestDigest:
+    """Content hashes are computed on first request."""
+
+    def test_lazy_and_cached(self, tmp_path: Path) -> None:
+        _repo(tmp_path)
+        manifest = RepoManifest.build(tmp_path)
+        entry = manifest.get("docs/README.md")
+        assert entry is not None and entry.digest is None
+
+        digest = manifest.digest("docs/README.md")
+
+        assert digest == file_digest(tmp_path / "docs" / "README.md")
+        assert entry.digest == digest
+
+    def test_unknown_path(self, tmp_path: Path) -> None:
+        assert RepoManifest.build(tmp_path).digest("missing.md") is None
+
+
+class TestRefresh:
+    """refresh() keeps the manifest in step with the tree."""
+
+    def test_updates_modified_and_drops_deleted(self, tmp_path: Path) -> None:
+        _repo(tmp_path)
+        manifest = RepoManifest.build(tmp_path)
+        manifest.digest("docs/README.md")
+        (tmp_path / "docs" / "README.md").write_text("short\n")
+        (tmp_path / "Jenkinsfile").unlink()
+
+        manifest.refresh(["docs/README.md", "Jenkinsfile"])
+
+        entry = manifest.get("docs/README.md")
+        assert entry is not None
+        assert entry.size == len("short\n")
+        assert entry.digest is None
+        assert manifest.get("Jenkinsfile") is None
+        assert manifest.counts_by_type() == {".md": 2}
+
+    def test_applier_refreshes_manifest(self, tmp_path: Path) -> None:
+        _repo(tmp_path)
+        manifest = RepoManifest.build(tmp_path)
+        edits = FileEdits("docs/README.md")
+        edits.add_line(1, OLD_URL.rstrip("\n"), "fixed")
+
+        apply_file_edits([edits], str(tmp_path), manifest=manifest)
+
+        entry = manifest.get("docs/README.md")
+        assert entry is not None and entry.size == len("fixed\n")
+
+
+class TestScanWithManifest:
+    """The scanner reads its file list from a manifest."""
+
+    def test_same_findings_as_discovery(self, tmp_path: Path) -> None:
+        _repo(tmp_path)
+        manifest = RepoManifest.build(tmp_path)
+
+        assert scan_repo(tmp_path, manifest=manifest) == scan_repo(tmp_path)
+
+    def test_complete_manifest_is_not_rewalked(self, tmp_path: Path) -> None:
+        _repo(tmp_path)
+        manifest = RepoManifest.build(tmp_path)
+        (tmp_path / "late.md").write_text(OLD_URL)
+
+        scanned = {f.file_path for f in scan_repo(tmp_path, manifest=manifest)}
+
+        assert "late.md" not in scanned
+
+    def test_streaming_scan_fills_manifest(self, tmp_path: Path) -> None:
+        _repo(tmp_path)
+        manifest = RepoManifest(tmp_path)
+
+        findings = list(iter_findings(tmp_path, manifest=manifest, backend="walk"))
+
+        assert manifest.complete
+        assert manifest.counts_by_type() == {".md": 2, "Jenkinsfile": 1}
+        assert len(findings) == 2
+
+
+class TestPathIndex:
+    """PathIndex answers existence queries from memory."""
+
+    INDEX = PathIndex(["a/b/c.md", "a/d.md", "top.txt"])
+
+    def test_files_and_directories(self) -> None:
+        index = self.INDEX
+        assert index.is_file("a/b/c.md") and not index.is_dir("a/b/c.md")
+        assert index.is_dir("a/b") and not index.is_file("a/b")
+        assert index.exists("") and index.is_dir(".")
+        assert not index.exists("a/b/missing.md")
+        assert len(index) == 3
+
+    def test_queries_are_normalised(self) -> None:
+        assert self.INDEX.exists("a/./b/")
+        assert self.INDEX.is_file("a/b/../d.md")
+        assert not self.INDEX.exists("../a")
+        assert not self.INDEX.exists("/a")
+
+    def test_nearest_existing(self) -> None:
+        assert self.INDEX.nearest_existing("a/b/c.md") == "a/b/c.md"
+        assert self.INDEX.nearest_existing("a/b/x/y.md") == "a/b"
+        assert self.INDEX.nearest_existing("z/y.md") == ""
+        assert self.INDEX.nearest_existing("../z") is None
+
+    def test_manifest_index_follows_refresh(self, tmp_path: Path) -> None:
+        root = _repo(tmp_path)
+        manifest = RepoManifest.build(root, backend="walk")
+        index = manifest.path_index()
+        assert manifest.path_index() is index
+        assert index.is_file("logo.png") and index.is_dir("docs")
+        assert not index.exists(".git/config")
+
+        (root / "new").mkdir()
+        (root / "new" / "x.md").write_text("x\n")
+        manifest.refresh(["new/x.md"])
+        assert manifest.path_index().is_dir("new")
+
+        for name in ("README.md", "copy.md"):
+            (root / "docs" / name).unlink()
+        manifest.refresh(["docs/README.md", "docs/copy.md"])
+        assert not manifest.path_index().exists("docs")
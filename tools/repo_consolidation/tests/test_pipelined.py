@@ -0,0 +1,100 @@
+"""Tests for pipelined scan → fix → apply execution."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from tools.repo_consolidation.applier import apply_file_edits
+from tools.repo_consolidation.cli import _build_fixer_map, _group_by_file
+from tools.repo_consolidation.fixers import fix_file
+from tools.repo_consolidation.models import Finding, Replacement
+from tools.repo_consolidation.pipelined import run_pipelined
+from tools.repo_consolidation.scanner import iter_findings, scan_repo
+
+OLD_URL = "https://github.com/DevCloudNinjas/Zomato-Clone"
+
+
+def _repo(root: Path, files: int = 6) -> Path:
+    root.mkdir()
+    for i in range(files):
+        (root / f"doc{i}.md").write_text(f"# {i}\nSee {OLD_URL}\n{OLD_URL}.git\n", encoding="utf-8")
+    return root
+
+
+def _findings(files: int) -> Iterator[Finding]:
+    for i in range(files):
+        yield Finding(f"doc{i}.md", 1, "x", "stale", "", "x", ".md")
+
+
+class TestRunPipelined:
+    """run_pipelined matches the sequential stages."""
+
+    @pytest.mark.parametrize("apply_workers", [1, 3])
+    def test_matches_sequential(self, tmp_path: Path, apply_workers: int) -> None:
+        seq, pipe = _repo(tmp_path / "seq"), _repo(tmp_path / "pipe")
+        expected = scan_repo(seq)
+        fixer_map = _build_fixer_map(str(seq))
+        edits = [fix_file(group, fixer_map) for group in _group_by_file(expected).values()]
+        expected_summary = apply_file_edits(edits, str(seq))
+
+        result = run_pipelined(
+            iter_findings(pipe), _build_fixer_map(str(pipe)), pipe,
+            apply_workers=apply_workers, queue_size=1,
+        )
+
+        assert result.findings == expected
+        assert result.summary == expected_summary
+        assert result.replacements == sum(len(e.lines) for e in edits)
+        assert (pipe / "doc5.md").read_bytes() == (seq / "doc5.md").read_bytes()
+
+    def test_backpressure_bounds_read_ahead(self, tmp_path: Path) -> None:
+        produced: list[int] = []
+        seen_ahead: list[int] = []
+
+        def findings() -> Iterator[Finding]:
+            for finding in _findings(50):
+                produced.append(1)
+                yield finding
+
+        def slow_fixer(group: list[Finding]) -> Replacement | None:
+            if not seen_ahead:
+                time.sleep(0.3)  # let the scan run ahead as far as it can
+                seen_ahead.append(len(produced))
+            return None
+
+        result = run_pipelined(findings(), {"stale": slow_fixer}, tmp_path, queue_size=1)
+
+        assert len(result.findings) == 50
+        # One file being fixed, one queued, one waiting to be queued, and
+        # the finding that told the scan its file had ended.
+        assert seen_ahead[0] <= 4
+
+    def test_stage_errors_propagate(self, tmp_path: Path) -> None:
+        def failing() -> Iterator[Finding]:
+            yield from _findings(3)
+            raise ValueError("discovery failed")
+
+        with pytest.raises(ValueError, match="discovery failed"):
+            run_pipelined(failing(), {}, tmp_path)
+
+    def test_apply_errors_stop_the_scan(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        produced: list[int] = []
+
+        def findings() -> Iterator[Finding]:
+            for finding in _findings(500):
+                produced.append(1)
+                yield finding
+
+        def broken_apply(*args: object, **kwargs: object) -> None:
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr("tools.repo_consolidation.pipelined.apply_file_edits", broken_apply)
+        with pytest.raises(RuntimeError, match="disk full"):
+            run_pipelined(findings(), {}, tmp_path, queue_size=1)
+        assert len(produced) < 500
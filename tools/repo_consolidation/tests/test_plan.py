@@ -0,0 +1,137 @@
+"""Tests for persisted remediation plans."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from tools.repo_consolidation.cli import _build_fixer_map
+from tools.repo_consolidation.fixers import fix_file
+from tools.repo_consolidation.manifest import RepoManifest
+from tools.repo_consolidation.models import FileEdits, Replacement
+from tools.repo_consolidation.plan import (
+    PLAN_VERSION,
+    RemediationPlan,
+    apply_plan,
+    format_planned_file,
+    load_plan,
+    make_plan,
+    write_plan,
+)
+from tools.repo_consolidation.scanner import scan_repo
+
+OLD_URL = "https://github.com/DevCloudNinjas/Zomato-Clone"
+
+
+def _plan(root: Path) -> RemediationPlan:
+    (root / "README.md").write_text(f"# Title\nSee {OLD_URL}\n", encoding="utf-8")
+    (root / "notes.md").write_text(f"{OLD_URL}\n", encoding="utf-8")
+    manifest = RepoManifest.build(root, backend="walk")
+    findings = scan_repo(root, manifest=manifest)
+    fixer_map = _build_fixer_map(str(root))
+    by_file: dict[str, list] = {}
+    for finding in findings:
+        by_file.setdefault(finding.file_path, []).append(finding)
+    edits = [fix_file(group, fixer_map) for group in by_file.values()]
+    return make_plan(root, findings, edits, manifest=manifest)
+
+
+class TestPlanFile:
+    """write_plan and load_plan round-trip a plan."""
+
+    @pytest.mark.parametrize("name", ["plan.jsonl", "plan.jsonl.gz"])
+    def test_round_trip(self, tmp_path: Path, name: str) -> None:
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        plan = _plan(repo)
+        plan.files[0].edits.actions.append(
+            Replacement("notes.md", 0, "", "", "review me", "flag_for_review"),
+        )
+
+        write_plan(tmp_path / name, plan)
+
+        assert load_plan(tmp_path / name) == plan
+
+    def test_hashes_match_files(self, tmp_path: Path) -> None:
+        plan = _plan(tmp_path)
+        assert sorted(p.file_path for p in plan.files) == ["README.md", "notes.md"]
+        manifest = RepoManifest.build(tmp_path)
+        assert all(p.sha256 == manifest.digest(p.file_path) for p in plan.files)
+
+    def test_rejects_other_versions(self, tmp_path: Path) -> None:
+        path = tmp_path / "plan.jsonl"
+        path.write_text(json.dumps({"type": "plan", "version": PLAN_VERSION + 1, "repo_root": "."}))
+        with pytest.raises(ValueError, match="plan version"):
+            load_plan(path)
+
+    def test_rejects_non_plans(self, tmp_path: Path) -> None:
+        path = tmp_path / "report.txt"
+        path.write_text("Remediation Report\n")
+        with pytest.raises(ValueError, match="not a remediation plan"):
+            load_plan(path)
+
+    def test_malformed_record(self, tmp_path: Path) -> None:
+        path = tmp_path / "plan.jsonl"
+        write_plan(path, _plan(tmp_path))
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write('{"type": "file"}\n')
+        with pytest.raises(ValueError, match=r"plan.jsonl:4: malformed"):
+            load_plan(path)
+
+
+class TestApplyPlan:
+    """apply_plan executes the plan and refuses files that changed."""
+
+    def test_applies_without_scanning(self, tmp_path: Path) -> None:
+        plan = _plan(tmp_path)
+
+        summary = apply_plan(plan)
+
+        assert summary.files_modified == 2
+        assert summary.errors == []
+        assert OLD_URL not in (tmp_path / "README.md").read_text(encoding="utf-8")
+
+    def test_refuses_changed_and_missing_files(self, tmp_path: Path) -> None:
+        plan = _plan(tmp_path)
+        (tmp_path / "README.md").write_text(f"# Edited\nSee {OLD_URL}\n", encoding="utf-8")
+        (tmp_path / "notes.md").unlink()
+
+        summary = apply_plan(plan)
+
+        assert summary.files_modified == 0
+        assert sorted(summary.errors)[0] == "README.md: changed since the plan was made; skipped"
+        assert sorted(summary.errors)[1].startswith("notes.md: cannot read")
+        assert OLD_URL in (tmp_path / "README.md").read_text(encoding="utf-8")
+
+    def test_dry_run_checks_hashes(self, tmp_path: Path) -> None:
+        plan = _plan(tmp_path)
+        (tmp_path / "notes.md").write_text("changed\n", encoding="utf-8")
+
+        summary = apply_plan(plan, dry_run=True)
+
+        assert summary.files_modified == 1
+        assert len(summary.errors) == 1
+        assert OLD_URL in (tmp_path / "README.md").read_text(encoding="utf-8")
+
+    def test_other_checkout(self, tmp_path: Path) -> None:
+        original, copy = tmp_path / "a", tmp_path / "b"
+        original.mkdir()
+        plan = _plan(original)
+        copy.mkdir()
+        for name in ("README.md", "notes.md"):
+            (copy / name).write_bytes((original / name).read_bytes())
+
+        assert apply_plan(plan, copy).files_modified == 2
+        assert OLD_URL in (original / "notes.md").read_text(encoding="utf-8")
+
+
+def test_format_planned_file(tmp_path: Path) -> None:
+    planned = next(p for p in _plan(tmp_path).files if p.file_path == "notes.md")
+    lines = format_planned_file(planned)
+    assert lines[0] == "notes.md"
+    assert f"  1: - {OLD_URL}" in lines
+
+    planned.edits = FileEdits("notes.md")
+    assert format_planned_file(planned)[-1] == "  (no automatic fix)"
@@ -0,0 +1,97 @@
+"""Tests for the pipeline profiler."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from tools.repo_consolidation.models import ScanStats
+from tools.repo_consolidation.profiling import (
+    SUMMARY_FILENAME,
+    TRACE_FILENAME,
+    Profiler,
+    merge_pattern_stats,
+)
+from tools.repo_consolidation.scanner import scan_repo
+
+
+def _populate(root: Path) -> None:
+    for i in range(5):
+        (root / f"doc{i}.md").write_text(
+            f"[A](https://github.com/DevCloudNinjas/Zomato-Clone/blob/main/{i}.md)\n"
+            "account: 123456789012.dkr.ecr.us-east-1.amazonaws.com/app\n"
+        )
+
+
+def _match_counts(profiler: Profiler) -> dict[str, tuple[int, int]]:
+    patterns = profiler.summary()["patterns"]
+    return {name: (p["matches"], p["lines"]) for name, p in patterns.items()}
+
+
+class TestProfiler:
+    def test_stage_accumulates(self) -> None:
+        profiler = Profiler()
+        with profiler.stage("scan"):
+            pass
+        with profiler.stage("scan"):
+            pass
+        with profiler.stage("report"):
+            pass
+        summary = profiler.summary()
+        assert list(summary["stages"]) == ["scan", "report"]
+        assert [e["name"] for e in profiler.trace()["traceEvents"]] == ["scan", "scan", "report"]
+
+    def test_slowest_files_are_bounded_and_sorted(self) -> None:
+        profiler = Profiler(top_n=3)
+        for i in range(10):
+            profiler.file_scanned(f"f{i}", 0.0, float(i))
+        slowest = profiler.summary()["slowest_files"]
+        assert [f["path"] for f in slowest] == ["f9", "f8", "f7"]
+        assert profiler.summary()["files_timed"] == 10
+
+    def test_fixer_aggregates(self) -> None:
+        profiler = Profiler()
+        profiler.fixer_called("old_url", "a.md", 1, 0.0, 0.5)
+        profiler.fixer_called("old_url", "a.md", 2, 0.0, 1.5)
+        profiler.fixer_called("credential", "b.sh", 3, 0.0, 0.1)
+        summary = profiler.summary()
+        assert summary["fixers"]["old_url"] == {"calls": 2, "seconds": 2.0, "max_seconds": 1.5}
+        assert list(summary["fixers"]) == ["old_url", "credential"]
+        assert summary["slowest_fixes"][0] == {
+            "fixer": "old_url", "path": "a.md", "line": 2, "seconds": 1.5,
+        }
+
+    def test_merge_pattern_stats(self) -> None:
+        into = {"old_url": [1.0, 2, 3]}
+        merge_pattern_stats(into, {"old_url": [0.5, 1, 1], "credential": [0.1, 0, 4]})
+        assert into == {"old_url": [1.5, 3, 4], "credential": [0.1, 0, 4]}
+
+    def test_write(self, tmp_path: Path) -> None:
+        profiler = Profiler()
+        with profiler.stage("scan"):
+            pass
+        summary_path, trace_path = profiler.write(tmp_path / "out", ScanStats(files_scanned=4))
+        assert summary_path == tmp_path / "out" / SUMMARY_FILENAME
+        assert trace_path == tmp_path / "out" / TRACE_FILENAME
+        assert json.loads(summary_path.read_text())["scan_stats"]["files_scanned"] == 4
+        event = json.loads(trace_path.read_text())["traceEvents"][0]
+        assert event["ph"] == "X" and event["cat"] == "stage"
+
+
+class TestScanProfiling:
+    def test_serial_scan_records_files_and_patterns(self, tmp_path: Path) -> None:
+        _populate(tmp_path)
+        profiler = Profiler()
+        findings = scan_repo(tmp_path, profiler=profiler)
+        summary = profiler.summary()
+        assert summary["files_timed"] == 5
+        assert summary["patterns"]["old_url"]["matches"] == 5
+        assert summary["patterns"]["hardcoded_account_id"]["matches"] == 5
+        assert sum(p["matches"] for p in summary["patterns"].values()) == len(findings)
+
+    def test_parallel_scan_matches_serial_counts(self, tmp_path: Path) -> None:
+        _populate(tmp_path)
+        serial, parallel = Profiler(), Profiler()
+        assert scan_repo(tmp_path, profiler=parallel, jobs=2) == scan_repo(tmp_path, profiler=serial)
+        assert _match_counts(parallel) == _match_counts(serial)
+        assert parallel.summary()["files_timed"] == 5
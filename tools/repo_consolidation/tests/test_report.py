@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
-from tools.repo_consolidation.models import Finding, ValidationReport
+import io
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from tools.repo_consolidation.models import BrokenLink, Finding, ScanStats, ValidationReport
 from tools.repo_consolidation.report import (
     generate_report,
     generate_unresolved_report,
+    write_report,
 )
 
 
@@ -116,6 +123,19 @@ class TestGenerateReport:
         assert "Broken relative paths:   2" in report
         assert "Remaining issues:        1" in report
 
+    def test_broken_links_listed(self) -> None:
+        validation = _make_validation(total_broken_relative_paths=1)
+        validation.broken_links = [BrokenLink("docs/README.md", 7, "./img/missing.png")]
+        report = generate_report([], validation)
+
+        assert "Broken Relative Links" in report
+        assert "  docs/README.md" in report
+        assert "Line 7: ./img/missing.png" in report
+
+    def test_no_broken_links_omits_detail(self) -> None:
+        report = generate_report([], _make_validation())
+        assert "Broken Relative Links" not in report
+
     def test_no_remaining_issues_omits_detail(self) -> None:
         report = generate_report([], _make_validation())
         assert "Unresolved Issues" not in report
@@ -154,6 +174,20 @@ class TestGenerateReport:
         assert "hardcoded_account_id: 1" in report
         assert "stale_docker_image: 1" in report
 
+    def test_scan_statistics_section(self) -> None:
+        stats = ScanStats(
+            files_scanned=10, bytes_scanned=2048,
+            files_deduplicated=3, bytes_deduplicated=512,
+        )
+        report = generate_report([], _make_validation(), stats)
+
+        assert "Scan Statistics" in report
+        assert "Files scanned:           10 (2048 bytes)" in report
+        assert "Duplicates skipped:      3 (512 bytes)" in report
+
+    def test_scan_statistics_omitted_without_stats(self) -> None:
+        assert "Scan Statistics" not in generate_report([], _make_validation())
+
 
 # ---------------------------------------------------------------------------
 # generate_unresolved_report
@@ -215,3 +249,88 @@ class TestGenerateUnresolvedReport:
     def test_returns_string(self) -> None:
         result = generate_unresolved_report(_make_validation())
         assert isinstance(result, str)
+
+
+# ---------------------------------------------------------------------------
+# write_report
+# ---------------------------------------------------------------------------
+
+
+def _written(report_format: str, validation: ValidationReport) -> str:
+    out = io.StringIO()
+    write_report(out, report_format, [_make_finding()], validation, ScanStats(files_scanned=1))
+    return out.getvalue()
+
+
+def _failing_validation() -> ValidationReport:
+    validation = _make_validation(
+        total_files_scanned={".md": 1},
+        remaining_issues=[
+            _make_finding(line_number=3),
+            _make_finding(line_number=0, issue_type="credential", matched_text="ghp_secret"),
+        ],
+    )
+    validation.broken_links = [BrokenLink("readme.md", 7, "missing.md")]
+    return validation
+
+
+class TestWriteReport:
+    """Tests for the machine-readable report writers."""
+
+    def test_text_matches_generate_report(self) -> None:
+        validation = _make_validation()
+        expected = generate_report([_make_finding()], validation, ScanStats(files_scanned=1))
+        assert _written("text", validation) == expected + "\n"
+
+    def test_jsonl_records(self) -> None:
+        records = [json.loads(line) for line in _written("jsonl", _failing_validation()).splitlines()]
+
+        assert [r["type"] for r in records] == [
+            "finding", "remaining", "remaining", "broken_link", "summary",
+        ]
+        summary = records[-1]
+        assert summary["remaining_issues"] == 2
+        assert summary["findings_by_type"] == {"old_url": 1}
+        assert summary["scan_stats"]["files_scanned"] == 1
+
+    def test_sarif_results(self) -> None:
+        log = json.loads(_written("sarif", _failing_validation()))
+
+        assert log["version"] == "2.1.0"
+        run = log["runs"][0]
+        assert run["tool"]["driver"]["name"] == "repo-consolidation"
+        assert run["properties"]["broken_relative_paths"] == 0
+        results = run["results"]
+        assert [r["ruleId"] for r in results] == ["old_url", "credential", "broken_relative_link"]
+        assert results[0]["locations"][0]["physicalLocation"]["region"] == {"startLine": 3}
+        # Line 0 findings have no region, and credentials are not echoed.
+        assert "region" not in results[1]["locations"][0]["physicalLocation"]
+        assert "ghp_secret" not in json.dumps(results[1])
+
+    def test_sarif_without_results(self) -> None:
+        log = json.loads(_written("sarif", _make_validation()))
+        assert log["runs"][0]["results"] == []
+
+    def test_junit_failures(self) -> None:
+        root = ET.fromstring(_written("junit", _failing_validation()))
+
+        assert root.get("failures") == "3"
+        suites = {suite.get("name"): suite for suite in root}
+        issues = suites["remaining_issues"].findall("testcase")
+        assert [case.get("name") for case in issues] == [
+            "Line 3: [old_url]", "Line 0: [credential]",
+        ]
+        assert issues[1].find("failure").text is None
+        link = suites["broken_links"].find("testcase/failure")
+        assert link is not None and link.text == "missing.md"
+
+    def test_junit_passing_suites(self) -> None:
+        root = ET.fromstring(_written("junit", _make_validation()))
+
+        assert root.get("failures") == "0"
+        assert all(suite.find("testcase/failure") is None for suite in root)
+        assert len(root.findall("testsuite/testcase")) == 2
+
+    def test_unknown_format(self) -> None:
+        with pytest.raises(ValueError, match="unknown report format"):
+            write_report(io.StringIO(), "html", [], _make_validation())
@@ -1,16 +1,36 @@
 """Tests for the URL mapping registry."""
 
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
 from tools.repo_consolidation.url_map import (
     CONSOLIDATED_CLONE_URL,
     CONSOLIDATED_TREE_URL,
     URL_MAP,
+    UrlIndex,
+    _relative_path,
     compute_relative_path,
     is_mapped,
+    load_url_map,
     lookup,
     resolve_new_path,
+    route,
+    url_index,
+    url_matcher,
+    url_matcher_for,
+    use_url_map,
 )
 
 
+@pytest.fixture()
+def restore_url_map() -> Iterator[None]:
+    """Reinstate the built-in map after a test that swaps it."""
+    yield
+    use_url_map(None)
+
+
 class TestURLMap:
     """Basic correctness tests for the static URL_MAP and lookup helpers."""
 
@@ -240,3 +260,149 @@ class TestResolveNewPath:
             "project-13/README.md",
         )
         assert result == "../resources/devops-tools-list"
+
+
+class TestUrlMatcher:
+    """The shared matcher built from every URL_MAP key."""
+
+    def test_cached(self) -> None:
+        assert url_matcher() is url_matcher()
+        assert url_matcher_for("Zomato-Clone") is url_matcher()
+
+    def test_span_repo_and_subpath(self) -> None:
+        line = "See [x](https://github.com/DevCloudNinjas/Zomato-Clone/blob/main/a.md) now"
+        (m,) = url_matcher().finditer(line)
+        assert m.repo == "Zomato-Clone"
+        assert m.has_scheme
+        assert line[m.start:m.end] == m.url == "https://github.com/DevCloudNinjas/Zomato-Clone/blob/main/a.md"
+        assert line[m.host_start:m.repo_end] == "github.com/DevCloudNinjas/Zomato-Clone"
+        assert m.subpath == "blob/main/a.md"
+
+    def test_several_repos_in_one_pass(self) -> None:
+        line = "github.com/devcloudninjas/csgo.git and https://github.com/DevCloudNinjas/zomato-clone"
+        matches = url_matcher().finditer(line)
+        assert [(m.repo, m.has_scheme, m.rest) for m in matches] == [
+            ("csgo", False, ".git"),
+            ("zomato-clone", True, ""),
+        ]
+        assert [m.repo for m in url_matcher().finditer(line, "ZOMATO-CLONE")] == ["zomato-clone"]
+
+    def test_name_boundary(self) -> None:
+        assert url_matcher().finditer("https://github.com/DevCloudNinjas/csgo-tools") == []
+
+    def test_longest_name_wins(self) -> None:
+        names = ("dks", "dks-ui")
+        matcher = url_matcher(names)
+        assert [m.repo for m in matcher.finditer("github.com/DevCloudNinjas/dks-ui/x")] == ["dks-ui"]
+
+    def test_unmapped_name_gets_own_matcher(self) -> None:
+        matcher = url_matcher_for("Not-In-Map")
+        assert matcher is not url_matcher()
+        assert matcher is url_matcher_for("Not-In-Map")
+        assert matcher.match("https://github.com/DevCloudNinjas/Not-In-Map/tree/main").subpath == "tree/main"
+
+
+class TestUrlIndex:
+    """The compiled index: repo lookup and longest-prefix subpath routes."""
+
+    INDEX = UrlIndex([
+        ("Old-Repo", "project-50-old"),
+        ("Old-Repo/docs", "learning/old-docs"),
+        ("Old-Repo/docs/api/v2", "resources/old-api"),
+    ])
+
+    def test_default_index_matches_url_map(self) -> None:
+        assert len(url_index()) == len(URL_MAP)
+        assert url_index().names == tuple(URL_MAP)
+
+    def test_lookup_is_case_insensitive(self) -> None:
+        assert self.INDEX.lookup("OLD-REPO") == "project-50-old"
+        assert self.INDEX.lookup("Old-Repo/docs") is None
+
+    def test_longest_prefix_wins(self) -> None:
+        assert self.INDEX.route("old-repo", "docs/api/v2/auth.md") == "resources/old-api/auth.md"
+        assert self.INDEX.route("old-repo", "docs/api/v1/auth.md") == "learning/old-docs/api/v1/auth.md"
+        assert self.INDEX.route("old-repo", "docs") == "learning/old-docs"
+
+    def test_routes_match_whole_segments(self) -> None:
+        assert self.INDEX.route("Old-Repo", "docsite/x.md") == "project-50-old/docsite/x.md"
+        assert self.INDEX.route("Old-Repo", "Docs/x.md") == "project-50-old/Docs/x.md"
+
+    def test_no_subpath_and_unmapped(self) -> None:
+        assert self.INDEX.route("Old-Repo") == "project-50-old"
+        assert self.INDEX.route("Other", "docs") is None
+
+    def test_route_without_repo_entry_is_rejected(self) -> None:
+        with pytest.raises(ValueError, match="unmapped repo"):
+            UrlIndex([("Old-Repo/docs", "learning/old-docs")])
+
+
+class TestLoadUrlMap:
+    """Loading a map from JSON or CSV and activating it."""
+
+    def test_json(self, tmp_path: Path) -> None:
+        path = tmp_path / "map.json"
+        path.write_text('{"Old-Repo": "project-50-old/", "Old-Repo/docs": "learning/d"}', encoding="utf-8")
+        index = load_url_map(path)
+        assert index.lookup("old-repo") == "project-50-old"
+        assert index.route("Old-Repo", "docs/a.md") == "learning/d/a.md"
+
+    def test_csv(self, tmp_path: Path) -> None:
+        path = tmp_path / "map.csv"
+        path.write_text(
+            "source,destination\n# moved in the 2026 batch\n\nOld-Repo,project-50-old\n"
+            "Old-Repo/docs,learning/d\n",
+            encoding="utf-8",
+        )
+        index = load_url_map(path)
+        assert len(index) == 1
+        assert index.route("Old-Repo", "docs") == "learning/d"
+
+    def test_csv_subpath_case_is_kept(self, tmp_path: Path) -> None:
+        path = tmp_path / "map.csv"
+        path.write_text(
+            "Old-Repo,project-50-old\nOld-Repo/Docs,learning/upper\nold-repo/docs,learning/lower\n",
+            encoding="utf-8",
+        )
+        index = load_url_map(path)
+        assert index.route("Old-Repo", "Docs/a.md") == "learning/upper/a.md"
+        assert index.route("Old-Repo", "docs/a.md") == "learning/lower/a.md"
+
+    @pytest.mark.parametrize(
+        ("name", "content", "message"),
+        [
+            ("map.json", "[1, 2]", "expected an object"),
+            ("map.json", "{", "invalid JSON"),
+            ("map.csv", "Old-Repo,a,b\n", "map.csv:1: expected 2 columns"),
+            ("map.csv", "Old-Repo,a\nold-repo,b\n", "map.csv:2: conflicting"),
+            ("map.csv", "Old-Repo,\n", "empty source or destination"),
+        ],
+    )
+    def test_malformed(self, tmp_path: Path, name: str, content: str, message: str) -> None:
+        path = tmp_path / name
+        path.write_text(content, encoding="utf-8")
+        with pytest.raises(ValueError, match=message):
+            load_url_map(path)
+
+    def test_use_url_map(self, restore_url_map: None) -> None:
+        builtin_matcher = url_matcher()
+        use_url_map(UrlIndex([("Old-Repo", "project-50-old")]))
+        assert lookup("old-repo") == "project-50-old"
+        assert not is_mapped("Zomato-Clone")
+        assert route("Old-Repo", "a.md") == "project-50-old/a.md"
+        assert url_matcher() is not builtin_matcher
+        assert url_matcher_for("Old-Repo") is url_matcher()
+
+        use_url_map(None)
+        assert lookup("Zomato-Clone") == "project-13-zomato-clone-devsecops"
+
+
+class TestRelativePathMemo:
+    """compute_relative_path is memoized per (source directory, target)."""
+
+    def test_same_directory_shares_an_entry(self) -> None:
+        _relative_path.cache_clear()
+        assert compute_relative_path("docs/a.md", "learning/x") == "../learning/x"
+        assert compute_relative_path("docs/b.md", "learning/x") == "../learning/x"
+        info = _relative_path.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
@@ -6,7 +6,9 @@ from pathlib import Path
 
 import pytest
 
+from tools.repo_consolidation.manifest import RepoManifest
 from tools.repo_consolidation.models import ValidationReport
+from tools.repo_consolidation.scanner import scan_repo
 from tools.repo_consolidation.validator import count_files_by_extension, validate_fixes
 
 
@@ -180,3 +182,124 @@ class TestValidateFixes:
         assert isinstance(report, ValidationReport)
         assert isinstance(report.total_files_scanned, dict)
         assert isinstance(report.remaining_issues, list)
+
+
+# ---------------------------------------------------------------------------
+# Incremental validation
+# ---------------------------------------------------------------------------
+
+
+class TestIncrementalValidation:
+    """validate_fixes re-scans only the files the applier touched."""
+
+    OLD_URL = "https://github.com/DevCloudNinjas/Zomato-Clone\n"
+
+    def _scan(self, root: Path) -> tuple[list, RepoManifest]:
+        manifest = RepoManifest.build(root, backend="walk")
+        return scan_repo(root, manifest=manifest), manifest
+
+    def test_untouched_findings_carried_forward(self, tmp_path: Path) -> None:
+        (tmp_path / "a.md").write_text(self.OLD_URL)
+        (tmp_path / "b.md").write_text(self.OLD_URL)
+        findings, manifest = self._scan(tmp_path)
+        (tmp_path / "a.md").write_text("fixed\n")
+        # An untouched file is not re-read, even if it changed on disk.
+        (tmp_path / "b.md").write_text("edited by hand\n")
+
+        report = validate_fixes(
+            tmp_path,
+            initial_findings=findings,
+            touched=["a.md"],
+            manifest=manifest,
+        )
+
+        assert [f.file_path for f in report.remaining_issues] == ["b.md"]
+        assert report.total_files_scanned == {".md": 2}
+
+    def test_touched_file_rescanned(self, tmp_path: Path) -> None:
+        (tmp_path / "a.md").write_text("clean\n")
+        findings, manifest = self._scan(tmp_path)
+        (tmp_path / "a.md").write_text(self.OLD_URL)
+
+        report = validate_fixes(
+            tmp_path, initial_findings=findings, touched=["a.md"],
+        )
+
+        assert [f.file_path for f in report.remaining_issues] == ["a.md"]
+
+    def test_deleted_file_dropped_from_counts(self, tmp_path: Path) -> None:
+        (tmp_path / "a.md").write_text(self.OLD_URL)
+        (tmp_path / "run.sh").write_text("ghp_" + "a" * 36 + "\n")
+        findings, manifest = self._scan(tmp_path)
+        (tmp_path / "run.sh").unlink()
+        manifest.refresh(["run.sh"])
+
+        report = validate_fixes(
+            tmp_path,
+            initial_findings=findings,
+            touched=["run.sh"],
+            manifest=manifest,
+        )
+
+        assert report.total_files_scanned == {".md": 1}
+        assert [f.file_path for f in report.remaining_issues] == ["a.md"]
+
+    def test_matches_full_validation(self, tmp_path: Path) -> None:
+        for name in ("a.md", "b.md", "c.md"):
+            (tmp_path / name).write_text(self.OLD_URL)
+        findings, manifest = self._scan(tmp_path)
+        (tmp_path / "b.md").write_text("fixed\n")
+
+        incremental = validate_fixes(
+            tmp_path,
+            backend="walk",
+            initial_findings=findings,
+            touched=["b.md"],
+            manifest=manifest,
+        )
+        full = validate_fixes(tmp_path, backend="walk")
+
+        assert incremental == full
+
+
+class TestLinkValidation:
+    """validate_fixes checks relative links without failing on them."""
+
+    def test_counts_broken_and_resolved_links(self, tmp_path: Path) -> None:
+        (tmp_path / "setup.md").write_text("# Setup\n")
+        (tmp_path / "README.md").write_text("[ok](setup.md)\n[bad](gone.md)\n")
+
+        report = validate_fixes(tmp_path)
+
+        assert report.total_links_validated == 1
+        assert report.total_broken_relative_paths == 1
+        assert report.broken_links[0].target == "gone.md"
+        assert report.remaining_issues == []
+
+    def test_links_disabled(self, tmp_path: Path) -> None:
+        (tmp_path / "README.md").write_text("[bad](gone.md)\n")
+
+        report = validate_fixes(tmp_path, links=False)
+
+        assert report.total_broken_relative_paths == 0
+
+
+class TestManifestCounts:
+    """count_files_by_extension reads counts from a manifest when given one."""
+
+    def test_matches_discovery(self, tmp_path: Path) -> None:
+        (tmp_path / "a.md").write_text("# A")
+        (tmp_path / "Dockerfile").write_text("FROM alpine")
+        (tmp_path / "logo.png").write_bytes(b"\x89PNG\x00\x00")
+        manifest = RepoManifest.build(tmp_path)
+
+        assert count_files_by_extension(tmp_path, manifest=manifest) == (
+            count_files_by_extension(tmp_path)
+        )
+
+    def test_does_not_rediscover(self, tmp_path: Path) -> None:
+        (tmp_path / "a.md").write_text("# A")
+        manifest = RepoManifest.build(tmp_path)
+        (tmp_path / "b.md").write_text("# B")
+
+        assert count_files_by_extension(tmp_path, manifest=manifest) == {".md": 1}
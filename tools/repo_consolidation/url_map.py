@@ -1,14 +1,29 @@
-"""Static URL mapping registry for old standalone repos → consolidated paths.
+"""URL mapping registry for old standalone repos → consolidated paths.
 
 Maps every old DevCloudNinjas org repo name to its new location inside
 the consolidated ``DevOps-Projects`` repository.  Provides a
 case-insensitive lookup function for use by the fixer pipeline.
 
+The built-in :data:`URL_MAP` can be replaced by a map loaded from a JSON
+or CSV file with :func:`load_url_map` and :func:`use_url_map`.  Besides
+whole repos, such a map can route subdirectories of a repo that moved
+somewhere else of their own (``Repo/docs`` → ``learning/repo-docs``);
+:func:`route` resolves a repo subpath through the longest matching
+prefix.
+
 Requirements: 2.1, 3.1, 9.2
 """
 
 from __future__ import annotations
 
+import csv
+import json
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from typing import NamedTuple
+
 # ---------------------------------------------------------------------------
 # Static mapping: old repo name  →  consolidated path (relative to repo root)
 # ---------------------------------------------------------------------------
@@ -133,10 +148,147 @@ URL_MAP: dict[str, str] = {
 
 
 # ---------------------------------------------------------------------------
-# Pre-built case-insensitive index (built once at import time)
+# Compiled index (built on first use)
 # ---------------------------------------------------------------------------
 
-_LOWER_MAP: dict[str, str] = {k.lower(): v for k, v in URL_MAP.items()}
+
+class UrlIndex:
+    """A compiled URL map: case-insensitive repo lookup plus subpath routes.
+
+    Built from ``(source, destination)`` pairs.  A source is either a
+    repo name (``Zomato-Clone``) or a repo name followed by a subpath
+    (``Zomato-Clone/docs/setup``); the repo part is matched
+    case-insensitively, the subpath exactly, as paths are.  Every repo
+    with subpath routes must also be mapped as a whole.
+
+    Raises:
+        ValueError: If a source or destination is empty, or a repo has
+            subpath routes but no whole-repo entry.
+    """
+
+    def __init__(self, entries: Iterable[tuple[str, str]]) -> None:
+        self._repos: dict[str, str] = {}
+        self._names: dict[str, str] = {}
+        self._routes: dict[str, dict[tuple[str, ...], str]] = {}
+        self._depth: dict[str, int] = {}
+        for source, destination in entries:
+            repo, _, subpath = source.strip().strip("/").partition("/")
+            destination = destination.strip().strip("/")
+            if not repo or not destination:
+                raise ValueError(f"empty source or destination in {source!r} → {destination!r}")
+            key = repo.lower()
+            parts = PurePosixPath(subpath).parts if subpath else ()
+            if not parts:
+                self._repos[key] = destination
+                self._names.setdefault(key, repo)
+                continue
+            self._routes.setdefault(key, {})[parts] = destination
+            self._depth[key] = max(self._depth.get(key, 0), len(parts))
+        unrouted = sorted(key for key in self._routes if key not in self._repos)
+        if unrouted:
+            raise ValueError(f"subpath routes for unmapped repo(s): {', '.join(unrouted)}")
+
+    def __len__(self) -> int:
+        return len(self._repos)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Every mapped repo name, as first written in the map."""
+        return tuple(self._names.values())
+
+    def lookup(self, repo_name: str) -> str | None:
+        """Return the consolidated path of the whole repo, or ``None``."""
+        return self._repos.get(repo_name.lower())
+
+    def route(self, repo_name: str, subpath: str = "") -> str | None:
+        """Return the consolidated path of *subpath* inside *repo_name*, or ``None``.
+
+        The longest subpath route that is a whole-segment prefix of
+        *subpath* wins and the rest of *subpath* is appended to its
+        destination; without one, *subpath* is appended to the repo's
+        own destination.
+        """
+        key = repo_name.lower()
+        base = self._repos.get(key)
+        if base is None:
+            return None
+        if not subpath:
+            return base
+        routes = self._routes.get(key)
+        if routes:
+            parts = PurePosixPath(subpath).parts
+            for cut in range(min(len(parts), self._depth[key]), 0, -1):
+                destination = routes.get(parts[:cut])
+                if destination is not None:
+                    return "/".join((destination, *parts[cut:]))
+        return f"{base}/{subpath}"
+
+
+def load_url_map(path: str | Path) -> UrlIndex:
+    """Load a URL map from a JSON or CSV file.
+
+    A ``.json`` file holds one object mapping source to destination::
+
+        {"Zomato-Clone": "project-13-zomato-clone-devsecops",
+         "Zomato-Clone/docs": "learning/zomato-docs"}
+
+    Any other file is read as CSV with two columns, source and
+    destination; an optional ``source,destination`` header row, blank
+    rows and rows starting with ``#`` are skipped.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is malformed (see also :class:`UrlIndex`).
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        with open(path, encoding="utf-8") as fh:
+            try:
+                data = json.load(fh)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{path}: invalid JSON: {exc}") from exc
+        if not isinstance(data, dict) or not all(
+            isinstance(k, str) and isinstance(v, str) for k, v in data.items()
+        ):
+            raise ValueError(f"{path}: expected an object mapping source to destination")
+        return UrlIndex(data.items())
+
+    # Keyed the way UrlIndex keys sources: repo case-insensitively, subpath as written.
+    entries: dict[tuple[str, tuple[str, ...]], tuple[str, str]] = {}
+    with open(path, encoding="utf-8", newline="") as fh:
+        for line_no, row in enumerate(csv.reader(fh), start=1):
+            if not row or not "".join(row).strip() or row[0].lstrip().startswith("#"):
+                continue
+            if line_no == 1 and [c.strip().lower() for c in row] == ["source", "destination"]:
+                continue
+            if len(row) != 2:
+                raise ValueError(f"{path}:{line_no}: expected 2 columns, got {len(row)}")
+            source, destination = row
+            repo, _, subpath = source.strip().strip("/").partition("/")
+            key = (repo.lower(), PurePosixPath(subpath).parts if subpath else ())
+            previous = entries.get(key)
+            if previous is not None and previous[1].strip() != destination.strip():
+                raise ValueError(f"{path}:{line_no}: conflicting destinations for {source!r}")
+            entries[key] = (source, destination)
+    return UrlIndex(entries.values())
+
+
+_index: UrlIndex | None = None
+
+
+def url_index() -> UrlIndex:
+    """Return the active index, compiling :data:`URL_MAP` on first use."""
+    global _index
+    if _index is None:
+        _index = UrlIndex(URL_MAP.items())
+    return _index
+
+
+def use_url_map(index: UrlIndex | None) -> None:
+    """Make *index* the active URL map; ``None`` restores :data:`URL_MAP`."""
+    global _index
+    _index = index
+    url_matcher.cache_clear()
 
 
 def lookup(repo_name: str) -> str | None:
@@ -146,12 +298,126 @@ def lookup(repo_name: str) -> str | None:
     ``lookup("zomato-clone")`` and ``lookup("Zomato-Clone")`` both
     return ``"project-13-zomato-clone-devsecops"``.
     """
-    return _LOWER_MAP.get(repo_name.lower())
+    return url_index().lookup(repo_name)
 
 
 def is_mapped(repo_name: str) -> bool:
     """Return ``True`` if *repo_name* has a known mapping."""
-    return repo_name.lower() in _LOWER_MAP
+    return url_index().lookup(repo_name) is not None
+
+
+def route(repo_name: str, subpath: str = "") -> str | None:
+    """Return the consolidated path of *subpath* in *repo_name*; see :meth:`UrlIndex.route`."""
+    return url_index().route(repo_name, subpath)
+
+
+# ---------------------------------------------------------------------------
+# Shared URL matcher
+# ---------------------------------------------------------------------------
+
+
+class UrlMatch(NamedTuple):
+    """One old-org GitHub URL found by :class:`UrlMatcher`.
+
+    Attributes:
+        start: Offset of the URL in the line (including any scheme).
+        host_start: Offset of ``github.com`` (equal to *start* for bare URLs).
+        repo_end: Offset just past the repo name.
+        end: Offset just past the URL.
+        repo: Repo name as written in the line.
+        url: ``line[start:end]``.
+        rest: ``line[repo_end:end]`` — ``/blob/main/...``, ``.git``, etc.
+    """
+
+    start: int
+    host_start: int
+    repo_end: int
+    end: int
+    repo: str
+    url: str
+    rest: str
+
+    @property
+    def has_scheme(self) -> bool:
+        """``True`` for ``http(s)://`` URLs."""
+        return self.start != self.host_start
+
+    @property
+    def subpath(self) -> str:
+        """Path after the repo name, without the leading slash."""
+        return self.rest.lstrip("/")
+
+
+class UrlMatcher:
+    """Finds old-org URLs for a fixed set of repo names in one regex pass.
+
+    The names are compiled into a single case-insensitive alternation,
+    longest first, that must end at a name boundary (so ``csgo`` does not
+    match inside ``csgo-tools``).  Each match carries the repo name, the
+    URL span and the trailing subpath, so callers never need to build a
+    per-repo pattern.  Use :func:`url_matcher` to get a cached instance.
+    """
+
+    def __init__(self, names: tuple[str, ...]) -> None:
+        self.names = names
+        alternation = "|".join(
+            re.escape(name) for name in sorted(names, key=len, reverse=True)
+        )
+        self.pattern = re.compile(
+            r"(?P<scheme>https?://)?github\.com/(?:DevCloudNinjas|devcloudninjas)/"
+            r"(?P<repo>" + alternation + r")(?![\w-])"
+            r"(?P<rest>[^\s\)\"'>\]]*)",
+            re.IGNORECASE,
+        )
+
+    @staticmethod
+    def _to_match(m: re.Match[str]) -> UrlMatch:
+        return UrlMatch(
+            start=m.start(),
+            host_start=m.end("scheme") if m.group("scheme") else m.start(),
+            repo_end=m.end("repo"),
+            end=m.end(),
+            repo=m.group("repo"),
+            url=m.group(0),
+            rest=m.group("rest"),
+        )
+
+    def finditer(self, line: str, repo_name: str | None = None) -> list[UrlMatch]:
+        """Return every URL in *line*, optionally only those for *repo_name*.
+
+        *repo_name* is compared case-insensitively.
+        """
+        matches = [self._to_match(m) for m in self.pattern.finditer(line)]
+        if repo_name is None:
+            return matches
+        wanted = repo_name.lower()
+        return [m for m in matches if m.repo.lower() == wanted]
+
+    def match(self, url: str) -> UrlMatch | None:
+        """Match a URL that starts at the beginning of *url*."""
+        m = self.pattern.match(url)
+        return self._to_match(m) if m else None
+
+
+@lru_cache(maxsize=256)
+def url_matcher(names: tuple[str, ...] | None = None) -> UrlMatcher:
+    """Return the cached :class:`UrlMatcher` for *names*.
+
+    With no argument the matcher covers every repo in the active map and
+    is compiled once per map; explicit *names* (e.g. a repo missing from
+    the map) get their own cached matcher.
+    """
+    return UrlMatcher(url_index().names if names is None else names)
+
+
+def url_matcher_for(repo_name: str) -> UrlMatcher:
+    """Return a cached matcher that recognises *repo_name*.
+
+    This is the shared matcher of the active map for mapped names.
+    """
+    if is_mapped(repo_name):
+        return url_matcher()
+    return url_matcher((repo_name,))
 
 
 # ---------------------------------------------------------------------------
@@ -181,9 +447,17 @@ def compute_relative_path(from_file: str, to_path: str) -> str:
         >>> compute_relative_path("learning/k8s/README.md", "learning/k8s/docs/setup.md")
         'docs/setup.md'
     """
-    from pathlib import PurePosixPath
+    return _relative_path(str(PurePosixPath(from_file).parent), to_path)
 
-    src_dir = PurePosixPath(from_file).parent
+
+@lru_cache(maxsize=65536)
+def _relative_path(from_dir: str, to_path: str) -> str:
+    """:func:`compute_relative_path` from a directory, memoized per pair.
+
+    Files in one directory link to the same few targets over and over,
+    so most calls are cache hits.
+    """
+    src_dir = PurePosixPath(from_dir)
     target = PurePosixPath(to_path)
 
     # Compute the relative path between the two POSIX paths.
@@ -223,7 +497,8 @@ def resolve_new_path(old_repo_name: str, old_url: str, source_file: str) -> str
       *source_file* name and URL shape)
       → return ``CONSOLIDATED_TREE_URL/{consolidated_path}``.
     * **In-repo reference** (default) — compute a relative path from
-      *source_file* to the consolidated path.
+      *source_file* to the consolidated path, memoized per source
+      directory and target by :func:`compute_relative_path`.
 
     Requirements: 2.1, 2.4, 3.1, 3.5
     """
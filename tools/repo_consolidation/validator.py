@@ -3,22 +3,33 @@
 Re-scans the repository after fixes are applied to verify that no
 old URLs, credentials, or hardcoded account IDs remain, and that all
 relative paths introduced by fixes resolve to existing files or
-directories.
+directories.  Given the initial scan's findings and the files the
+applier touched, only those files are re-scanned.
 """
 
 from __future__ import annotations
 
 import logging
 import os
+from collections.abc import Iterable
 from pathlib import Path
 
+from tools.repo_consolidation.cache import ScanCache
+from tools.repo_consolidation.links import LinkCheckResult, check_links
+from tools.repo_consolidation.manifest import RepoManifest
 from tools.repo_consolidation.models import Finding, ValidationReport
 from tools.repo_consolidation.scanner import SCAN_PATTERNS, discover_files, scan_repo
 
 logger = logging.getLogger(__name__)
 
 
-def count_files_by_extension(repo_root: str | Path) -> dict[str, int]:
+def count_files_by_extension(
+    repo_root: str | Path,
+    *,
+    backend: str = "auto",
+    changed_since: str | None = None,
+    manifest: RepoManifest | None = None,
+) -> dict[str, int]:
     """Count text files under *repo_root* grouped by file extension.
 
     Special filenames (``Jenkinsfile``, ``Dockerfile``, etc.) are keyed
@@ -26,10 +37,15 @@ def count_files_by_extension(repo_root: str | Path) -> dict[str, int]:
     extension including the leading dot (e.g. ``.md``).  Files with no
     extension are keyed by their full name.
 
+    *backend* and *changed_since* are forwarded to :func:`discover_files`.
+    With a *manifest* the counts come from it and nothing is discovered.
+
     Returns a dict mapping extension/name → count.
     """
+    if manifest is not None:
+        return manifest.counts_by_type()
     counts: dict[str, int] = {}
-    for fpath in discover_files(repo_root):
+    for fpath in discover_files(repo_root, backend=backend, changed_since=changed_since):
         name = fpath.name
         if name in {"Jenkinsfile", "Dockerfile", "Makefile", "Vagrantfile"}:
             key = name
@@ -40,19 +56,89 @@ def count_files_by_extension(repo_root: str | Path) -> dict[str, int]:
     return counts
 
 
-def validate_fixes(repo_root: str | Path) -> ValidationReport:
+def _merge_rescan(
+    initial_findings: list[Finding],
+    touched: list[str],
+    rescanned: list[Finding],
+) -> list[Finding]:
+    """Replace the findings of *touched* files with their re-scanned ones.
+
+    Findings keep the initial scan's file order; a touched file's new
+    findings take the place of its old ones, and touched files that had
+    none are appended in *touched* order.
+    """
+    by_file: dict[str, list[Finding]] = {path: [] for path in touched}
+    for finding in rescanned:
+        by_file.setdefault(finding.file_path, []).append(finding)
+
+    merged: list[Finding] = []
+    placed: set[str] = set()
+    for finding in initial_findings:
+        path = finding.file_path
+        if path not in by_file:
+            merged.append(finding)
+        elif path not in placed:
+            placed.add(path)
+            merged.extend(by_file[path])
+    for path, findings in by_file.items():
+        if path not in placed:
+            merged.extend(findings)
+    return merged
+
+
+def validate_fixes(
+    repo_root: str | Path,
+    *,
+    jobs: int = 1,
+    cache: ScanCache | None = None,
+    backend: str = "auto",
+    changed_since: str | None = None,
+    initial_findings: list[Finding] | None = None,
+    touched: Iterable[str] | None = None,
+    manifest: RepoManifest | None = None,
+    links: bool = True,
+) -> ValidationReport:
     """Re-scan the repo and build a :class:`ValidationReport`.
 
     Steps:
     1. Discover all text files and count them by extension.
     2. Run :func:`scan_repo` with the default :data:`SCAN_PATTERNS` to
        detect any remaining issues.
-    3. Populate the report with remaining issues grouped by type.
+    3. Check every relative link in markdown and HTML files (see
+       :func:`~tools.repo_consolidation.links.check_links`).
+    4. Populate the report with remaining issues and broken links.
+
+    When *initial_findings* and *touched* are both given the re-scan is
+    incremental: only the *touched* files are scanned again and every
+    other file keeps its findings from *initial_findings*.
 
     Parameters
     ----------
     repo_root:
         Path to the repository root directory.
+    jobs:
+        Worker processes for the re-scan (see :func:`scan_repo`).
+    cache:
+        Optional scan cache shared with the initial scan.  Files the
+        applier did not touch keep their size/mtime and are answered
+        from the cache instead of being re-scanned.
+    backend, changed_since:
+        Discovery options (see :func:`discover_files`); pass the same
+        values as the initial scan so both cover the same file set.
+    initial_findings:
+        Findings of the scan that preceded the fixes.
+    touched:
+        Repo-relative paths the applier modified or deleted.
+    manifest:
+        The run's :class:`~tools.repo_consolidation.manifest.RepoManifest`,
+        already refreshed for the files the applier touched (as
+        :func:`~tools.repo_consolidation.applier.apply_file_edits` does).
+        File counts, the files to re-scan and the link index then come
+        from it instead of another discovery walk.  Without one, a
+        manifest is built once here and shared by the steps above.
+    links:
+        Run the relative link check.  Broken links are reported but do
+        not count as remaining issues.
 
     Returns
     -------
@@ -60,17 +146,54 @@ def validate_fixes(repo_root: str | Path) -> ValidationReport:
         A report summarising the validation results.
     """
     root = Path(repo_root).resolve()
+    incremental = initial_findings is not None and touched is not None
+    if incremental:
+        touched = list(dict.fromkeys(touched))
+
+    if manifest is None:
+        manifest = RepoManifest.build(root, backend=backend, changed_since=changed_since)
 
     # 1. Count files by extension
-    total_files_scanned = count_files_by_extension(root)
+    total_files_scanned = count_files_by_extension(
+        root, backend=backend, changed_since=changed_since, manifest=manifest,
+    )
 
     # 2. Re-scan for remaining issues
-    remaining = scan_repo(root, SCAN_PATTERNS)
+    if incremental:
+        rescanned = scan_repo(
+            root, SCAN_PATTERNS, jobs=jobs, cache=cache, paths=touched,
+            manifest=manifest,
+        )
+        remaining = _merge_rescan(initial_findings, touched, rescanned)
+        logger.info(
+            "Re-scanned %d touched file(s); carried forward the rest.",
+            len(touched),
+        )
+    else:
+        remaining = scan_repo(
+            root,
+            SCAN_PATTERNS,
+            jobs=jobs,
+            cache=cache,
+            backend=backend,
+            changed_since=changed_since,
+            manifest=manifest,
+        )
+
+    # 3. Check relative links
+    link_check = LinkCheckResult()
+    if links:
+        link_check = check_links(
+            root, jobs=jobs, manifest=manifest, backend=backend, changed_since=changed_since,
+        )
 
-    # 3. Build the report
+    # 4. Build the report
     report = ValidationReport(
         total_files_scanned=total_files_scanned,
+        total_links_validated=link_check.links_resolved,
+        total_broken_relative_paths=len(link_check.broken),
         remaining_issues=remaining,
+        broken_links=link_check.broken,
     )
 
     if remaining:
@@ -0,0 +1,464 @@
+"""Watch mode: keep a repository's findings current as files change.
+
+A :class:`WatchState` scans the repository once, then keeps its
+:class:`~tools.repo_consolidation.manifest.RepoManifest` and the
+findings of every file in memory.  When files change, only those files
+are re-stat'ed and re-scanned, so an update costs milliseconds instead
+of a full discovery and scan.
+
+Changes are detected by a watcher: :class:`InotifyWatcher` on Linux,
+:class:`PollingWatcher` (comparing modification times and sizes)
+anywhere else or when inotify is unavailable.  :func:`open_watcher`
+picks one.  Typical use::
+
+    state = WatchState(repo_root)
+    state.load()
+    watcher = open_watcher(repo_root)
+    while True:
+        changed = watcher.wait(1.0)
+        for rel_path, findings in state.update(changed).items():
+            ...
+
+A :class:`FindingsServer` answers queries for the current findings on a
+local Unix socket, so editors can ask without scanning themselves.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import json
+import logging
+import os
+import select
+import socketserver
+import struct
+import sys
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from tools.repo_consolidation.manifest import RepoManifest
+from tools.repo_consolidation.models import Finding
+from tools.repo_consolidation.scanner import SKIP_DIRS, scan_repo
+
+logger = logging.getLogger(__name__)
+
+#: Change detection backends accepted by :func:`open_watcher`.
+WATCH_BACKENDS = ("auto", "inotify", "poll")
+
+#: Default seconds between two polls of :class:`PollingWatcher`.
+DEFAULT_POLL_INTERVAL = 1.0
+
+# Quiet period that ends a burst of inotify events (an editor's save is
+# often several events: write, rename, chmod).
+_SETTLE_SECONDS = 0.02
+
+# From <sys/inotify.h>.
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF
+)
+_EVENT = struct.Struct("iIII")
+
+
+def _rel(root: Path, path: Path | str) -> str:
+    rel = Path(path).relative_to(root).as_posix()
+    return "" if rel == "." else rel
+
+
+def _skipped(rel_path: str) -> bool:
+    return any(part in SKIP_DIRS for part in rel_path.split("/"))
+
+
+class WatchState:
+    """The manifest and per-file findings of *repo_root*, kept in memory.
+
+    Every method is thread-safe, so a :class:`FindingsServer` can read
+    the state while the watch loop updates it.
+
+    Attributes:
+        root: Resolved repository root.
+        manifest: Every discovered file, refreshed as files change.
+        findings: Relative path → findings, for files with findings only.
+    """
+
+    def __init__(self, repo_root: str | Path, *, backend: str = "auto") -> None:
+        self.root = Path(repo_root).resolve()
+        self.manifest = RepoManifest(self.root)
+        self.findings: dict[str, list[Finding]] = {}
+        self._backend = backend
+        self._lock = threading.Lock()
+
+    def load(self) -> list[Finding]:
+        """Discover and scan the whole repository, replacing the current state.
+
+        Returns:
+            Every finding, in discovery order.
+
+        Raises:
+            ValueError: As :func:`~tools.repo_consolidation.scanner.discover_files`.
+        """
+        manifest = RepoManifest.build(self.root, backend=self._backend)
+        findings = scan_repo(self.root, manifest=manifest)
+        by_file: dict[str, list[Finding]] = {}
+        for finding in findings:
+            by_file.setdefault(finding.file_path, []).append(finding)
+        with self._lock:
+            self.manifest = manifest
+            self.findings = by_file
+        return findings
+
+    def update(self, rel_paths: Iterable[str] | None) -> dict[str, list[Finding]]:
+        """Re-scan the files among *rel_paths* and return the ones whose findings changed.
+
+        *rel_paths* may name files or directories, existing or removed,
+        as a watcher reports them; a directory stands for every file
+        under it.  ``None`` means events were lost: every known file is
+        re-checked and the tree is walked again for new ones.  New files
+        are picked up whichever discovery backend loaded the state, even
+        when git ignores them.
+
+        Returns:
+            Relative path → its new findings (empty once a file is
+            clean or removed), in path order.
+        """
+        with self._lock:
+            paths = self._expand(rel_paths)
+            if not paths:
+                return {}
+            self.manifest.refresh(paths)
+            rescanned: dict[str, list[Finding]] = {path: [] for path in paths}
+            for finding in scan_repo(self.root, paths=paths, manifest=self.manifest, dedup=False):
+                rescanned[finding.file_path].append(finding)
+            changed: dict[str, list[Finding]] = {}
+            for rel_path, file_findings in rescanned.items():
+                if file_findings == self.findings.get(rel_path, []):
+                    continue
+                changed[rel_path] = file_findings
+                if file_findings:
+                    self.findings[rel_path] = file_findings
+                else:
+                    del self.findings[rel_path]
+            return changed
+
+    def _expand(self, rel_paths: Iterable[str] | None) -> list[str]:
+        """Turn watcher output into the sorted file paths to refresh."""
+        known = [entry.rel_path for entry in self.manifest.entries()]
+        if rel_paths is None:
+            targets = set(known) | self._walk("")
+            return sorted(targets)
+        targets = set()
+        for rel_path in rel_paths:
+            if not rel_path or _skipped(rel_path):
+                continue
+            if (self.root / rel_path).is_dir():
+                targets |= self._walk(rel_path)
+            else:
+                targets.add(rel_path)
+            prefix = rel_path + "/"
+            targets.update(path for path in known if path.startswith(prefix))
+        return sorted(targets)
+
+    def _walk(self, rel_dir: str) -> set[str]:
+        """Return every file under *rel_dir*, pruning :data:`SKIP_DIRS`."""
+        found: set[str] = set()
+        for dirpath, dirnames, filenames in os.walk(self.root / rel_dir):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            found.update(_rel(self.root, Path(dirpath, name)) for name in filenames)
+        return found
+
+    def snapshot(self, rel_path: str | None = None) -> list[Finding]:
+        """Return the current findings of *rel_path*, or of every file in path order."""
+        with self._lock:
+            if rel_path is not None:
+                return list(self.findings.get(rel_path, []))
+            return [f for path in sorted(self.findings) for f in self.findings[path]]
+
+
+class PollingWatcher:
+    """Detect changes by comparing modification times and sizes between polls.
+
+    Works everywhere, at the cost of one ``stat`` per file per poll.
+    """
+
+    def __init__(self, repo_root: str | Path, interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        self.root = Path(repo_root).resolve()
+        self.interval = interval
+        self._stats = self._snapshot()
+        self._next = time.monotonic() + interval
+
+    def _snapshot(self) -> dict[str, tuple[int, int]]:
+        stats: dict[str, tuple[int, int]] = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                stats[_rel(self.root, path)] = (st.st_mtime_ns, st.st_size)
+        return stats
+
+    def wait(self, timeout: float | None = None) -> set[str] | None:
+        """Return the paths that changed since the last call.
+
+        Blocks until the next poll is due, or at most *timeout* seconds
+        (returning an empty set if no poll was due by then).
+        """
+        delay = max(0.0, self._next - time.monotonic())
+        if timeout is not None and delay > timeout:
+            time.sleep(timeout)
+            return set()
+        time.sleep(delay)
+        self._next = time.monotonic() + self.interval
+        previous, self._stats = self._stats, self._snapshot()
+        changed = {path for path, stat in self._stats.items() if previous.get(path) != stat}
+        changed.update(path for path in previous if path not in self._stats)
+        return changed
+
+    def close(self) -> None:
+        """Release resources (none for polling)."""
+
+
+def _libc() -> ctypes.CDLL | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    return libc if hasattr(libc, "inotify_init1") else None
+
+
+def inotify_available() -> bool:
+    """Return ``True`` if :class:`InotifyWatcher` can run on this system."""
+    return _libc() is not None
+
+
+class InotifyWatcher:
+    """Detect changes from Linux inotify events, without polling the tree.
+
+    One watch is added per directory (skipping :data:`SKIP_DIRS`), and
+    for every directory created later.
+
+    Raises:
+        OSError: If inotify is unavailable or a watch cannot be added
+            (e.g. the per-user watch limit is exhausted).
+    """
+
+    def __init__(self, repo_root: str | Path) -> None:
+        self.root = Path(repo_root).resolve()
+        libc = _libc()
+        if libc is None:
+            raise OSError("inotify is not available on this system")
+        self._libc = libc
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            self._raise("inotify_init1")
+        self._dirs: dict[int, str] = {}
+        self._wds: dict[str, int] = {}
+        try:
+            self._add_tree("")
+        except OSError:
+            self.close()
+            raise
+
+    def _raise(self, call: str, path: str = "") -> None:
+        errno = ctypes.get_errno()
+        raise OSError(errno, f"{call} failed: {os.strerror(errno)}", path or None)
+
+    def _add_tree(self, rel_dir: str) -> None:
+        for dirpath, dirnames, _ in os.walk(self.root / rel_dir):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            self._add(_rel(self.root, dirpath))
+
+    def _add(self, rel_dir: str) -> None:
+        path = str(self.root / rel_dir)
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            if ctypes.get_errno() == 2:  # ENOENT: removed again already
+                return
+            self._raise("inotify_add_watch", path)
+        self._dirs[wd] = rel_dir
+        self._wds[rel_dir] = wd
+
+    def _forget(self, rel_dir: str) -> None:
+        prefix = rel_dir + "/"
+        for path in [p for p in self._wds if p == rel_dir or p.startswith(prefix)]:
+            self._dirs.pop(self._wds.pop(path), None)
+
+    def _read(self) -> bytes:
+        chunks = []
+        while True:
+            try:
+                chunk = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def wait(self, timeout: float | None = None) -> set[str] | None:
+        """Block until something changes (at most *timeout* seconds) and return the paths.
+
+        Returns:
+            The changed paths, files or directories, relative to the
+            root; an empty set on timeout; ``None`` if the kernel queue
+            overflowed and events were lost.
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed: set[str] | None = set()
+        while ready:
+            changed = self._parse(self._read(), changed)
+            ready, _, _ = select.select([self._fd], [], [], _SETTLE_SECONDS)
+        return changed
+
+    def _parse(self, data: bytes, changed: set[str] | None) -> set[str] | None:
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            raw = data[offset + _EVENT.size:offset + _EVENT.size + length]
+            offset += _EVENT.size + length
+            if mask & _IN_Q_OVERFLOW:
+                changed = None
+                continue
+            rel_dir = self._dirs.get(wd)
+            if rel_dir is None or mask & _IN_IGNORED:
+                continue
+            name = os.fsdecode(raw.rstrip(b"\0"))
+            if not name:
+                continue  # event on the watched directory itself
+            rel_path = f"{rel_dir}/{name}" if rel_dir else name
+            if _skipped(rel_path):
+                continue
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    self._add_tree(rel_path)
+                elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                    self._forget(rel_path)
+            if changed is not None:
+                changed.add(rel_path)
+        return changed
+
+    def close(self) -> None:
+        """Close the inotify descriptor, removing every watch."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def open_watcher(
+    repo_root: str | Path,
+    backend: str = "auto",
+    interval: float = DEFAULT_POLL_INTERVAL,
+) -> InotifyWatcher | PollingWatcher:
+    """Return a watcher for *repo_root* using *backend* (see :data:`WATCH_BACKENDS`).
+
+    ``auto`` uses inotify where it is available and falls back to
+    polling every *interval* seconds, also when adding the inotify
+    watches fails.
+
+    Raises:
+        ValueError: If *backend* is unknown.
+        OSError: If ``inotify`` was requested and cannot be used.
+    """
+    if backend not in WATCH_BACKENDS:
+        raise ValueError(f"unknown watch backend: {backend!r}")
+    if backend == "poll" or (backend == "auto" and not inotify_available()):
+        return PollingWatcher(repo_root, interval)
+    try:
+        return InotifyWatcher(repo_root)
+    except OSError as exc:
+        if backend == "inotify":
+            raise
+        logger.warning("Cannot watch with inotify (%s); polling instead.", exc)
+        return PollingWatcher(repo_root, interval)
+
+
+class _QueryHandler(socketserver.StreamRequestHandler):
+    """Answer one query: a JSON object, optionally ``{"path": ...}``, on one line."""
+
+    server: FindingsServer
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        try:
+            query = json.loads(line) if line.strip() else {}
+            if not isinstance(query, dict):
+                raise ValueError("query must be a JSON object")
+        except ValueError as exc:
+            self._send({"type": "error", "message": f"bad query: {exc}"})
+            return
+        findings = self.server.state.snapshot(query.get("path"))
+        for finding in findings:
+            self._send({"type": "finding", **finding.to_dict()})
+        self._send({
+            "type": "summary",
+            "findings": len(findings),
+            "files": len({f.file_path for f in findings}),
+        })
+
+    def _send(self, record: dict[str, object]) -> None:
+        self.wfile.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+
+
+class FindingsServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Serve the findings of a :class:`WatchState` on the Unix socket *path*.
+
+    A client sends one line — ``{}`` (or an empty line) for every
+    finding, ``{"path": "docs/README.md"}`` for one file's — and reads
+    JSON Lines until the server closes the connection: one ``finding``
+    record per finding, in the ``--format jsonl`` layout, then a
+    ``summary`` record.  Serve from a thread::
+
+        server = FindingsServer(path, state)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: str | Path, state: WatchState) -> None:
+        self.state = state
+        self.path = str(path)
+        if os.path.exists(self.path):
+            os.unlink(self.path)  # left behind by an earlier run
+        super().__init__(self.path, _QueryHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def format_update(rel_path: str, findings: list[Finding]) -> list[str]:
+    """Return the lines printed when *rel_path*'s findings change."""
+    if not findings:
+        return [f"{rel_path}: clean"]
+    lines = [f"{rel_path}: {len(findings)} finding(s)"]
+    for finding in findings:
+        # Like the SARIF and JUnit reports, never echo a credential.
+        shown = "" if finding.issue_type == "credential" else f" {finding.matched_text}"
+        lines.append(f"  {finding.line_number}: [{finding.issue_type}]{shown}")
+    return lines
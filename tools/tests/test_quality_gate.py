@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from tools.quality_gate import QualityGate, is_intentional_secret_fixture
+from tools.quality_gate import QualityGate, is_intentional_secret_fixture, main
 
 
 def _run(cmd: list[str], cwd: Path) -> None:
@@ -126,3 +126,36 @@ def test_package_lock_sanity_reports_bad_json_and_orphan_locks(git_repo: Path) -
         Path("bad-package-json/package.json"),
         Path("orphan-lock/package-lock.json"),
     }
+
+
+def test_parallel_run_matches_serial_order(git_repo: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    (git_repo / "app.env").write_text(
+        "AWS_SECRET_ACCESS_KEY=abcdefghijklmnopqrstuvwxyz1234567890ABCD\n",
+        encoding="utf-8",
+    )
+    (git_repo / "bad.yaml").write_text("items:\n  - ok\n  - : bad\n", encoding="utf-8")
+    (git_repo / "bad.sh").write_text("#!/usr/bin/env bash\nif true; then\n", encoding="utf-8")
+    (git_repo / "bad.py").write_text("def nope(:\n", encoding="utf-8")
+    (git_repo / "orphan-lock").mkdir()
+    (git_repo / "orphan-lock" / "package-lock.json").write_text(
+        json.dumps({"lockfileVersion": 3}),
+        encoding="utf-8",
+    )
+    _commit_all(git_repo)
+
+    serial = QualityGate(git_repo).run()
+    parallel = QualityGate(git_repo, jobs=3).run()
+
+    assert parallel == serial
+    assert [finding.check for finding in serial] == [
+        "secret-pattern",
+        "yaml-syntax",
+        "shell-syntax",
+        "python-syntax",
+        "node-package-lock",
+    ]
+
+    assert main([str(git_repo)]) == 1
+    serial_report = capsys.readouterr().out
+    assert main([str(git_repo), "--jobs", "0"]) == 1
+    assert capsys.readouterr().out == serial_report